@@ -8,9 +8,16 @@ from config.constants import (
     AWS_CLOUDFRONT_URL,
     FFMPEG_PRESET, FFMPEG_CRF, FFMPEG_AUDIO_BITRATE,
     FFMPEG_VIDEO_CODEC, FFMPEG_AUDIO_CODEC,
+    FFMPEG_SMART_CUT, FFMPEG_SMART_CUT_MIN_COPY,
+    AUDIO_ANALYSIS_MODE, AUDIO_ANALYSIS_SAMPLE_RATE, AUDIO_ANALYSIS_FRAME,
+    SCENE_DETECTION_SCALE_WIDTH, SCENE_DETECTION_KEYFRAMES_ONLY,
+    SCENE_DETECTION_HWACCEL, SCENE_DETECTION_STALL_TIMEOUT,
+    SCENE_DETECTION_WORKERS, SCENE_DETECTION_SHARD_MIN_DURATION,
+    SCENE_DETECTION_SHARD_OVERLAP,
     DEFAULT_NUM_CLIPS, DEFAULT_MIN_CLIP_DURATION, DEFAULT_MAX_CLIP_DURATION,
     DEFAULT_SEGMENT_MIN_DURATION, DEFAULT_SEGMENT_MAX_DURATION,
     DEFAULT_COMPILED_MAX_DURATION, DEFAULT_GENERATE_COMPILED,
+    CLIP_SELECTION_MODE, CLIP_LENGTH_STEP, CLIP_START_STEP,
     TEMP_DIR, OUTPUT_DIR,
 )
 
@@ -33,6 +40,23 @@ class FFmpegConfig:
     audio_bitrate: str = FFMPEG_AUDIO_BITRATE
     video_codec: str = FFMPEG_VIDEO_CODEC
     audio_codec: str = FFMPEG_AUDIO_CODEC
+    smart_cut: bool = FFMPEG_SMART_CUT
+    smart_cut_min_copy: float = FFMPEG_SMART_CUT_MIN_COPY
+
+
+@dataclass
+class AnalysisConfig:
+    """Video/audio analysis configuration."""
+    audio_mode: str = AUDIO_ANALYSIS_MODE
+    audio_sample_rate: int = AUDIO_ANALYSIS_SAMPLE_RATE
+    audio_frame_duration: float = AUDIO_ANALYSIS_FRAME
+    scene_scale_width: int = SCENE_DETECTION_SCALE_WIDTH
+    scene_keyframes_only: bool = SCENE_DETECTION_KEYFRAMES_ONLY
+    scene_hwaccel: str = SCENE_DETECTION_HWACCEL
+    scene_stall_timeout: float = SCENE_DETECTION_STALL_TIMEOUT
+    scene_workers: int = SCENE_DETECTION_WORKERS
+    scene_shard_min_duration: float = SCENE_DETECTION_SHARD_MIN_DURATION
+    scene_shard_overlap: float = SCENE_DETECTION_SHARD_OVERLAP
 
 
 @dataclass
@@ -45,6 +69,9 @@ class ClipConfig:
     segment_max_duration: int = DEFAULT_SEGMENT_MAX_DURATION
     compiled_max_duration: int = DEFAULT_COMPILED_MAX_DURATION
     generate_compiled: bool = DEFAULT_GENERATE_COMPILED
+    selection_mode: str = CLIP_SELECTION_MODE
+    length_step: int = CLIP_LENGTH_STEP
+    start_step: float = CLIP_START_STEP
 
 
 @dataclass
@@ -52,6 +79,7 @@ class AppConfig:
     """Main application configuration."""
     s3: S3Config = field(default_factory=S3Config)
     ffmpeg: FFmpegConfig = field(default_factory=FFmpegConfig)
+    analysis: AnalysisConfig = field(default_factory=AnalysisConfig)
     clip: ClipConfig = field(default_factory=ClipConfig)
     temp_dir: str = TEMP_DIR
     output_dir: str = OUTPUT_DIR
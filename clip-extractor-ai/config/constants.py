@@ -26,6 +26,38 @@ FFMPEG_AUDIO_BITRATE = "320k"
 FFMPEG_VIDEO_CODEC = "libx264"
 FFMPEG_AUDIO_CODEC = "aac"
 
+# Smart cut: stream-copy the closed-GOP interior of each segment and
+# re-encode only the partial GOPs at its head and tail (matching the source's
+# profile/level/refs). Off by default: the re-encoded parts still carry their
+# own SPS/PPS, and some players only honour the first set in an MP4's avcC
+FFMPEG_SMART_CUT = False
+FFMPEG_SMART_CUT_MIN_COPY = 4.0  # seconds of copyable interior needed to bother
+
+# =============================================================================
+# ANALYSIS CONFIGURATION
+# =============================================================================
+
+# Audio energy analysis: "pcm" decodes the audio once and computes framewise
+# RMS with NumPy; "astats" parses ffmpeg astats metadata (no NumPy needed)
+AUDIO_ANALYSIS_MODE = "pcm"
+AUDIO_ANALYSIS_SAMPLE_RATE = 16000  # Hz, mono
+AUDIO_ANALYSIS_FRAME = 0.02  # seconds per RMS frame (~one AAC frame)
+
+# Scene detection decode: the scene score is computed on frames downscaled to
+# this width (0 = full resolution), optionally keyframes only (much faster,
+# coarser cut times) and with hardware decoding (e.g. "auto", "cuda")
+SCENE_DETECTION_SCALE_WIDTH = 320
+SCENE_DETECTION_KEYFRAMES_ONLY = False
+SCENE_DETECTION_HWACCEL = ""
+SCENE_DETECTION_STALL_TIMEOUT = 120  # seconds without ffmpeg output before giving up
+
+# Sharded scene detection: long videos are split into time ranges decoded by
+# parallel ffmpeg processes (0 = one per CPU core, 1 = single sequential pass).
+# Each shard starts OVERLAP seconds early so its first frame has a predecessor
+SCENE_DETECTION_WORKERS = 0
+SCENE_DETECTION_SHARD_MIN_DURATION = 300  # seconds; shorter ranges are not worth a process
+SCENE_DETECTION_SHARD_OVERLAP = 1.0  # seconds
+
 # =============================================================================
 # CLIP EXTRACTION DEFAULTS
 # =============================================================================
@@ -38,6 +70,13 @@ DEFAULT_SEGMENT_MAX_DURATION = 40  # seconds
 DEFAULT_COMPILED_MAX_DURATION = 120  # seconds (2 min)
 DEFAULT_GENERATE_COMPILED = True
 
+# Clip selection: "optimal" scores candidate clips of several lengths and picks
+# the best-scoring non-overlapping set (weighted interval scheduling);
+# "greedy" expands the top analysis windows one by one
+CLIP_SELECTION_MODE = "optimal"
+CLIP_LENGTH_STEP = 15  # seconds between candidate clip lengths (min..max)
+CLIP_START_STEP = 1.0  # seconds between candidate clip starts
+
 # =============================================================================
 # PROCESSING CONFIGURATION
 # =============================================================================
@@ -52,6 +91,14 @@ VIDEO_DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB per chunk (for large files)
 VIDEO_DOWNLOAD_MAX_RETRIES = 10  # number of retry attempts (large files need more)
 VIDEO_DOWNLOAD_RETRY_WAIT = 3  # seconds to wait between retries
 
+# Parallel ranged download (used when the server supports Range requests).
+# Parts are written in order, so the file on disk is always a playable prefix;
+# with PROGRESSIVE, scene detection starts on that prefix during the download
+VIDEO_DOWNLOAD_PART_SIZE = 16 * 1024 * 1024  # 16 MB per ranged request
+VIDEO_DOWNLOAD_CONCURRENCY = 8  # parallel connections (1 = single stream)
+VIDEO_DOWNLOAD_PROGRESSIVE = True
+VIDEO_DOWNLOAD_PROGRESSIVE_PROBE = 8 * 1024 * 1024  # prefix bytes to probe for the container index
+
 # =============================================================================
 # PROGRESS REPORTING CONFIGURATION
 # =============================================================================
@@ -2,12 +2,16 @@
 
 import os
 import shutil
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union, Callable
+from typing import Optional, Tuple, Union, Callable
 from loguru import logger
 
 import requests
+from requests.adapters import HTTPAdapter
 
 try:
     import boto3
@@ -23,8 +27,12 @@ from config.constants import (
     VIDEO_DOWNLOAD_CHUNK_SIZE,
     VIDEO_DOWNLOAD_MAX_RETRIES,
     VIDEO_DOWNLOAD_RETRY_WAIT,
+    VIDEO_DOWNLOAD_PART_SIZE,
+    VIDEO_DOWNLOAD_CONCURRENCY,
 )
 
+USER_AGENT = "ClipExtractorAI/1.0"
+
 
 class S3ProgressCallback:
     """Progress callback for S3 transfers."""
@@ -48,6 +56,189 @@ class S3ProgressCallback:
                 self.callback(progress)
 
 
+class RangeNotSupportedError(IOError):
+    """The server answered a Range request with something other than the range."""
+
+
+class RangedDownload:
+    """Multi-connection HTTP download into a growing, contiguous file.
+
+    The remaining bytes are split into parts fetched with Range requests
+    over up to ``concurrency`` pooled connections. Parts are appended in
+    order, so the file on disk is always a prefix of the video that other
+    readers (e.g. ffmpeg with ``-follow 1``) can consume while the download
+    continues. At most 2 x concurrency parts are in flight, which bounds
+    memory to about 2 x concurrency x part_size.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        local_path: Union[str, Path],
+        total_size: int,
+        part_size: int = VIDEO_DOWNLOAD_PART_SIZE,
+        concurrency: int = VIDEO_DOWNLOAD_CONCURRENCY,
+        progress_callback: Optional[Callable[[float], None]] = None,
+        start_offset: int = 0,
+    ):
+        """Prepare a ranged download (call start() to begin).
+
+        Args:
+            url: Video URL (server must support Range requests)
+            local_path: Local destination path
+            total_size: Total size in bytes
+            part_size: Bytes per ranged request
+            concurrency: Parallel connections
+            progress_callback: Function to call with progress (0.0-1.0)
+            start_offset: Bytes already on disk (resume)
+        """
+        self.url = url
+        self.path = Path(local_path)
+        self.total_size = total_size
+        self.part_size = max(1, part_size)
+        self.concurrency = max(1, concurrency)
+        self.progress_callback = progress_callback
+        self.start_offset = start_offset
+
+        self._ready = start_offset
+        self._done = False
+        self._error: Optional[BaseException] = None
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def bytes_ready(self) -> int:
+        """Bytes of contiguous prefix written to disk."""
+        return self._ready
+
+    @property
+    def done(self) -> bool:
+        """Whether the download has finished (successfully or not)."""
+        return self._done
+
+    def start(self) -> "RangedDownload":
+        """Start downloading in a background thread."""
+        self._thread = threading.Thread(target=self._run, name="ranged-download", daemon=True)
+        self._thread.start()
+        return self
+
+    def wait_for_bytes(self, num_bytes: int, timeout: Optional[float] = None) -> bool:
+        """Block until the first num_bytes are on disk (or the download ends).
+
+        Returns:
+            True if the prefix is available
+        """
+        num_bytes = min(num_bytes, self.total_size)
+        with self._cond:
+            self._cond.wait_for(lambda: self._ready >= num_bytes or self._done, timeout)
+            return self._ready >= num_bytes
+
+    def wait(self) -> Path:
+        """Block until the download finishes.
+
+        Returns:
+            Path to the downloaded file
+
+        Raises:
+            Exception: The error that stopped the download
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self._done)
+        if self._error is not None:
+            raise self._error
+        return self.path
+
+    def _run(self) -> None:
+        parts = deque(
+            (start, min(start + self.part_size, self.total_size) - 1)
+            for start in range(self.start_offset, self.total_size, self.part_size)
+        )
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        logger.info(
+            f"Ranged download: {len(parts)} parts of {self.part_size / (1024*1024):.0f} MB "
+            f"over {self.concurrency} connections"
+        )
+
+        pool = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="download-part")
+        pending = deque()
+        try:
+            with open(self.path, "ab" if self.start_offset else "wb") as f:
+                while parts or pending:
+                    while parts and len(pending) < 2 * self.concurrency:
+                        start, end = parts.popleft()
+                        pending.append(pool.submit(self._fetch_part, session, start, end))
+
+                    data = pending.popleft().result()
+                    f.write(data)
+                    f.flush()
+
+                    with self._cond:
+                        self._ready += len(data)
+                        self._cond.notify_all()
+                    if self.progress_callback:
+                        self.progress_callback(min(1.0, self._ready / self.total_size))
+
+            logger.info(f"Download complete: {self._ready / (1024*1024):.1f} MB")
+        except BaseException as e:
+            self._error = e
+            logger.error(f"Ranged download failed at {self._ready / (1024*1024):.1f} MB: {e}")
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            session.close()
+            with self._cond:
+                self._done = True
+                self._cond.notify_all()
+
+    def _fetch_part(self, session: requests.Session, start: int, end: int) -> bytes:
+        """GET one byte range, retrying transient errors."""
+        timeout = (VIDEO_DOWNLOAD_CONNECT_TIMEOUT, VIDEO_DOWNLOAD_READ_TIMEOUT)
+        headers = {"User-Agent": USER_AGENT, "Range": f"bytes={start}-{end}"}
+        expected = end - start + 1
+
+        for attempt in range(1, VIDEO_DOWNLOAD_MAX_RETRIES + 1):
+            try:
+                response = session.get(self.url, headers=headers, timeout=timeout)
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise RangeNotSupportedError(
+                        f"HTTP {response.status_code} for Range bytes={start}-{end}"
+                    )
+                if len(response.content) != expected:
+                    raise IOError(
+                        f"short range response for bytes {start}-{end}: "
+                        f"{len(response.content)}/{expected} bytes"
+                    )
+                return response.content
+
+            except requests.exceptions.HTTPError as e:
+                # HTTP errors like 404, 403 should not be retried; 429/5xx are transient
+                status = e.response.status_code if e.response is not None else 0
+                if status != 429 and status < 500 or attempt == VIDEO_DOWNLOAD_MAX_RETRIES:
+                    raise
+                wait_time = VIDEO_DOWNLOAD_RETRY_WAIT * attempt
+                logger.warning(f"Part {start}-{end} got HTTP {status}, retrying in {wait_time}s")
+                time.sleep(wait_time)
+
+            except RangeNotSupportedError:
+                raise
+
+            except Exception as e:
+                if attempt == VIDEO_DOWNLOAD_MAX_RETRIES:
+                    raise
+                wait_time = VIDEO_DOWNLOAD_RETRY_WAIT * attempt
+                logger.warning(
+                    f"Part {start}-{end} attempt {attempt}/{VIDEO_DOWNLOAD_MAX_RETRIES} failed, "
+                    f"retrying in {wait_time}s: {e}"
+                )
+                time.sleep(wait_time)
+
+        return b""  # unreachable
+
+
 class StorageHandler:
     """Handle video download from URL and clip upload to S3."""
 
@@ -76,6 +267,90 @@ class StorageHandler:
             self._s3_client = boto3.client(**kwargs)
         return self._s3_client
 
+    def _probe_video_url(self, video_url: str) -> Tuple[int, bool]:
+        """HEAD the video URL.
+
+        Returns:
+            (total size in bytes or 0 if unknown, whether Range requests are supported)
+        """
+        timeout = (VIDEO_DOWNLOAD_CONNECT_TIMEOUT, VIDEO_DOWNLOAD_READ_TIMEOUT)
+
+        total_size = 0
+        supports_range = False
+        try:
+            head_resp = requests.head(
+                video_url,
+                timeout=timeout,
+                headers={"User-Agent": USER_AGENT},
+                allow_redirects=True,
+            )
+            total_size = int(head_resp.headers.get("content-length", 0))
+            accept_ranges = head_resp.headers.get("accept-ranges", "none")
+            supports_range = accept_ranges.lower() != "none"
+            if total_size > 0:
+                logger.info(f"Video size: {total_size / (1024*1024):.1f} MB")
+            if supports_range:
+                logger.info("Server supports Range requests - resume enabled")
+        except Exception as e:
+            logger.warning(f"HEAD request failed, will try direct download: {e}")
+
+        return total_size, supports_range
+
+    def start_video_download(
+        self,
+        video_url: str,
+        local_path: Union[str, Path],
+        progress_callback: Optional[Callable[[float], None]] = None,
+    ) -> Optional[RangedDownload]:
+        """Start a parallel ranged download in the background.
+
+        The file grows as a contiguous prefix, so analysis can begin on it
+        before the download finishes (see RangedDownload).
+
+        Args:
+            video_url: Public video URL (CMS link)
+            local_path: Local destination path
+            progress_callback: Function to call with progress (0.0-1.0)
+
+        Returns:
+            Running RangedDownload, or None if the server does not support
+            Range requests or the size is unknown (use download_video_from_url)
+        """
+        local_path = Path(local_path)
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+
+        total_size, supports_range = self._probe_video_url(video_url)
+        if not supports_range or total_size <= 0 or VIDEO_DOWNLOAD_CONCURRENCY <= 1:
+            return None
+
+        logger.info(f"Downloading video from URL: {video_url}")
+        logger.info(f"Saving to: {local_path}")
+
+        return self._start_ranged_download(video_url, local_path, total_size, progress_callback)
+
+    def _start_ranged_download(
+        self,
+        video_url: str,
+        local_path: Path,
+        total_size: int,
+        progress_callback: Optional[Callable[[float], None]],
+    ) -> RangedDownload:
+        """Start a RangedDownload, resuming from a partial file if present."""
+        existing_size = local_path.stat().st_size if local_path.exists() else 0
+        if not 0 < existing_size < total_size:
+            existing_size = 0
+        elif existing_size:
+            logger.info(
+                f"Resuming download from {existing_size / (1024*1024):.1f} MB "
+                f"({existing_size * 100 // total_size}%)"
+            )
+
+        return RangedDownload(
+            video_url, local_path, total_size,
+            progress_callback=progress_callback,
+            start_offset=existing_size,
+        ).start()
+
     def download_video_from_url(
         self,
         video_url: str,
@@ -84,7 +359,9 @@ class StorageHandler:
     ) -> Path:
         """Download video from public URL with progress tracking and retry/resume.
 
-        Supports resuming partial downloads using HTTP Range headers.
+        Uses parallel ranged requests when the server supports them (see
+        RangedDownload); otherwise streams over a single connection,
+        resuming partial downloads using HTTP Range headers.
         Retries on timeout or connection errors.
 
         Args:
@@ -101,32 +378,26 @@ class StorageHandler:
         logger.info(f"Downloading video from URL: {video_url}")
         logger.info(f"Saving to: {local_path}")
 
-        timeout = (VIDEO_DOWNLOAD_CONNECT_TIMEOUT, VIDEO_DOWNLOAD_READ_TIMEOUT)
+        total_size, supports_range = self._probe_video_url(video_url)
 
-        # First, get the total size with a HEAD request
-        total_size = 0
-        supports_range = False
-        try:
-            head_resp = requests.head(
-                video_url,
-                timeout=timeout,
-                headers={"User-Agent": "ClipExtractorAI/1.0"},
-                allow_redirects=True,
-            )
-            total_size = int(head_resp.headers.get("content-length", 0))
-            accept_ranges = head_resp.headers.get("accept-ranges", "none")
-            supports_range = accept_ranges.lower() != "none"
-            if total_size > 0:
-                logger.info(f"Video size: {total_size / (1024*1024):.1f} MB")
-            if supports_range:
-                logger.info("Server supports Range requests - resume enabled")
-        except Exception as e:
-            logger.warning(f"HEAD request failed, will try direct download: {e}")
+        if supports_range and total_size > 0 and VIDEO_DOWNLOAD_CONCURRENCY > 1:
+            try:
+                path = self._start_ranged_download(
+                    video_url, local_path, total_size, progress_callback
+                ).wait()
+                if progress_callback:
+                    progress_callback(1.0)
+                return path
+            except RangeNotSupportedError as e:
+                logger.warning(f"Ranged download not possible ({e}), using a single stream")
+                supports_range = False
+
+        timeout = (VIDEO_DOWNLOAD_CONNECT_TIMEOUT, VIDEO_DOWNLOAD_READ_TIMEOUT)
 
         for attempt in range(1, VIDEO_DOWNLOAD_MAX_RETRIES + 1):
             try:
                 downloaded = 0
-                headers = {"User-Agent": "ClipExtractorAI/1.0"}
+                headers = {"User-Agent": USER_AGENT}
 
                 # Check for partial download to resume
                 if supports_range and local_path.exists():
@@ -5,12 +5,55 @@ a narrative. Uses FFmpeg scene detection and audio RMS levels.
 """
 
 import json
+import os
 import re
 import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Optional, Callable
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 from loguru import logger
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from config import get_config
+
+
+# RMS floor: -80 dBFS in linear scale (silence / digital zero)
+RMS_FLOOR = 10 ** (-80 / 20)
+
+# Scene detection output: "frame:12 pts:6144 pts_time:0.48" then
+# "lavfi.scene_score=0.531" for each decoded frame
+PTS_TIME_RE = re.compile(r"pts_time[:\s]+(\d+\.?\d*)")
+SCENE_SCORE_KEY = "lavfi.scene_score="
+
+# Windows decoded and reduced per pipe read in PCM mode
+PCM_WINDOWS_PER_READ = 60
+
+# Segment score weights over normalized metrics
+SCORE_WEIGHTS = {
+    "dynamics": 0.35,  # emotional = dynamic audio
+    "peak": 0.25,      # intense = loud peaks
+    "energy": 0.20,    # energy level
+    "scene": 0.20,     # visual activity
+}
+
+# Segment labels by dominant normalized metric, checked in order:
+# (metric, threshold, segment_type, emotional_label)
+SEGMENT_LABELS = [
+    ("dynamics", 0.7, "dramatic_moment", "dramatic"),
+    ("peak", 0.7, "intense_peak", "intense"),
+    ("scene", 0.7, "action_sequence", "action"),
+    ("energy", 0.6, "high_energy", "energetic"),
+]
+DEFAULT_SEGMENT_LABEL = ("emotional_moment", "emotional")
+
 
 @dataclass
 class SceneChange:
@@ -29,6 +72,14 @@ class AudioWindow:
     rms_variance: float
 
 
+@dataclass
+class VideoSignals:
+    """Raw per-video signals that analysis windows are scored from."""
+    duration: float
+    scenes: List[SceneChange]
+    audio_windows: List[AudioWindow]
+
+
 @dataclass
 class VideoSegment:
     """A scored video segment (candidate for clip extraction)."""
@@ -66,76 +117,263 @@ def detect_scenes(
     video_path: str,
     threshold: float = 0.3,
     progress_callback: Optional[Callable[[float], None]] = None,
+    duration: Optional[float] = None,
+    follow: bool = False,
 ) -> List[SceneChange]:
     """Detect scene changes using FFmpeg scene filter.
 
+    ffmpeg prints the scene score of every decoded frame, and the output is
+    parsed line by line as it streams, so progress is reported from the
+    decoded timestamp and memory stays constant. Frames arrive in
+    timestamp order, so duplicates are dropped by comparing against the
+    last accepted cut only. Decoding is sped up by downscaling before
+    the scene filter and, optionally, keyframe-only or hardware decoding
+    (see AnalysisConfig).
+
+    Long videos are split into time shards that separate ffmpeg processes
+    decode in parallel (``scene_workers``). Each shard seeks a little before
+    its range so the first frame it owns is scored against its real
+    predecessor. The cuts each shard owns are then stitched in time order
+    with the same duplicate rule, so the result matches a sequential pass.
+
+    There is no overall time limit: ffmpeg is stopped only if it produces
+    no output for ``scene_stall_timeout`` seconds, in which case the scene
+    changes found so far are returned.
+
     Args:
         video_path: Path to video file
         threshold: Scene change threshold (0-1, lower = more sensitive)
         progress_callback: Progress callback
+        duration: Video duration in seconds (probed if needed for progress
+            or sharding)
+        follow: The file is still being written (e.g. by RangedDownload);
+            ffmpeg waits at end of file for more data instead of stopping.
+            Never sharded.
 
     Returns:
         List of SceneChange objects with timestamps
     """
     logger.info(f"Detecting scenes (threshold={threshold})...")
 
-    cmd = [
-        "ffmpeg", "-i", video_path,
-        "-vf", f"select='gt(scene,{threshold})',metadata=print:file=-",
-        "-an", "-f", "null", "-",
-    ]
+    analysis_cfg = get_config().analysis
+    cpus = os.cpu_count() or 1
+    workers = analysis_cfg.scene_workers if analysis_cfg.scene_workers > 0 else cpus
+    if not duration and (progress_callback or (workers > 1 and not follow)):
+        duration = get_video_duration(video_path)
+
+    shards = [(0.0, float("inf"))]
+    if not follow and duration and workers > 1:
+        shards = _scene_shards(duration, workers, analysis_cfg.scene_shard_min_duration)
+
+    # Progress is the decoded time summed over shards
+    decoded = [0.0] * len(shards)
+    reported = [0.0]
+    progress_lock = threading.Lock()
+
+    def on_time(index: int, timestamp: float) -> None:
+        if not (progress_callback and duration):
+            return
+        with progress_lock:
+            decoded[index] = timestamp - shards[index][0]
+            progress = min(1.0, sum(decoded) / duration)
+            if progress - reported[0] >= 0.01:
+                reported[0] = progress
+                progress_callback(progress)
+
+    if len(shards) == 1:
+        results = [_run_scene_filter(
+            video_path, threshold, follow=follow,
+            on_time=lambda t: on_time(0, t),
+        )]
+    else:
+        overlap = analysis_cfg.scene_shard_overlap
+        decode_threads = max(1, cpus // len(shards))
+        logger.info(f"Scene detection sharded into {len(shards)} ranges ({decode_threads} decode threads each)")
+        with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+            futures = [
+                executor.submit(
+                    _run_scene_filter, video_path, threshold,
+                    seek=max(0.0, start - overlap), length=end - max(0.0, start - overlap),
+                    decode_threads=decode_threads,
+                    on_time=lambda t, i=i: on_time(i, t),
+                )
+                for i, (start, end) in enumerate(shards)
+            ]
+            results = [future.result() for future in futures]
+
+    # Stitch: keep the cuts each shard owns, in order, deduplicated across edges
+    scenes: List[SceneChange] = []
+    last_cut = float("-inf")
+    for (start, end), (shard_scenes, _) in zip(shards, results):
+        for scene in shard_scenes:
+            if start <= scene.timestamp < end and scene.timestamp - last_cut >= 0.1:
+                scenes.append(scene)
+                last_cut = scene.timestamp
+    complete = all(ok for _, ok in results)
+
+    logger.info(f"Detected {len(scenes)} scene changes")
+
+    # Only a complete pass reports 1.0
+    if progress_callback and complete:
+        progress_callback(1.0)
+
+    return scenes
+
+
+def _scene_shards(
+    duration: float,
+    workers: int,
+    min_duration: float,
+) -> List[Tuple[float, float]]:
+    """Split [0, duration) into at most ``workers`` equal time ranges.
 
-    try:
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=600,
-        )
+    Ranges are at least ``min_duration`` long; the last one is open-ended so
+    frames past the probed duration are still owned.
+    """
+    count = max(1, min(workers, int(duration // max(min_duration, 1e-9))))
+    step = duration / count
+    bounds = [i * step for i in range(count)] + [float("inf")]
+    return list(zip(bounds[:-1], bounds[1:]))
 
-        scenes = []
-        # Parse output for pts_time values
-        for line in result.stderr.split("\n"):
-            # Look for: "pts_time:123.456" in showinfo output
-            match = re.search(r'pts_time[:\s]+(\d+\.?\d*)', line)
-            if match:
-                ts = float(match.group(1))
-                scenes.append(SceneChange(timestamp=ts, score=threshold))
 
-        # Also parse stdout for metadata print output
-        for line in result.stdout.split("\n"):
-            match = re.search(r'pts_time[:\s]+(\d+\.?\d*)', line)
-            if match:
-                ts = float(match.group(1))
-                if not any(abs(s.timestamp - ts) < 0.1 for s in scenes):
-                    scenes.append(SceneChange(timestamp=ts, score=threshold))
+def _run_scene_filter(
+    video_path: str,
+    threshold: float,
+    seek: float = 0.0,
+    length: Optional[float] = None,
+    decode_threads: int = 0,
+    follow: bool = False,
+    on_time: Optional[Callable[[float], None]] = None,
+) -> Tuple[List[SceneChange], bool]:
+    """Run one ffmpeg scene-score pass over a time range of the video.
 
-        scenes.sort(key=lambda s: s.timestamp)
-        logger.info(f"Detected {len(scenes)} scene changes")
+    Args:
+        video_path: Path to video file
+        threshold: Scene change threshold (0-1)
+        seek: Start of the range in seconds (input seek, frame-accurate)
+        length: Length of the range in seconds (None = to the end)
+        decode_threads: ffmpeg decoder threads (0 = ffmpeg default)
+        follow: Wait at end of file for more data (see detect_scenes)
+        on_time: Called with the video timestamp of every decoded frame
 
-        if progress_callback:
-            progress_callback(1.0)
+    Returns:
+        (scene changes with video timestamps, whether ffmpeg finished cleanly)
+    """
+    analysis_cfg = get_config().analysis
+
+    cmd = ["ffmpeg", "-v", "error", "-nostats"]
+    if analysis_cfg.scene_hwaccel:
+        cmd += ["-hwaccel", analysis_cfg.scene_hwaccel]
+    if analysis_cfg.scene_keyframes_only:
+        cmd += ["-skip_frame", "nokey"]
+    if decode_threads > 0:
+        cmd += ["-threads", str(decode_threads)]
+
+    filters = []
+    if analysis_cfg.scene_scale_width > 0:
+        filters.append(f"scale={analysis_cfg.scene_scale_width}:-2:flags=fast_bilinear")
+    filters.append("select='gte(scene,0)'")
+    filters.append("metadata=print:key=lavfi.scene_score:file=-")
+
+    if follow:
+        cmd += [
+            "-follow", "1",
+            "-rw_timeout", str(int(analysis_cfg.scene_stall_timeout * 1_000_000)),
+        ]
+    if seek > 0:
+        cmd += ["-ss", f"{seek:.3f}"]
+    if length is not None and length != float("inf"):
+        cmd += ["-t", f"{length:.3f}"]
+
+    cmd += [
+        "-i", video_path,
+        "-vf", ",".join(filters),
+        "-an", "-sn", "-dn", "-f", "null", "-",
+    ]
 
-        return scenes
+    scenes: List[SceneChange] = []
+    last_cut = float("-inf")
+    timestamp = None
 
-    except subprocess.TimeoutExpired:
-        logger.error("Scene detection timed out")
-        return []
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+    )
+    stderr_tail: deque = deque(maxlen=20)
+    last_output = [time.monotonic()]
+    stalled = threading.Event()
+
+    def drain_stderr():
+        for err_line in proc.stderr:
+            stderr_tail.append(err_line.rstrip())
+
+    def watchdog():
+        while proc.poll() is None:
+            if time.monotonic() - last_output[0] > analysis_cfg.scene_stall_timeout:
+                stalled.set()
+                proc.kill()
+                return
+            time.sleep(1.0)
+
+    threading.Thread(target=drain_stderr, daemon=True).start()
+    threading.Thread(target=watchdog, daemon=True).start()
+
+    try:
+        for line in proc.stdout:
+            last_output[0] = time.monotonic()
+
+            if line.startswith("frame:"):
+                match = PTS_TIME_RE.search(line)
+                # Input seeking restarts output timestamps at zero
+                timestamp = seek + float(match.group(1)) if match else None
+                if timestamp is not None and on_time:
+                    on_time(timestamp)
+                continue
+
+            if timestamp is None or not line.startswith(SCENE_SCORE_KEY):
+                continue
+
+            score = float(line[len(SCENE_SCORE_KEY):])
+            if score > threshold and timestamp - last_cut >= 0.1:
+                scenes.append(SceneChange(timestamp=timestamp, score=score))
+                last_cut = timestamp
     except Exception as e:
+        proc.kill()
         logger.error(f"Scene detection failed: {e}")
-        return []
+    finally:
+        proc.stdout.close()
+        returncode = proc.wait()
+
+    range_label = f" in range starting at {seek:.0f}s" if seek > 0 else ""
+    if stalled.is_set():
+        logger.error(
+            f"Scene detection stalled{range_label} (no output for {analysis_cfg.scene_stall_timeout:.0f}s), "
+            f"keeping {len(scenes)} scene changes found before {timestamp or 0.0:.0f}s"
+        )
+    elif returncode != 0:
+        logger.error(
+            f"Scene detection failed{range_label} (ffmpeg exit {returncode}): "
+            f"{' | '.join(stderr_tail)[-300:]}"
+        )
+
+    return scenes, returncode == 0 and not stalled.is_set()
 
 
 def analyze_audio_energy(
     video_path: str,
     window_size: float = 1.0,
     progress_callback: Optional[Callable[[float], None]] = None,
+    mode: Optional[str] = None,
 ) -> List[AudioWindow]:
     """Analyze audio energy levels per second using ffmpeg.
 
-    Uses volumedetect for overall stats and astats for per-frame analysis.
+    In "pcm" mode the audio is decoded once and framewise RMS is computed
+    with NumPy; otherwise astats is used for per-frame analysis.
 
     Args:
         video_path: Path to video file
         window_size: Analysis window in seconds
         progress_callback: Progress callback
+        mode: "pcm" or "astats" (default from config)
 
     Returns:
         List of AudioWindow objects with per-second energy data
@@ -147,6 +385,18 @@ def analyze_audio_energy(
         logger.error("Could not determine video duration for audio analysis")
         return []
 
+    mode = mode or get_config().analysis.audio_mode
+    if mode == "pcm":
+        if HAS_NUMPY:
+            try:
+                return _analyze_audio_energy_pcm(
+                    video_path, duration, window_size, progress_callback
+                )
+            except Exception as e:
+                logger.warning(f"PCM audio analysis failed: {e}, using astats")
+        else:
+            logger.warning("NumPy not installed, using astats audio analysis")
+
     # Use ffmpeg with astats to get per-frame RMS levels
     cmd = [
         "ffmpeg", "-i", video_path,
@@ -229,6 +479,128 @@ def analyze_audio_energy(
         return _fallback_audio_analysis(video_path, duration, window_size)
 
 
+def _analyze_audio_energy_pcm(
+    video_path: str,
+    duration: float,
+    window_size: float,
+    progress_callback: Optional[Callable[[float], None]] = None,
+) -> List[AudioWindow]:
+    """Audio energy from decoded PCM, with vectorized framewise RMS.
+
+    ffmpeg decodes the audio once to mono float32 on a pipe. Each read
+    covers a block of whole windows and is reduced with strided reshapes:
+    samples -> RMS frames -> per-window mean/peak/variance. Windows sit on
+    exact sample boundaries, and memory stays constant for any film length.
+
+    Args:
+        video_path: Path to video file
+        duration: Video duration in seconds
+        window_size: Analysis window in seconds
+        progress_callback: Progress callback
+
+    Returns:
+        List of AudioWindow objects (same layout as the astats path)
+
+    Raises:
+        RuntimeError: If ffmpeg could not decode the audio
+    """
+    analysis_cfg = get_config().analysis
+    sample_rate = analysis_cfg.audio_sample_rate
+
+    num_windows = int(duration / window_size)
+    if num_windows <= 0:
+        return []
+
+    frames_per_window = max(1, round(window_size / analysis_cfg.audio_frame_duration))
+    window_samples = int(round(window_size * sample_rate))
+    frame_len = max(1, window_samples // frames_per_window)
+    window_samples = frame_len * frames_per_window  # whole frames per window
+
+    cmd = [
+        "ffmpeg", "-v", "error", "-i", video_path,
+        "-vn", "-ac", "1", "-ar", str(sample_rate),
+        "-f", "f32le", "pipe:1",
+    ]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stderr_tail: deque = deque(maxlen=20)
+
+    # Drain stderr alongside the stdout reads; a full stderr pipe would block
+    # ffmpeg while we wait on stdout
+    def drain_stderr():
+        for err_line in proc.stderr:
+            stderr_tail.append(err_line.decode(errors="replace").rstrip())
+
+    drain_thread = threading.Thread(target=drain_stderr, daemon=True)
+    drain_thread.start()
+
+    means, peaks, variances = [], [], []
+    decoded_samples = 0
+    try:
+        while len(means) < num_windows:
+            block_windows = min(PCM_WINDOWS_PER_READ, num_windows - len(means))
+            data = proc.stdout.read(block_windows * window_samples * 4)
+            if not data:
+                break
+
+            samples = np.frombuffer(data[:len(data) // 4 * 4], dtype=np.float32)
+            decoded_samples += len(samples)
+
+            # Audio shorter than the container: pad the last window with silence
+            block_windows = -(-len(samples) // window_samples)
+            if len(samples) < block_windows * window_samples:
+                samples = np.pad(samples, (0, block_windows * window_samples - len(samples)))
+
+            frames = samples.reshape(block_windows * frames_per_window, frame_len)
+            rms = np.sqrt(np.einsum("ij,ij->i", frames, frames, dtype=np.float64) / frame_len)
+            rms = np.maximum(rms, RMS_FLOOR).reshape(block_windows, frames_per_window)
+
+            means.append(rms.mean(axis=1))
+            peaks.append(rms.max(axis=1))
+            variances.append(rms.var(axis=1))
+
+            if progress_callback:
+                progress_callback(min(1.0, decoded_samples / (duration * sample_rate)))
+    finally:
+        proc.stdout.close()
+        proc.wait()
+        drain_thread.join()
+
+    if decoded_samples == 0:
+        stderr = "\n".join(stderr_tail)
+        raise RuntimeError(f"ffmpeg decoded no audio: {stderr[-300:]}")
+
+    mean_arr = np.concatenate(means)[:num_windows]
+    peak_arr = np.concatenate(peaks)[:num_windows]
+    var_arr = np.concatenate(variances)[:num_windows]
+
+    windows = []
+    for i in range(num_windows):
+        start = i * window_size
+        # Windows past the end of the audio track are silent
+        if i < len(mean_arr):
+            mean_rms, peak_rms, variance = float(mean_arr[i]), float(peak_arr[i]), float(var_arr[i])
+        else:
+            mean_rms, peak_rms, variance = RMS_FLOOR, RMS_FLOOR, 0.0
+
+        windows.append(AudioWindow(
+            start=start,
+            end=min(start + window_size, duration),
+            rms_mean=mean_rms,
+            rms_peak=peak_rms,
+            rms_variance=variance,
+        ))
+
+    logger.info(
+        f"Analyzed {len(windows)} audio windows "
+        f"({decoded_samples / sample_rate:.0f}s of PCM at {sample_rate} Hz)"
+    )
+
+    if progress_callback:
+        progress_callback(1.0)
+
+    return windows
+
+
 def _fallback_audio_analysis(
     video_path: str,
     duration: float,
@@ -294,11 +666,63 @@ def _fallback_audio_analysis(
     return windows
 
 
+def analyze_video_signals(
+    video_path: str,
+    scene_threshold: float = 0.3,
+    progress_callback: Optional[Callable[[float, str], None]] = None,
+    scenes: Optional[List[SceneChange]] = None,
+) -> VideoSignals:
+    """Run scene detection and audio energy analysis on a video.
+
+    Args:
+        video_path: Path to video file
+        scene_threshold: Scene change detection threshold
+        progress_callback: Progress callback (progress, message), 0.0-0.8
+        scenes: Scene changes detected beforehand (skips scene detection)
+
+    Returns:
+        VideoSignals with duration, scene changes and per-second audio energy
+
+    Raises:
+        ValueError: If the video duration cannot be determined
+    """
+    duration = get_video_duration(video_path)
+    if duration <= 0:
+        raise ValueError("Could not determine video duration")
+
+    logger.info(f"Video duration: {duration:.1f}s ({duration/60:.1f} min)")
+
+    # Step 1: Detect scenes
+    if scenes is None:
+        if progress_callback:
+            progress_callback(0.0, "Detecting scene changes")
+
+        scenes = detect_scenes(
+            video_path,
+            threshold=scene_threshold,
+            progress_callback=(
+                (lambda p: progress_callback(0.4 * p, "Detecting scene changes"))
+                if progress_callback else None
+            ),
+            duration=duration,
+        )
+
+    if progress_callback:
+        progress_callback(0.4, "Analyzing audio energy")
+
+    # Step 2: Analyze audio
+    audio_windows = analyze_audio_energy(video_path, window_size=1.0)
+
+    return VideoSignals(duration=duration, scenes=scenes, audio_windows=audio_windows)
+
+
 def find_emotional_segments(
     video_path: str,
     analysis_window_size: float = 10.0,
     scene_threshold: float = 0.3,
     progress_callback: Optional[Callable[[float, str], None]] = None,
+    window_step: Optional[float] = None,
+    scenes: Optional[List[SceneChange]] = None,
 ) -> List[VideoSegment]:
     """Find emotional/high-energy segments in a video.
 
@@ -310,34 +734,257 @@ def find_emotional_segments(
         analysis_window_size: Size of analysis windows in seconds
         scene_threshold: Scene change detection threshold
         progress_callback: Progress callback (progress, message)
+        window_step: Stride between analysis windows (default: half a window)
+        scenes: Scene changes detected beforehand (skips scene detection)
 
     Returns:
         List of VideoSegment objects, sorted by score (highest first)
     """
-    duration = get_video_duration(video_path)
-    if duration <= 0:
-        raise ValueError("Could not determine video duration")
-
-    logger.info(f"Video duration: {duration:.1f}s ({duration/60:.1f} min)")
+    signals = analyze_video_signals(video_path, scene_threshold, progress_callback, scenes)
+    duration = signals.duration
 
-    # Step 1: Detect scenes
     if progress_callback:
-        progress_callback(0.0, "Detecting scene changes")
+        progress_callback(0.8, "Scoring segments")
 
-    scenes = detect_scenes(video_path, threshold=scene_threshold)
+    # Step 3: Score analysis windows (50% overlap by default for better coverage)
+    window_step = window_step or analysis_window_size / 2
+    if HAS_NUMPY:
+        segments = segments_from_columns(score_windows(
+            signals.audio_windows, signals.scenes, duration, analysis_window_size, window_step
+        ))
+    else:
+        segments = _score_windows_loop(
+            signals.audio_windows, signals.scenes, duration, analysis_window_size, window_step
+        )
 
-    if progress_callback:
-        progress_callback(0.4, "Analyzing audio energy")
+    if not segments:
+        logger.warning("No segments generated, creating uniform segments")
+        # Fallback: create uniform segments
+        num_seg = max(1, int(duration / analysis_window_size))
+        for i in range(num_seg):
+            s = i * analysis_window_size
+            e = min(s + analysis_window_size, duration)
+            segments.append(VideoSegment(
+                start=s, end=e, duration=e - s,
+                audio_energy=0.5, audio_dynamics=0.0,
+                audio_peak=0.5, scene_density=0.0,
+            ))
 
-    # Step 2: Analyze audio
-    audio_windows = analyze_audio_energy(video_path, window_size=1.0)
+        _normalize_and_score(segments)
+
+    # Sort by score
+    segments.sort(key=lambda s: s.score, reverse=True)
 
     if progress_callback:
-        progress_callback(0.8, "Scoring segments")
+        progress_callback(1.0, "Analysis complete")
+
+    logger.info(f"Found {len(segments)} candidate segments")
+    if segments:
+        logger.info(f"Top score: {segments[0].score:.3f}, Bottom: {segments[-1].score:.3f}")
+
+    return segments
+
+
+def score_windows(
+    audio_windows: List[AudioWindow],
+    scenes: List[SceneChange],
+    duration: float,
+    window_size: float,
+    window_step: float,
+) -> Dict[str, "np.ndarray"]:
+    """Score sliding analysis windows over a video, columnar.
+
+    Audio sums come from cumulative sums, peaks from a sparse-table range
+    max, and scene counts from searchsorted over the sorted scene times.
+    Every window costs O(1) after O(n log n) setup, so any stride or window
+    size can be scored over a whole film almost for free.
+
+    Window membership matches the per-window loop: audio windows with
+    ``start >= seg_start and end <= seg_end + 1``, scene changes with
+    ``seg_start <= timestamp <= seg_end``.
+
+    Args:
+        audio_windows: Per-second audio energy (sorted by time)
+        scenes: Detected scene changes
+        duration: Video duration in seconds
+        window_size: Analysis window length in seconds
+        window_step: Stride between window starts in seconds
+
+    Returns:
+        Dict of equal-length arrays: start, end, energy, dynamics, peak,
+        scene_density, score and label (index into SEGMENT_LABELS, or
+        len(SEGMENT_LABELS) for the default label)
+    """
+    if duration < window_size:
+        starts = np.zeros(0)
+    else:
+        count = int(np.floor((duration - window_size) / window_step + 1e-9)) + 1
+        starts = np.arange(count) * window_step
+    ends = np.minimum(starts + window_size, duration)
+    lengths = ends - starts
+
+    # Audio metrics: contiguous run of audio windows per analysis window
+    a_start = np.array([aw.start for aw in audio_windows], dtype=np.float64)
+    a_end = np.array([aw.end for aw in audio_windows], dtype=np.float64)
+    a_mean = np.array([aw.rms_mean for aw in audio_windows], dtype=np.float64)
+    a_var = np.array([aw.rms_variance for aw in audio_windows], dtype=np.float64)
+    a_peak = np.array([aw.rms_peak for aw in audio_windows], dtype=np.float64)
+
+    lo = np.searchsorted(a_start, starts, side="left")
+    hi = np.maximum(lo, np.searchsorted(a_end, ends + 1, side="right"))
+    counts = hi - lo
+    has_audio = counts > 0
+    safe_counts = np.maximum(counts, 1)
+
+    cum_mean = np.concatenate([[0.0], np.cumsum(a_mean)])
+    cum_var = np.concatenate([[0.0], np.cumsum(a_var)])
+    energy = np.where(has_audio, (cum_mean[hi] - cum_mean[lo]) / safe_counts, 0.0)
+    dynamics = np.where(has_audio, (cum_var[hi] - cum_var[lo]) / safe_counts, 0.0)
+    peak = np.zeros(len(starts))
+    peak[has_audio] = _range_max(a_peak, lo[has_audio], hi[has_audio])
+
+    # Scene density: scene changes inside each window (inclusive bounds)
+    times = np.sort(np.array([sc.timestamp for sc in scenes], dtype=np.float64))
+    scene_counts = (
+        np.searchsorted(times, ends, side="right")
+        - np.searchsorted(times, starts, side="left")
+    )
+    scene_density = np.where(lengths > 0, scene_counts / np.where(lengths > 0, lengths, 1), 0.0)
+
+    score, label = _score_columns(energy, dynamics, peak, scene_density)
+
+    return {
+        "start": starts,
+        "end": ends,
+        "energy": energy,
+        "dynamics": dynamics,
+        "peak": peak,
+        "scene_density": scene_density,
+        "score": score,
+        "label": label,
+    }
+
+
+def score_clip_candidates(
+    signals: VideoSignals,
+    lengths: Sequence[float],
+    start_step: float,
+) -> Dict[str, "np.ndarray"]:
+    """Score candidate clips of several lengths at every start offset.
+
+    Each length is scored with score_windows; the raw metrics are then
+    normalized together so scores are comparable across lengths.
+
+    Args:
+        signals: Output of analyze_video_signals
+        lengths: Candidate clip lengths in seconds (at least one)
+        start_step: Stride between candidate starts in seconds
+
+    Returns:
+        Columns as returned by score_windows, for all lengths combined
+    """
+    columns = [
+        score_windows(signals.audio_windows, signals.scenes, signals.duration, length, start_step)
+        for length in lengths
+    ]
+
+    merged = {key: np.concatenate([c[key] for c in columns]) for key in columns[0]}
+    merged["score"], merged["label"] = _score_columns(
+        merged["energy"], merged["dynamics"], merged["peak"], merged["scene_density"]
+    )
+    return merged
+
+
+def _range_max(values: "np.ndarray", lo: "np.ndarray", hi: "np.ndarray") -> "np.ndarray":
+    """Max of values[lo:hi] for many non-empty ranges at once (sparse table)."""
+    if len(lo) == 0:
+        return np.zeros(0)
+
+    # table[k][i] = max(values[i : i + 2**k])
+    table = [values]
+    while (1 << len(table)) <= len(values):
+        prev, half = table[-1], 1 << (len(table) - 1)
+        table.append(np.maximum(prev[:-half], prev[half:]))
+
+    levels = np.floor(np.log2(hi - lo)).astype(np.int64)
+    result = np.empty(len(lo))
+    for k in np.unique(levels):
+        mask = levels == k
+        row = table[k]
+        result[mask] = np.maximum(row[lo[mask]], row[hi[mask] - (1 << k)])
+    return result
+
+
+def _score_columns(
+    energy: "np.ndarray",
+    dynamics: "np.ndarray",
+    peak: "np.ndarray",
+    scene_density: "np.ndarray",
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Vectorized _normalize_and_score: scores and label indices."""
+    def normalize(values):
+        top = values.max() if len(values) else 0.0
+        return values / (top or 1.0)
+
+    norms = {
+        "energy": normalize(energy),
+        "dynamics": normalize(dynamics),
+        "peak": normalize(peak),
+        "scene": normalize(scene_density),
+    }
+    score = sum(norms[metric] * weight for metric, weight in SCORE_WEIGHTS.items())
+    label = np.select(
+        [norms[metric] > threshold for metric, threshold, _, _ in SEGMENT_LABELS],
+        np.arange(len(SEGMENT_LABELS)),
+        default=len(SEGMENT_LABELS),
+    )
+    return score, label
+
+
+def segments_from_columns(
+    columns: Dict[str, "np.ndarray"],
+    indices: Optional[Sequence[int]] = None,
+) -> List[VideoSegment]:
+    """Materialize scored windows from score_windows as VideoSegments.
+
+    Args:
+        columns: Columns from score_windows or score_clip_candidates
+        indices: Rows to materialize (default: all, in order)
+    """
+    labels = [(seg_type, emo) for _, _, seg_type, emo in SEGMENT_LABELS]
+    labels.append(DEFAULT_SEGMENT_LABEL)
+
+    if indices is None:
+        indices = range(len(columns["start"]))
 
-    # Step 3: Create analysis windows and score them
     segments = []
-    window_step = analysis_window_size / 2  # 50% overlap for better coverage
+    for i in indices:
+        start, end = float(columns["start"][i]), float(columns["end"][i])
+        segment_type, emotional_label = labels[columns["label"][i]]
+        segments.append(VideoSegment(
+            start=start,
+            end=end,
+            duration=end - start,
+            audio_energy=float(columns["energy"][i]),
+            audio_dynamics=float(columns["dynamics"][i]),
+            audio_peak=float(columns["peak"][i]),
+            scene_density=float(columns["scene_density"][i]),
+            score=float(columns["score"][i]),
+            segment_type=segment_type,
+            emotional_label=emotional_label,
+        ))
+    return segments
+
+
+def _score_windows_loop(
+    audio_windows: List[AudioWindow],
+    scenes: List[SceneChange],
+    duration: float,
+    analysis_window_size: float,
+    window_step: float,
+) -> List[VideoSegment]:
+    """Per-window scoring without NumPy (same results as score_windows)."""
+    segments = []
 
     cursor = 0.0
     while cursor + analysis_window_size <= duration:
@@ -379,32 +1026,7 @@ def find_emotional_segments(
 
         cursor += window_step
 
-    if not segments:
-        logger.warning("No segments generated, creating uniform segments")
-        # Fallback: create uniform segments
-        num_seg = max(1, int(duration / analysis_window_size))
-        for i in range(num_seg):
-            s = i * analysis_window_size
-            e = min(s + analysis_window_size, duration)
-            segments.append(VideoSegment(
-                start=s, end=e, duration=e - s,
-                audio_energy=0.5, audio_dynamics=0.0,
-                audio_peak=0.5, scene_density=0.0,
-            ))
-
-    # Step 4: Normalize and score
     _normalize_and_score(segments)
-
-    # Sort by score
-    segments.sort(key=lambda s: s.score, reverse=True)
-
-    if progress_callback:
-        progress_callback(1.0, "Analysis complete")
-
-    logger.info(f"Found {len(segments)} candidate segments")
-    if segments:
-        logger.info(f"Top score: {segments[0].score:.3f}, Bottom: {segments[-1].score:.3f}")
-
     return segments
 
 
@@ -427,31 +1049,18 @@ def _normalize_and_score(segments: List[VideoSegment]) -> None:
     max_scene_density = max(s.scene_density for s in segments) or 1.0
 
     for seg in segments:
-        energy_norm = seg.audio_energy / max_energy
-        dynamics_norm = seg.audio_dynamics / max_dynamics
-        peak_norm = seg.audio_peak / max_peak
-        scene_norm = seg.scene_density / max_scene_density
-
-        seg.score = (
-            dynamics_norm * 0.35
-            + peak_norm * 0.25
-            + energy_norm * 0.20
-            + scene_norm * 0.20
-        )
+        norms = {
+            "energy": seg.audio_energy / max_energy,
+            "dynamics": seg.audio_dynamics / max_dynamics,
+            "peak": seg.audio_peak / max_peak,
+            "scene": seg.scene_density / max_scene_density,
+        }
+
+        seg.score = sum(norms[metric] * weight for metric, weight in SCORE_WEIGHTS.items())
 
         # Classify segment type based on dominant metric
-        if dynamics_norm > 0.7:
-            seg.segment_type = "dramatic_moment"
-            seg.emotional_label = "dramatic"
-        elif peak_norm > 0.7:
-            seg.segment_type = "intense_peak"
-            seg.emotional_label = "intense"
-        elif scene_norm > 0.7:
-            seg.segment_type = "action_sequence"
-            seg.emotional_label = "action"
-        elif energy_norm > 0.6:
-            seg.segment_type = "high_energy"
-            seg.emotional_label = "energetic"
-        else:
-            seg.segment_type = "emotional_moment"
-            seg.emotional_label = "emotional"
+        seg.segment_type, seg.emotional_label = DEFAULT_SEGMENT_LABEL
+        for metric, threshold, segment_type, emotional_label in SEGMENT_LABELS:
+            if norms[metric] > threshold:
+                seg.segment_type, seg.emotional_label = segment_type, emotional_label
+                break
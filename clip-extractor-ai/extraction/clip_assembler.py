@@ -6,14 +6,49 @@ Extracts clips from source video and optionally compiles them together.
 import subprocess
 import json
 import os
+import shutil
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Tuple
 from loguru import logger
 
 from config import get_config
 from extraction.clip_selector import ClipPlan, ClipSegment, seconds_to_timecode
 
 
+# Encoder name -> codec name ffprobe reports for its output
+ENCODER_CODECS = {
+    "libx264": "h264",
+    "libx265": "hevc",
+}
+
+# ffprobe profile name -> encoder profile, so re-encoded heads/tails match
+# the stream-copied interior
+ENCODER_PROFILES = {
+    "libx264": {
+        "Constrained Baseline": "baseline",
+        "Baseline": "baseline",
+        "Main": "main",
+        "High": "high",
+        "High 10": "high10",
+        "High 4:2:2": "high422",
+        "High 4:4:4 Predictive": "high444",
+    },
+    "libx265": {
+        "Main": "main",
+        "Main 10": "main10",
+    },
+}
+
+# Seek nudge so input seeking lands on (not before) an exact keyframe
+KEYFRAME_EPSILON = 0.001
+
+# Extra seconds probed past a window so leading pictures of its last
+# keyframe are seen
+KEYFRAME_PROBE_PAD = 2.0
+
+
 def _run_ffmpeg(args: List[str], description: str = "") -> bool:
     """Run an FFmpeg command.
 
@@ -73,6 +108,269 @@ def _get_video_duration(video_path: str) -> float:
     return 0
 
 
+@lru_cache(maxsize=16)
+def _probe_video_stream(video_path: str) -> Optional[Dict[str, str]]:
+    """Get codec parameters of the first video stream using ffprobe.
+
+    Returns:
+        Dict with codec_name, profile, level, refs, pix_fmt, width, height,
+        sample_aspect_ratio and avg_frame_rate, or None if failed
+    """
+    try:
+        result = subprocess.run(
+            [
+                "ffprobe", "-v", "quiet", "-print_format", "json",
+                "-select_streams", "v:0",
+                "-show_entries",
+                "stream=codec_name,profile,level,refs,pix_fmt,width,height,"
+                "sample_aspect_ratio,avg_frame_rate",
+                video_path,
+            ],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        if result.returncode == 0:
+            streams = json.loads(result.stdout).get("streams", [])
+            if streams:
+                return {k: str(v) for k, v in streams[0].items()}
+    except Exception as e:
+        logger.warning(f"Could not probe video stream: {e}")
+    return None
+
+
+def _parse_frame_rate(rate: str) -> float:
+    """Parse an ffprobe rate string such as "30000/1001".
+
+    Returns:
+        Frames per second, or 0 if unknown
+    """
+    try:
+        num, _, den = rate.partition("/")
+        return float(num) / float(den or 1)
+    except (ValueError, ZeroDivisionError):
+        return 0.0
+
+
+def _get_keyframes(video_path: str, start: float, end: float) -> List[float]:
+    """Get closed-GOP keyframe timestamps of the video stream within [start, end].
+
+    Only packet headers around the window are read, so this is cheap even on
+    multi-GB sources. Keyframes followed (in decode order) by leading
+    pictures - frames shown before the keyframe, as in open-GOP streams -
+    are dropped: those frames reference the previous GOP, so a copy starting
+    or ending there would break them.
+
+    Returns:
+        Sorted keyframe times in seconds (empty if probing failed)
+    """
+    try:
+        result = subprocess.run(
+            [
+                "ffprobe", "-v", "quiet",
+                "-select_streams", "v:0",
+                "-read_intervals", f"{start:.3f}%{end + KEYFRAME_PROBE_PAD:.3f}",
+                "-show_entries", "packet=pts_time,flags",
+                "-of", "csv=p=0",
+                video_path,
+            ],
+            capture_output=True,
+            text=True,
+            timeout=120,
+        )
+        if result.returncode != 0:
+            return []
+
+        # Packets are listed in decode order: [pts, closed] per keyframe
+        keyframes = []
+        for line in result.stdout.splitlines():
+            parts = line.strip().split(",")
+            if len(parts) < 2 or parts[0] in ("", "N/A"):
+                continue
+            t = float(parts[0])
+            if "K" in parts[1]:
+                keyframes.append([t, True])
+            elif keyframes and t < keyframes[-1][0]:
+                keyframes[-1][1] = False
+
+        return sorted(t for t, closed in keyframes if closed and start <= t <= end)
+    except Exception as e:
+        logger.warning(f"Could not probe keyframes: {e}")
+        return []
+
+
+def _plan_smart_cut(
+    source_video: str,
+    start: float,
+    end: float,
+) -> Optional[Tuple[float, float]]:
+    """Find the keyframe-aligned interior of a segment that can be stream-copied.
+
+    Returns:
+        (first_keyframe, last_keyframe) bounding the copyable interior,
+        or None if the segment should simply be re-encoded
+    """
+    ffmpeg_cfg = get_config().ffmpeg
+
+    # Re-encoded head/tail must be the same codec as the copied interior
+    stream = _probe_video_stream(source_video)
+    if not stream or stream.get("codec_name") != ENCODER_CODECS.get(ffmpeg_cfg.video_codec):
+        return None
+
+    keyframes = _get_keyframes(source_video, start, end)
+    if len(keyframes) < 2:
+        return None
+
+    copy_start, copy_end = keyframes[0], keyframes[-1]
+    if copy_end - copy_start < ffmpeg_cfg.smart_cut_min_copy:
+        return None
+
+    return copy_start, copy_end
+
+
+def _matching_encoder_args(stream: Dict[str, str], encoder: str) -> List[str]:
+    """Encoder options that make a re-encoded part match the probed stream.
+
+    Profile, level, reference count, pixel format and sample aspect ratio
+    follow the source, so the head/tail decode with the same constraints as
+    the copied interior. Resolution is kept because the parts are not scaled.
+    """
+    args = []
+
+    profile = ENCODER_PROFILES.get(encoder, {}).get(stream.get("profile", ""))
+    if profile:
+        args += ["-profile:v", profile]
+
+    if encoder == "libx264":
+        level = stream.get("level", "")
+        if level.isdigit() and int(level) > 0:
+            args += ["-level", f"{int(level) // 10}.{int(level) % 10}"]
+        refs = stream.get("refs", "")
+        if refs.isdigit() and int(refs) > 0:
+            args += ["-refs", refs]
+
+    if stream.get("pix_fmt"):
+        args += ["-pix_fmt", stream["pix_fmt"]]
+
+    sar = stream.get("sample_aspect_ratio", "")
+    if sar and sar not in ("0:1", "N/A"):
+        args += ["-vf", f"setsar={sar.replace(':', '/')}"]
+
+    return args
+
+
+def _smart_cut_segment(
+    source_video: str,
+    segment: ClipSegment,
+    output_path: str,
+    copy_start: float,
+    copy_end: float,
+) -> bool:
+    """Extract a segment by stream-copying its GOP-aligned interior.
+
+    Only the partial GOPs before the first and after the last keyframe are
+    re-encoded. Video parts are written as MPEG-TS (in-band parameter sets)
+    and joined with the concat demuxer; audio is re-encoded for the whole
+    segment in the final mux, which is cheap and keeps A/V sync exact.
+
+    Args:
+        source_video: Path to source video
+        segment: ClipSegment with timecodes
+        output_path: Output file path
+        copy_start: First keyframe inside the segment
+        copy_end: Last keyframe inside the segment
+
+    Returns:
+        True if successful
+    """
+    ffmpeg_cfg = get_config().ffmpeg
+    stream = _probe_video_stream(source_video) or {}
+    start = segment.start_seconds
+    end = segment.start_seconds + segment.duration
+
+    encode_args = [
+        "-an",
+        "-c:v", ffmpeg_cfg.video_codec,
+        "-preset", ffmpeg_cfg.preset,
+        "-crf", str(ffmpeg_cfg.crf),
+        *_matching_encoder_args(stream, ffmpeg_cfg.video_codec),
+    ]
+
+    work_dir = tempfile.mkdtemp(prefix="_smartcut_", dir=str(Path(output_path).parent))
+    try:
+        parts = []
+
+        # Head: partial GOP before the first keyframe
+        if copy_start - start > KEYFRAME_EPSILON:
+            head = os.path.join(work_dir, "head.ts")
+            if not _run_ffmpeg(
+                ["-ss", f"{start:.3f}", "-i", source_video,
+                 "-t", f"{copy_start - start - KEYFRAME_EPSILON:.3f}",
+                 *encode_args, "-f", "mpegts", head],
+                f"Smart cut head {seconds_to_timecode(start)}",
+            ):
+                return False
+            parts.append(head)
+
+        # Interior: whole GOPs, copied bit-exact. Bound by packet count where
+        # possible - with stream copy, -t lets the next GOP's leading packets in
+        fps = _parse_frame_rate(stream.get("avg_frame_rate", ""))
+        if fps:
+            limit = ["-frames:v", str(round((copy_end - copy_start) * fps))]
+        else:
+            limit = ["-t", f"{copy_end - copy_start:.3f}"]
+
+        middle = os.path.join(work_dir, "middle.ts")
+        if not _run_ffmpeg(
+            ["-ss", f"{copy_start + KEYFRAME_EPSILON:.3f}", "-i", source_video,
+             *limit, "-an", "-c:v", "copy", "-f", "mpegts", middle],
+            f"Smart cut copy {seconds_to_timecode(copy_start)} → {seconds_to_timecode(copy_end)}",
+        ):
+            return False
+        parts.append(middle)
+
+        # Tail: partial GOP from the last keyframe
+        if end - copy_end > KEYFRAME_EPSILON:
+            tail = os.path.join(work_dir, "tail.ts")
+            if not _run_ffmpeg(
+                ["-ss", f"{copy_end:.3f}", "-i", source_video,
+                 "-t", f"{end - copy_end:.3f}",
+                 *encode_args, "-f", "mpegts", tail],
+                f"Smart cut tail {seconds_to_timecode(copy_end)}",
+            ):
+                return False
+            parts.append(tail)
+
+        concat_file = os.path.join(work_dir, "parts.txt")
+        with open(concat_file, "w") as f:
+            for part in parts:
+                f.write(f"file '{part}'\n")
+
+        # Join video parts and mux with the segment's audio
+        return _run_ffmpeg(
+            [
+                "-f", "concat", "-safe", "0", "-i", concat_file,
+                "-ss", f"{start:.3f}", "-t", f"{segment.duration:.3f}", "-i", source_video,
+                "-map", "0:v:0", "-map", "1:a:0?",
+                "-c:v", "copy",
+                "-c:a", ffmpeg_cfg.audio_codec,
+                "-b:a", ffmpeg_cfg.audio_bitrate,
+                "-avoid_negative_ts", "make_zero",
+                "-movflags", "+faststart",
+                output_path,
+            ],
+            f"Smart cut mux {segment.timecode_start} → {segment.timecode_end}",
+        )
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def _can_stream_copy(video_files: List[str]) -> bool:
+    """Check whether files share video codec parameters so concat can stream-copy."""
+    params = [_probe_video_stream(f) for f in video_files]
+    return all(p is not None for p in params) and all(p == params[0] for p in params)
+
+
 def extract_segment(
     source_video: str,
     segment: ClipSegment,
@@ -80,6 +378,11 @@ def extract_segment(
 ) -> bool:
     """Extract a single segment from the source video.
 
+    With smart cut enabled, the keyframe-aligned interior is stream-copied
+    and only the partial GOPs at either end are re-encoded; otherwise (or
+    if the source codec differs from the output codec) the whole segment
+    is re-encoded.
+
     Args:
         source_video: Path to source video
         segment: ClipSegment with timecodes
@@ -91,6 +394,16 @@ def extract_segment(
     config = get_config()
     ffmpeg_cfg = config.ffmpeg
 
+    if ffmpeg_cfg.smart_cut:
+        bounds = _plan_smart_cut(
+            source_video, segment.start_seconds,
+            segment.start_seconds + segment.duration,
+        )
+        if bounds and _smart_cut_segment(source_video, segment, output_path, *bounds):
+            return True
+        if bounds:
+            logger.warning("Smart cut failed, re-encoding segment")
+
     args = [
         "-ss", str(segment.start_seconds),
         "-i", source_video,
@@ -116,7 +429,9 @@ def concat_segments(
 ) -> bool:
     """Concatenate multiple video segments into one clip.
 
-    Uses FFmpeg concat demuxer for lossless concatenation.
+    Uses FFmpeg concat demuxer. When smart cut is enabled and all inputs
+    share codec parameters, streams are copied losslessly; otherwise they
+    are re-encoded.
 
     Args:
         segment_files: List of segment file paths
@@ -127,7 +442,6 @@ def concat_segments(
     """
     if len(segment_files) == 1:
         # Just copy the single file
-        import shutil
         shutil.copy2(segment_files[0], output_path)
         return True
 
@@ -140,19 +454,32 @@ def concat_segments(
         for seg_file in segment_files:
             f.write(f"file '{seg_file}'\n")
 
-    args = [
-        "-f", "concat",
-        "-safe", "0",
-        "-i", concat_file,
-        "-c:v", ffmpeg_cfg.video_codec,
-        "-preset", ffmpeg_cfg.preset,
-        "-crf", str(ffmpeg_cfg.crf),
-        "-c:a", ffmpeg_cfg.audio_codec,
-        "-b:a", ffmpeg_cfg.audio_bitrate,
-        output_path,
-    ]
+    success = False
+    if ffmpeg_cfg.smart_cut and _can_stream_copy(segment_files):
+        success = _run_ffmpeg(
+            [
+                "-f", "concat", "-safe", "0", "-i", concat_file,
+                "-c", "copy",
+                "-movflags", "+faststart",
+                output_path,
+            ],
+            f"Concatenate {len(segment_files)} segments (stream copy)",
+        )
 
-    success = _run_ffmpeg(args, f"Concatenate {len(segment_files)} segments")
+    if not success:
+        args = [
+            "-f", "concat",
+            "-safe", "0",
+            "-i", concat_file,
+            "-c:v", ffmpeg_cfg.video_codec,
+            "-preset", ffmpeg_cfg.preset,
+            "-crf", str(ffmpeg_cfg.crf),
+            "-c:a", ffmpeg_cfg.audio_codec,
+            "-b:a", ffmpeg_cfg.audio_bitrate,
+            output_path,
+        ]
+
+        success = _run_ffmpeg(args, f"Concatenate {len(segment_files)} segments")
 
     # Cleanup concat file
     try:
@@ -217,7 +544,6 @@ def extract_clip(
         if not success:
             logger.error(f"Failed to extract segment {i} for {clip_plan.clip_id}")
             # Cleanup
-            import shutil
             shutil.rmtree(temp_dir, ignore_errors=True)
             return None
 
@@ -230,7 +556,6 @@ def extract_clip(
     success = concat_segments(segment_files, clip_output)
 
     # Cleanup temp segments
-    import shutil
     shutil.rmtree(temp_dir, ignore_errors=True)
 
     if progress_callback:
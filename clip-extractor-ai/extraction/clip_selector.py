@@ -3,12 +3,19 @@
 Analyzes video using FFmpeg scene detection and audio energy analysis
 to find the most emotional/high-energy moments for clip extraction.
 No narrative required - pure video-based emotion detection.
+
+By default clips are chosen jointly: candidate clips of every length between
+the min and max clip duration are scored at every start offset, and the
+highest-scoring set of clips that keep the minimum gap is found exactly with
+weighted interval scheduling (dynamic programming over candidates sorted by
+end time).
 """
 
 from dataclasses import dataclass, field
 from typing import List, Optional, Callable
 from loguru import logger
 
+from config import get_config
 from config.constants import (
     DEFAULT_MIN_CLIP_DURATION,
     DEFAULT_MAX_CLIP_DURATION,
@@ -16,11 +23,19 @@ from config.constants import (
     DEFAULT_SEGMENT_MAX_DURATION,
 )
 from core.video_analyzer import (
+    HAS_NUMPY,
+    SceneChange,
     VideoSegment,
+    analyze_video_signals,
     find_emotional_segments,
     get_video_duration,
+    score_clip_candidates,
+    segments_from_columns,
 )
 
+if HAS_NUMPY:
+    import numpy as np
+
 
 @dataclass
 class ClipSegment:
@@ -100,6 +115,108 @@ def _select_non_overlapping(
     return selected
 
 
+def _select_weighted_intervals(
+    starts: "np.ndarray",
+    ends: "np.ndarray",
+    weights: "np.ndarray",
+    num_clips: int,
+    min_gap: float = 30.0,
+) -> List[int]:
+    """Pick at most num_clips intervals with the highest total weight.
+
+    Chosen intervals keep ``next.start >= prev.end + min_gap``. Classic
+    weighted interval scheduling with a cap on the count: with candidates
+    sorted by end, best[c][j] is the best total using at most c of the
+    first j candidates, and
+
+        best[c][j] = max(best[c][j-1], best[c-1][p(j)] + w(j))
+
+    where p(j) counts the candidates that end at least min_gap before
+    candidate j starts. Each row is one vectorized running maximum, so the
+    whole table costs O(num_clips * n) after an O(n log n) sort.
+
+    Returns:
+        Indices into the input arrays of the chosen intervals
+    """
+    n = len(starts)
+    if n == 0 or num_clips <= 0:
+        return []
+
+    order = np.argsort(ends, kind="stable")
+    s, e = starts[order], ends[order]
+    # Tiny per-clip bonus so zero-score clips still count toward num_clips
+    w = weights[order] + 1e-9
+    p = np.searchsorted(e + min_gap, s, side="right")
+
+    best = [np.zeros(n + 1)]
+    for _ in range(num_clips):
+        take = best[-1][p] + w
+        best.append(np.concatenate([[0.0], np.maximum.accumulate(take)]))
+
+    # Backtrack: the first prefix reaching the optimum ends with a taken clip
+    picked = []
+    j, c = n, num_clips
+    while c > 0 and j > 0 and best[c][j] > 0:
+        first = int(np.argmax(best[c][:j + 1] >= best[c][j]))
+        picked.append(int(order[first - 1]))
+        j, c = int(p[first - 1]), c - 1
+
+    return picked
+
+
+def _select_optimal_clips(
+    video_path: str,
+    num_clips: int,
+    min_clip_duration: int,
+    max_clip_duration: int,
+    min_gap: float,
+    progress_callback: Optional[Callable[[float, str], None]] = None,
+    scenes: Optional[List[SceneChange]] = None,
+) -> List[VideoSegment]:
+    """Select the best-scoring set of non-overlapping clips of any allowed length.
+
+    Returns:
+        Selected clips as VideoSegments spanning the exact clip bounds
+    """
+    config = get_config().clip
+    signals = analyze_video_signals(
+        video_path, scene_threshold=0.3, progress_callback=progress_callback,
+        scenes=scenes,
+    )
+
+    if progress_callback:
+        progress_callback(0.8, "Scoring candidate clips")
+
+    step = max(1, int(config.length_step))
+    lengths = list(range(min_clip_duration, max_clip_duration, step)) + [max_clip_duration]
+    columns = score_clip_candidates(signals, lengths, config.start_step)
+    logger.info(
+        f"Scored {len(columns['start'])} candidate clips "
+        f"({len(lengths)} lengths, {config.start_step:g}s stride)"
+    )
+
+    picked = _select_weighted_intervals(
+        columns["start"], columns["end"], columns["score"], num_clips, min_gap,
+    )
+
+    if progress_callback:
+        progress_callback(1.0, "Analysis complete")
+
+    return segments_from_columns(columns, picked)
+
+
+def _segment_to_clip(segment: VideoSegment) -> List[ClipSegment]:
+    """Use a selected clip-length segment as-is."""
+    return [ClipSegment(
+        timecode_start=seconds_to_timecode(segment.start),
+        timecode_end=seconds_to_timecode(segment.end),
+        start_seconds=segment.start,
+        end_seconds=segment.end,
+        duration=segment.duration,
+        source_beat_order=0,
+    )]
+
+
 def _expand_segment_to_clip(
     segment: VideoSegment,
     video_duration: float,
@@ -145,10 +262,16 @@ def select_clips(
     segment_min_duration: int = DEFAULT_SEGMENT_MIN_DURATION,
     segment_max_duration: int = DEFAULT_SEGMENT_MAX_DURATION,
     progress_callback: Optional[Callable[[float, str], None]] = None,
+    scenes: Optional[List[SceneChange]] = None,
 ) -> List[ClipPlan]:
     """Select best clips from video based on emotional analysis.
 
-    Algorithm:
+    Algorithm ("optimal" selection mode, the default):
+    1. Analyze video using scene detection + audio energy
+    2. Score candidate clips of every allowed length at every start offset
+    3. Pick the highest-scoring set of N clips that keep the minimum gap
+
+    Algorithm ("greedy" selection mode, or without NumPy):
     1. Analyze video using scene detection + audio energy
     2. Score analysis windows by emotional intensity
     3. Select top N non-overlapping segments
@@ -162,6 +285,8 @@ def select_clips(
         segment_min_duration: Min segment duration (unused in emotion mode)
         segment_max_duration: Max segment duration (unused in emotion mode)
         progress_callback: Progress callback (progress, message)
+        scenes: Scene changes detected beforehand, e.g. during the download
+            (skips scene detection)
 
     Returns:
         List of ClipPlan objects with extraction details
@@ -173,33 +298,47 @@ def select_clips(
 
     logger.info(f"Analyzing video for emotional moments ({video_duration:.0f}s)...")
 
-    # Analysis window size: larger for longer videos
-    if video_duration > 3600:  # > 1 hour
-        analysis_window = 30.0
-    elif video_duration > 1800:  # > 30 min
-        analysis_window = 20.0
-    else:
-        analysis_window = 15.0
-
-    # Find emotional segments
-    emotional_segments = find_emotional_segments(
-        video_path,
-        analysis_window_size=analysis_window,
-        scene_threshold=0.3,
-        progress_callback=progress_callback,
-    )
-
-    if not emotional_segments:
-        logger.error("No emotional segments found in video")
-        return []
-
-    # Select top N non-overlapping segments
     # Min gap between clips: at least the clip duration to avoid overlap
     min_gap = max(min_clip_duration, 60.0)
-    selected_segments = _select_non_overlapping(
-        emotional_segments, num_clips, min_gap=min_gap,
+
+    optimal = (
+        get_config().clip.selection_mode == "optimal"
+        and HAS_NUMPY
+        and video_duration >= min_clip_duration
     )
 
+    if optimal:
+        selected_segments = _select_optimal_clips(
+            video_path, num_clips, min_clip_duration, max_clip_duration,
+            min_gap, progress_callback, scenes,
+        )
+    else:
+        # Analysis window size: larger for longer videos
+        if video_duration > 3600:  # > 1 hour
+            analysis_window = 30.0
+        elif video_duration > 1800:  # > 30 min
+            analysis_window = 20.0
+        else:
+            analysis_window = 15.0
+
+        # Find emotional segments
+        emotional_segments = find_emotional_segments(
+            video_path,
+            analysis_window_size=analysis_window,
+            scene_threshold=0.3,
+            progress_callback=progress_callback,
+            scenes=scenes,
+        )
+
+        if not emotional_segments:
+            logger.error("No emotional segments found in video")
+            return []
+
+        # Select top N non-overlapping segments
+        selected_segments = _select_non_overlapping(
+            emotional_segments, num_clips, min_gap=min_gap,
+        )
+
     if not selected_segments:
         logger.error("Could not select non-overlapping segments")
         return []
@@ -215,18 +354,22 @@ def select_clips(
             f"emotion={seg.emotional_label})"
         )
 
-    # Create clip plans by expanding segments to full clip duration
+    # Create clip plans (greedy mode expands segments to full clip duration)
     clip_plans = []
     for idx, segment in enumerate(selected_segments):
         clip_num = idx + 1
         clip_id = f"clip_{clip_num:03d}"
         clip_name = f"{clip_id}_{segment.segment_type}"
 
-        # Expand analysis window to full clip duration
-        clip_segments = _expand_segment_to_clip(
-            segment, video_duration,
-            min_clip_duration, max_clip_duration,
-        )
+        if optimal:
+            # Candidates already have clip length
+            clip_segments = _segment_to_clip(segment)
+        else:
+            # Expand analysis window to full clip duration
+            clip_segments = _expand_segment_to_clip(
+                segment, video_duration,
+                min_clip_duration, max_clip_duration,
+            )
 
         # Update source_beat_order to clip number
         for cs in clip_segments:
@@ -82,7 +82,13 @@ def main():
     # Import after payload parsing (so errors are clearer)
     from config.config import get_config
     from core.progress import ProgressReporter, ProcessingStage
-    from core.storage import StorageHandler
+    from config.constants import (
+        SCENE_DETECTION_THRESHOLD,
+        VIDEO_DOWNLOAD_PROGRESSIVE,
+        VIDEO_DOWNLOAD_PROGRESSIVE_PROBE,
+    )
+    from core.storage import StorageHandler, RangeNotSupportedError
+    from core.video_analyzer import detect_scenes, get_video_duration
     from extraction.clip_selector import select_clips
     from extraction.clip_assembler import extract_all_clips
 
@@ -151,7 +157,44 @@ def main():
                 p,
             )
 
-        storage.download_video_from_url(video_url, source_video, download_progress)
+        download = None
+        if VIDEO_DOWNLOAD_PROGRESSIVE:
+            download = storage.start_video_download(video_url, source_video, download_progress)
+
+        early_scenes = None
+        if download is None:
+            storage.download_video_from_url(video_url, source_video, download_progress)
+        else:
+            # Detect scenes on the growing file while the rest downloads. Needs
+            # the container index at the start of the file (e.g. faststart MP4).
+            download.wait_for_bytes(VIDEO_DOWNLOAD_PROGRESSIVE_PROBE)
+            prefix_duration = get_video_duration(source_video) if not download.done else 0.0
+            if prefix_duration > 0:
+                logger.info("Detecting scenes on the downloaded prefix during download")
+                scene_progress = [0.0]
+
+                def on_scene_progress(p):
+                    scene_progress[0] = p
+
+                early_scenes = detect_scenes(
+                    source_video,
+                    threshold=SCENE_DETECTION_THRESHOLD,
+                    progress_callback=on_scene_progress,
+                    duration=prefix_duration,
+                    follow=True,
+                )
+                if scene_progress[0] < 1.0:
+                    logger.warning("Scene detection during download was incomplete, rerunning after download")
+                    early_scenes = None
+            try:
+                download.wait()
+            except RangeNotSupportedError as e:
+                # Server advertised ranges but answered 200: the prefix (and any
+                # scenes detected on it) cannot be trusted, start over
+                logger.warning(f"Ranged download not possible ({e}), using a single stream")
+                early_scenes = None
+                storage.download_video_from_url(video_url, source_video, download_progress)
+
         video_size = Path(source_video).stat().st_size
         logger.info(f"Video downloaded: {video_size / (1024*1024):.1f} MB")
 
@@ -173,6 +216,7 @@ def main():
             segment_min_duration=config.clip.segment_min_duration,
             segment_max_duration=config.clip.segment_max_duration,
             progress_callback=analysis_progress,
+            scenes=early_scenes,
         )
 
         if not clip_plans:
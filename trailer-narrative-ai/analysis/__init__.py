@@ -3,11 +3,15 @@
 from .scene_detector import SceneDetector, DetectedScene
 from .audio_analyzer import AudioAnalyzer, AudioAnalysis
 from .visual_analyzer import VisualAnalyzer, VisualAnalysis
+from .frame_stream import SharedFrameDecoder, SampledFrame
+from .pcm_audio import PCMAudio, load_pcm, release_pcm
 from .content_understanding import ContentAnalyzer, SceneUnderstanding
 
 __all__ = [
     "SceneDetector", "DetectedScene",
     "AudioAnalyzer", "AudioAnalysis",
     "VisualAnalyzer", "VisualAnalysis",
+    "SharedFrameDecoder", "SampledFrame",
+    "PCMAudio", "load_pcm", "release_pcm",
     "ContentAnalyzer", "SceneUnderstanding"
 ]
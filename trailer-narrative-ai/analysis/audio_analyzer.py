@@ -33,7 +33,9 @@ try:
 except ImportError:
     HAS_TORCH = False
 
+from core.interval_index import IntervalIndex
 from input.subtitle_parser import SubtitleParser, ParsedSubtitles, SubtitleSegment
+from .pcm_audio import PCMAudio, load_pcm, detect_silent_ranges
 
 
 # =============================================================================
@@ -285,6 +287,7 @@ class AudioAnalysis:
     dialect_confidence: float = 0.0
     music_segments: List[Dict[str, float]] = field(default_factory=list)
     silence_segments: List[Dict[str, float]] = field(default_factory=list)
+    _segment_index: Optional[IntervalIndex] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def full_transcript(self) -> str:
@@ -312,17 +315,18 @@ class AudioAnalysis:
 
     def get_text_at_time(self, timestamp: float, tolerance: float = 0.5) -> Optional[str]:
         """Get transcript text at a specific timestamp."""
-        for segment in self.segments:
-            if segment.start_time - tolerance <= timestamp <= segment.end_time + tolerance:
-                return segment.text
-        return None
+        segment = self._index().at(timestamp, tolerance)
+        return segment.text if segment else None
 
     def get_segments_in_range(self, start: float, end: float) -> List[TranscriptSegment]:
         """Get all segments within a time range."""
-        return [
-            s for s in self.segments
-            if s.start_time < end and s.end_time > start
-        ]
+        return self._index().overlapping(start, end)
+
+    def _index(self) -> IntervalIndex:
+        """Segment index, built once (rebuilt only if the segment list is replaced)."""
+        if self._segment_index is None or not self._segment_index.is_built_from(self.segments):
+            self._segment_index = IntervalIndex(self.segments)
+        return self._segment_index
 
 
 def detect_dialect(text: str) -> tuple:
@@ -373,7 +377,8 @@ class AudioAnalyzer:
         self,
         whisper_model: str = "medium",
         device: Optional[str] = None,
-        language: Optional[str] = None
+        language: Optional[str] = None,
+        work_dir: Optional[Path] = None
     ):
         """Initialize audio analyzer.
 
@@ -381,8 +386,11 @@ class AudioAnalyzer:
             whisper_model: Whisper model size (tiny, base, small, medium, large)
             device: Device for inference (cuda, cpu, or auto)
             language: Language hint (None = auto-detect, recommended for dialects)
+            work_dir: Job directory for decoded PCM (shared with ASR, freed by
+                release_pcm)
         """
         self.whisper_model_name = whisper_model
+        self.work_dir = work_dir
         # For regional dialects, AUTO-DETECT is best (don't force language)
         # Whisper will transcribe Haryanvi/Bhojpuri/Rajasthani as Hindi-like text
         self.language = language  # None = auto-detect
@@ -649,41 +657,38 @@ class AudioAnalyzer:
 
     def detect_silence(
         self,
-        audio_path: Union[str, Path],
+        audio_path: Union[str, Path, PCMAudio],
         threshold_db: float = -40,
         min_duration: float = 0.5
     ) -> List[Dict[str, float]]:
         """Detect silence segments in audio.
 
+        Works on the shared decoded PCM buffer, so audio already decoded for
+        ASR is not decoded again.
+
         Args:
-            audio_path: Path to audio file
+            audio_path: Path to audio/video file, or an already decoded PCMAudio
             threshold_db: Silence threshold in dB
             min_duration: Minimum silence duration in seconds
 
         Returns:
             List of silence segments with start/end times
         """
+        logger.info(f"Detecting silence in: {getattr(audio_path, 'path', audio_path)}")
+
         try:
-            from pydub import AudioSegment
-            from pydub.silence import detect_silence as pydub_detect_silence
-        except ImportError:
-            logger.warning("pydub not available for silence detection")
+            if isinstance(audio_path, PCMAudio):
+                pcm = audio_path
+            else:
+                pcm = load_pcm(audio_path, work_dir=self.work_dir)
+        except RuntimeError as e:
+            logger.warning(f"Could not decode audio for silence detection: {e}")
             return []
 
-        logger.info(f"Detecting silence in: {audio_path}")
-
-        audio = AudioSegment.from_file(str(audio_path))
-
-        # Detect silence (returns list of [start_ms, end_ms])
-        silence_ranges = pydub_detect_silence(
-            audio,
-            min_silence_len=int(min_duration * 1000),
-            silence_thresh=threshold_db
-        )
+        silence_ranges = detect_silent_ranges(pcm, threshold_db, min_duration)
 
-        # Convert to seconds
         silence_segments = [
-            {"start": start / 1000, "end": end / 1000, "duration": (end - start) / 1000}
+            {"start": start, "end": end, "duration": end - start}
             for start, end in silence_ranges
         ]
 
@@ -10,6 +10,7 @@ import re
 from loguru import logger
 
 from config import get_config
+from core.interval_index import IntervalIndex
 
 
 @dataclass
@@ -215,6 +216,7 @@ class ContentAnalyzer:
         """Initialize analyzer."""
         self.config = get_config()
         self._video_duration = 0
+        self._transcript_index: Optional[IntervalIndex] = None
         logger.info("ContentAnalyzer initialized - Fast mode")
 
     def analyze_scenes(
@@ -277,16 +279,19 @@ class ContentAnalyzer:
         segments: List[Dict]
     ) -> str:
         """Get transcript text for a scene."""
-        texts = []
-        for seg in segments:
-            seg_start = seg.get("start_time", seg.get("start", 0))
-            seg_end = seg.get("end_time", seg.get("end", 0))
+        # Index the segments once; every scene of a run queries the same list
+        if self._transcript_index is None or not self._transcript_index.is_built_from(segments):
+            self._transcript_index = IntervalIndex(
+                segments,
+                start=lambda seg: seg.get("start_time", seg.get("start", 0)),
+                end=lambda seg: seg.get("end_time", seg.get("end", 0))
+            )
 
-            # Check overlap
-            if seg_start < end and seg_end > start:
-                text = seg.get("text", "")
-                if text:
-                    texts.append(text.strip())
+        texts = []
+        for seg in self._transcript_index.overlapping(start, end):
+            text = seg.get("text", "")
+            if text:
+                texts.append(text.strip())
 
         return " ".join(texts)
 
@@ -552,7 +557,7 @@ class ContentAnalyzer:
 
         # Import LLM helper
         try:
-            from analysis.llm_helper import rank_scenes_for_trailer, pick_best_quote
+            from analysis.llm_helper import rank_scenes_for_trailer, pick_best_quotes
             use_llm = True
         except ImportError:
             use_llm = False
@@ -574,13 +579,13 @@ class ContentAnalyzer:
             # LLM ranking
             ranked_dicts = rank_scenes_for_trailer(scene_dicts, top_n)
 
-            # Enhance quotes with LLM
-            for d in ranked_dicts[:10]:  # Top 10 only
-                if d.get("dialogue"):
-                    better_quote = pick_best_quote(d["dialogue"])
-                    if better_quote:
-                        d["scene_obj"].key_quote = better_quote
-                        d["scene_obj"].dialogue_highlight = better_quote
+            # Enhance quotes with LLM (top 10 only, one batched call)
+            with_dialogue = [d for d in ranked_dicts[:10] if d.get("dialogue")]
+            better_quotes = pick_best_quotes([d["dialogue"] for d in with_dialogue])
+            for d, better_quote in zip(with_dialogue, better_quotes):
+                if better_quote:
+                    d["scene_obj"].key_quote = better_quote
+                    d["scene_obj"].dialogue_highlight = better_quote
 
             return [d["scene_obj"] for d in ranked_dicts]
         else:
@@ -0,0 +1,385 @@
+"""Shared single-pass frame decoding for scene detection and visual analysis.
+
+The video is decoded exactly once at a reduced analysis resolution. Every
+frame is fed to the PySceneDetect detectors, while a bounded per-scene buffer
+keeps an evenly spaced subset of frames. When a cut closes a scene, the
+frames closest to the usual per-scene sample times are handed to a callback
+(typically VisualAnalyzer), so no second decode or random seeking is needed.
+A fade-span detector runs on the same frames to mark fade transitions.
+
+The shared pass is always a single sequential decode. use_shared_decode
+decides, per video, whether it or SceneDetector.detect's own mode
+(coarse-to-fine, sharded) takes precedence.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple, Union
+import numpy as np
+from loguru import logger
+
+try:
+    import cv2
+    HAS_CV2 = True
+except ImportError:
+    HAS_CV2 = False
+
+try:
+    import inspect
+    from scenedetect import ContentDetector, FrameTimecode
+    # PySceneDetect >= 0.7 passes FrameTimecode positions to detectors
+    TIMECODE_DETECTOR_API = "timecode" in inspect.signature(ContentDetector.process_frame).parameters
+except ImportError:
+    TIMECODE_DETECTOR_API = False
+
+from config import get_config
+from .scene_detector import SceneDetector, DetectedScene, SceneDetectionResult, mark_fades
+
+
+# Frame width PySceneDetect downscales to by default before detection
+DETECTION_TARGET_WIDTH = 256
+
+
+@dataclass
+class SampledFrame:
+    """A decoded frame kept for per-scene visual analysis."""
+    timestamp: float  # seconds
+    frame_number: int
+    image: np.ndarray  # BGR frame at analysis resolution
+
+
+class _SceneFrameBuffer:
+    """Evenly spaced frame buffer for the currently open scene.
+
+    Keeps every ``stride``-th frame. When the buffer overflows, every other
+    frame is dropped and the stride doubles, so coverage of the scene stays
+    uniform while memory stays bounded regardless of scene length.
+    """
+
+    def __init__(self, max_frames: int):
+        self.max_frames = max(2, max_frames)
+        self.frames: List[SampledFrame] = []
+        self.stride = 1
+        self._offered = 0
+
+    def offer(self, frame_number: int, timestamp: float, image: np.ndarray) -> None:
+        """Offer a decoded frame; it is kept only if it falls on the stride."""
+        if self._offered % self.stride == 0:
+            self.frames.append(SampledFrame(timestamp, frame_number, image))
+            if len(self.frames) > self.max_frames:
+                self.frames = self.frames[::2]
+                self.stride *= 2
+        self._offered += 1
+
+    def split(self, cut_frame: int) -> List[SampledFrame]:
+        """Close the scene at ``cut_frame`` and return its frames.
+
+        Frames at or after the cut (detectors may report a cut a few frames
+        late) are carried over to start the next scene's buffer.
+        """
+        closed = [f for f in self.frames if f.frame_number < cut_frame]
+        carried = [f for f in self.frames if f.frame_number >= cut_frame]
+        self.frames = carried
+        self.stride = 1
+        self._offered = len(carried)
+        return closed
+
+
+def select_scene_samples(
+    frames: List[SampledFrame],
+    start_time: float,
+    end_time: float,
+    count: int
+) -> List[SampledFrame]:
+    """Pick the buffered frames closest to the standard per-scene sample times.
+
+    Uses the same evenly spaced interior points as VisualAnalyzer.analyze_scene.
+
+    Args:
+        frames: Buffered frames of the scene (ordered by time)
+        start_time: Scene start in seconds
+        end_time: Scene end in seconds
+        count: Number of samples wanted
+
+    Returns:
+        Up to ``count`` distinct frames in time order
+    """
+    if not frames or count <= 0 or end_time <= start_time:
+        return []
+
+    timestamps = np.array([f.timestamp for f in frames])
+    targets = np.linspace(start_time, end_time, count + 2)[1:-1]
+
+    chosen = []
+    seen = set()
+    for target in targets:
+        idx = int(np.argmin(np.abs(timestamps - target)))
+        if idx not in seen:
+            seen.add(idx)
+            chosen.append(idx)
+
+    return [frames[i] for i in sorted(chosen)]
+
+
+def use_shared_decode(
+    video_path: Union[str, Path],
+    scene_detector: SceneDetector,
+    method: str = "content"
+) -> bool:
+    """Decide whether scene + visual analysis should share one decode pass.
+
+    Follows VisualConfig.shared_decode and shared_decode_precedence: with
+    "detector" precedence the shared pass is used only when SceneDetector
+    would decode the video in a single sequential pass anyway.
+
+    Args:
+        video_path: Path to video file
+        scene_detector: SceneDetector that would run otherwise
+        method: Scene detection method
+
+    Returns:
+        True to use run_shared_analysis, False for separate detect + visual stages
+    """
+    visual = get_config().visual
+    if not visual.shared_decode:
+        return False
+    if visual.shared_decode_precedence == "shared":
+        return True
+
+    try:
+        plan = scene_detector.plan(video_path, method)
+    except Exception as e:
+        logger.warning(f"Could not plan scene detection ({e}), using shared decode")
+        return True
+
+    if plan != "single_pass":
+        logger.info(f"Scene detection runs {plan}; visual analysis samples frames separately")
+        return False
+    return True
+
+
+def _detector_position(frame_number: int, fps: float):
+    """Frame position in the form the installed PySceneDetect expects."""
+    if TIMECODE_DETECTOR_API:
+        return FrameTimecode(frame_number, fps)
+    return frame_number
+
+
+def _cut_frames(cuts) -> List[int]:
+    """Normalize detector cut positions (ints or FrameTimecodes) to frame numbers."""
+    return sorted({c.frame_num if hasattr(c, "frame_num") else int(c) for c in cuts})
+
+
+class SharedFrameDecoder:
+    """Decode a video once and drive scene detection plus frame sampling."""
+
+    def __init__(
+        self,
+        analysis_width: int = 640,
+        frames_per_scene: int = 3,
+        max_buffered_frames: int = 48
+    ):
+        """Initialize shared decoder.
+
+        Args:
+            analysis_width: Width frames are downscaled to for analysis
+            frames_per_scene: Frames handed to the consumer per scene
+            max_buffered_frames: Max frames buffered for the open scene
+        """
+        if not HAS_CV2:
+            raise ImportError("OpenCV is required. Install with: pip install opencv-python")
+
+        self.analysis_width = analysis_width
+        self.frames_per_scene = frames_per_scene
+        self.max_buffered_frames = max_buffered_frames
+
+    def run(
+        self,
+        video_path: Union[str, Path],
+        scene_detector: SceneDetector,
+        on_scene: Optional[Callable[[DetectedScene, List[SampledFrame]], None]] = None,
+        method: str = "content",
+        progress_callback: Optional[Callable[[float], None]] = None
+    ) -> SceneDetectionResult:
+        """Decode the video once, detecting cuts and sampling scene frames.
+
+        Args:
+            video_path: Path to video file
+            scene_detector: SceneDetector providing thresholds and detectors
+            on_scene: Called with each closed scene and its sampled frames
+            method: Scene detection method (see SceneDetector.detect)
+            progress_callback: Optional callback(progress 0.0-1.0)
+
+        Returns:
+            SceneDetectionResult in the same format as SceneDetector.detect
+        """
+        video_path = Path(video_path)
+        logger.info(f"Shared decode pass: {video_path} (width: {self.analysis_width}px)")
+
+        cap = cv2.VideoCapture(str(video_path))
+        if not cap.isOpened():
+            raise RuntimeError(f"Could not open video: {video_path}")
+
+        fps = cap.get(cv2.CAP_PROP_FPS) or 25.0
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        detectors = scene_detector.create_detectors(method, fps)
+        fade_detector = scene_detector.create_fade_detector(fps)
+
+        buffer = _SceneFrameBuffer(self.max_buffered_frames)
+        scenes: List[DetectedScene] = []
+        scene_start = 0
+        frame_number = 0
+        report_every = max(1, int(fps * 30))
+
+        def close_scene(cut_frame: int) -> None:
+            nonlocal scene_start
+            if cut_frame <= scene_start:
+                return
+            scene = DetectedScene(
+                id=f"scene_{len(scenes)+1:04d}",
+                start_time=scene_start / fps,
+                end_time=cut_frame / fps,
+                start_frame=scene_start,
+                end_frame=cut_frame,
+                transition_type="cut"
+            )
+            scenes.append(scene)
+            closed = buffer.split(cut_frame)
+            if on_scene is not None:
+                samples = select_scene_samples(
+                    closed, scene.start_time, scene.end_time, self.frames_per_scene
+                )
+                on_scene(scene, samples)
+            scene_start = cut_frame
+
+        try:
+            while True:
+                ret, frame = cap.read()
+                if not ret:
+                    break
+
+                analysis_frame, detection_frame = self._downscale(frame)
+                buffer.offer(frame_number, frame_number / fps, analysis_frame)
+
+                cuts = []
+                for detector in detectors:
+                    cuts.extend(detector.process_frame(
+                        _detector_position(frame_number, fps), detection_frame
+                    ))
+                for cut in _cut_frames(cuts):
+                    close_scene(cut)
+                fade_detector.process_frame(
+                    _detector_position(frame_number, fps), detection_frame
+                )
+
+                frame_number += 1
+                if progress_callback and total_frames and frame_number % report_every == 0:
+                    progress_callback(min(1.0, frame_number / total_frames))
+        finally:
+            cap.release()
+
+        # Flush cuts that detectors only emit once the stream has ended
+        cuts = []
+        for detector in detectors:
+            if hasattr(detector, "post_process"):
+                cuts.extend(detector.post_process(_detector_position(frame_number, fps)) or [])
+        for cut in _cut_frames(cuts):
+            close_scene(cut)
+        fade_detector.post_process(_detector_position(frame_number, fps))
+
+        # Mirror SceneManager: no cuts means no scene list
+        if scenes:
+            close_scene(frame_number)
+
+        if progress_callback:
+            progress_callback(1.0)
+
+        # Transition types are only known after the pass (a fade-in ends after its cut)
+        fades = mark_fades(scenes, fade_detector.fade_spans, fps)
+
+        duration = frame_number / fps
+        logger.info(
+            f"Shared decode complete: {frame_number} frames, {len(scenes)} scenes, {fades} fades "
+            f"(avg duration: {duration/len(scenes) if scenes else 0:.2f}s)"
+        )
+
+        return SceneDetectionResult(
+            scenes=scenes,
+            video_duration=duration,
+            video_fps=fps,
+            total_frames=frame_number
+        )
+
+    def _downscale(self, frame: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Produce the analysis frame and the (smaller) detection frame."""
+        height, width = frame.shape[:2]
+
+        if width > self.analysis_width:
+            scale = self.analysis_width / width
+            analysis = cv2.resize(
+                frame, (self.analysis_width, max(1, int(height * scale))),
+                interpolation=cv2.INTER_AREA
+            )
+        else:
+            analysis = frame
+
+        a_height, a_width = analysis.shape[:2]
+        factor = a_width // DETECTION_TARGET_WIDTH
+        if factor > 1:
+            detection = cv2.resize(
+                analysis, (a_width // factor, max(1, a_height // factor)),
+                interpolation=cv2.INTER_AREA
+            )
+        else:
+            detection = analysis
+
+        return analysis, detection
+
+
+def run_shared_analysis(
+    video_path: Union[str, Path],
+    scene_detector: SceneDetector,
+    visual_analyzer,
+    analysis_width: int = 640,
+    max_buffered_frames: int = 48,
+    progress_callback: Optional[Callable[[float], None]] = None
+):
+    """Run scene detection and visual analysis in one decode pass.
+
+    Args:
+        video_path: Path to video file
+        scene_detector: Configured SceneDetector
+        visual_analyzer: Configured VisualAnalyzer
+        analysis_width: Width frames are downscaled to
+        max_buffered_frames: Max frames buffered per open scene
+        progress_callback: Optional callback(progress 0.0-1.0)
+
+    Returns:
+        Tuple of (SceneDetectionResult, VisualAnalysis)
+    """
+    from .visual_analyzer import VisualAnalysis
+
+    visual_analyzer._load_clip_model()
+
+    batcher = visual_analyzer.scene_batcher()
+
+    def on_scene(scene: DetectedScene, samples: List[SampledFrame]) -> None:
+        batcher.add(scene.id, scene.start_time, scene.end_time, samples)
+
+    decoder = SharedFrameDecoder(
+        analysis_width=analysis_width,
+        frames_per_scene=visual_analyzer.frames_per_scene,
+        max_buffered_frames=max_buffered_frames
+    )
+    scene_result = decoder.run(
+        video_path, scene_detector, on_scene=on_scene,
+        progress_callback=progress_callback
+    )
+
+    scene_analyses = batcher.finish()
+    visual_result = VisualAnalysis(
+        video_path=str(video_path),
+        scenes=scene_analyses,
+        total_frames_analyzed=sum(len(s.frames) for s in scene_analyses)
+    )
+    return scene_result, visual_result
@@ -15,6 +15,7 @@ Models Used (Priority Order - FAST mode default):
 Set WHISPER_MODEL env var to override: small, medium, large
 """
 
+import os
 import re
 import torch
 import numpy as np
@@ -24,9 +25,13 @@ from dataclasses import dataclass, field
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from loguru import logger
 
+from core.interval_index import IntervalIndex
+from core.model_registry import ModelHandle, get_model_registry
+from .pcm_audio import load_pcm, open_pcm
+from .vad import detect_speech_regions, plan_speech_chunks
 from config.constants import (
     WHISPER_MODEL, ASR_CHUNKED, ASR_CHUNK_DURATION,
-    ASR_WORKERS, ASR_PARALLEL
+    ASR_WORKERS, ASR_PARALLEL, ASR_MEMORY_HEADROOM_GB
 )
 
 # Lazy imports for optional dependencies
@@ -133,6 +138,97 @@ SPOILER_PATTERNS = [
 ]
 
 
+
+# =============================================================================
+# PARALLEL ASR WORKER POOL
+# =============================================================================
+
+# Approximate resident memory of one Whisper model on CPU (GB)
+WHISPER_MODEL_MEMORY_GB = {"tiny": 0.5, "base": 0.5, "small": 1.5, "medium": 3, "large": 6}
+
+# Whisper model held by an ASR worker process (loaded once by _init_asr_worker)
+_worker_model = None
+
+
+def _asr_worker_count(model_size: str, num_chunks: int) -> int:
+    """Size the ASR worker pool from available RAM.
+
+    Args:
+        model_size: Whisper model size (small, medium, large, ...)
+        num_chunks: Number of chunks to transcribe
+
+    Returns:
+        Number of worker processes (1 means sequential)
+    """
+    model_mem_gb = WHISPER_MODEL_MEMORY_GB.get(model_size.split("-")[0], 3)
+    limit = ASR_WORKERS if ASR_WORKERS > 0 else (os.cpu_count() or 1)
+
+    try:
+        import psutil
+        available_gb = psutil.virtual_memory().available / (1024**3)
+    except ImportError:
+        # Without psutil only an explicit worker count is trusted
+        return max(1, min(ASR_WORKERS, num_chunks))
+
+    if available_gb < model_mem_gb + ASR_MEMORY_HEADROOM_GB:
+        logger.warning(
+            f"Low memory warning: {available_gb:.1f}GB available, model needs ~{model_mem_gb}GB. "
+            f"Consider using WHISPER_MODEL=small for lower memory usage."
+        )
+
+    by_memory = int((available_gb - ASR_MEMORY_HEADROOM_GB) // model_mem_gb)
+    workers = max(1, min(limit, by_memory, num_chunks))
+    logger.info(
+        f"ASR pool: {workers} workers ({available_gb:.1f}GB available, ~{model_mem_gb}GB per model)"
+    )
+    return workers
+
+
+def _acquire_whisper(model_size: str, device: str = "cpu") -> ModelHandle:
+    """Get a shared openai-whisper model from the model registry."""
+    import whisper
+    return get_model_registry().acquire(
+        "whisper", model_size,
+        lambda: whisper.load_model(model_size, device=device),
+        device=device
+    )
+
+
+def _init_asr_worker(model_size: str, num_threads: int) -> None:
+    """Process pool initializer: load the Whisper model once per worker."""
+    global _worker_model
+    import whisper
+
+    # Split cores between workers instead of each grabbing all of them
+    torch.set_num_threads(num_threads)
+    _worker_model = whisper.load_model(model_size, device="cpu")
+
+
+def _transcribe_chunk_worker(chunk_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Transcribe one audio chunk with the worker's resident model."""
+    try:
+        # Map the shared PCM buffer and build this chunk's speech audio
+        samples = open_pcm(chunk_info["pcm_path"]).samples
+        result = _worker_model.transcribe(
+            chunk_info["chunk"].assemble(samples),
+            language="hi",
+            task="transcribe",
+            verbose=False
+        )
+        return {
+            "idx": chunk_info["idx"],
+            "segments": result.get("segments", []),
+            "success": True
+        }
+    except Exception as e:
+        logger.error(f"Chunk {chunk_info['idx']} failed: {e}")
+        return {
+            "idx": chunk_info["idx"],
+            "segments": [],
+            "success": False
+        }
+
+
 @dataclass
 class TranscriptSegment:
     """A transcribed audio segment with dialect information."""
@@ -184,6 +280,7 @@ class ASRResult:
     processing_time: float
     model_used: str
     word_count: int
+    _segment_index: Optional[IntervalIndex] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def language(self) -> str:
@@ -206,7 +303,13 @@ class ASRResult:
 
     def get_segments_in_range(self, start: float, end: float) -> List[TranscriptSegment]:
         """Get segments within a time range."""
-        return [s for s in self.segments if s.start_time < end and s.end_time > start]
+        return self._index().overlapping(start, end)
+
+    def _index(self) -> IntervalIndex:
+        """Segment index, built once (rebuilt only if the segment list is replaced)."""
+        if self._segment_index is None or not self._segment_index.is_built_from(self.segments):
+            self._segment_index = IntervalIndex(self.segments)
+        return self._segment_index
 
 
 class IndianDialectASR:
@@ -237,7 +340,8 @@ class IndianDialectASR:
         model_name: str = "auto",
         device: Optional[str] = None,
         batch_size: int = 4,
-        enable_dialect_detection: bool = True
+        enable_dialect_detection: bool = True,
+        work_dir: Optional[Union[str, Path]] = None
     ):
         """Initialize Indian ASR.
 
@@ -246,8 +350,10 @@ class IndianDialectASR:
             device: Device (auto, cuda, cpu, mps)
             batch_size: Batch size for processing
             enable_dialect_detection: Enable dialect post-processing
+            work_dir: Job directory for the decoded PCM audio (see load_pcm)
         """
         self.model_name = model_name
+        self.work_dir = work_dir
         self.batch_size = batch_size
         self.enable_dialect_detection = enable_dialect_detection
 
@@ -258,6 +364,7 @@ class IndianDialectASR:
         self._model = None
         self._processor = None
         self._pipeline = None
+        self._pipeline_handle: Optional[ModelHandle] = None
         self._model_loaded = None
 
         logger.info(f"IndianDialectASR initialized: device={self.device}, batch_size={batch_size}")
@@ -296,15 +403,20 @@ class IndianDialectASR:
 
                 logger.info(f"Using device: {self.device} (pipeline device: {pipe_device})")
 
-                # Use Whisper pipeline for best compatibility
-                self._pipeline = pipeline(
-                    "automatic-speech-recognition",
-                    model=model_path,
-                    device=pipe_device,
-                    torch_dtype=pipe_dtype,
-                    chunk_length_s=30,
-                    batch_size=self.batch_size
-                )
+                # Use Whisper pipeline for best compatibility (shared via the registry)
+                self._set_pipeline(get_model_registry().acquire(
+                    f"automatic-speech-recognition:chunked-b{self.batch_size}", model_path,
+                    lambda: pipeline(
+                        "automatic-speech-recognition",
+                        model=model_path,
+                        device=pipe_device,
+                        torch_dtype=pipe_dtype,
+                        chunk_length_s=30,
+                        batch_size=self.batch_size
+                    ),
+                    device=self.device,
+                    dtype=str(pipe_dtype).replace("torch.", "")
+                ))
                 self._model_loaded = model_key
                 logger.info(f"Loaded Whisper model: {model_path} on {self.device}")
 
@@ -319,11 +431,17 @@ class IndianDialectASR:
 
             else:
                 # Fallback to pipeline
-                self._pipeline = pipeline(
-                    "automatic-speech-recognition",
-                    model=model_path,
-                    device=0 if self.device == "cuda" else -1
-                )
+                pipe_device = 0 if self.device == "cuda" else -1
+                self._set_pipeline(get_model_registry().acquire(
+                    "automatic-speech-recognition", model_path,
+                    lambda: pipeline(
+                        "automatic-speech-recognition",
+                        model=model_path,
+                        device=pipe_device
+                    ),
+                    device="cuda" if pipe_device == 0 else "cpu",
+                    dtype="default"
+                ))
                 self._model_loaded = model_key
 
         except Exception as e:
@@ -333,6 +451,13 @@ class IndianDialectASR:
                 logger.info("Falling back to whisper-small (fast, ~460MB)")
                 self._load_model("whisper_small")
 
+    def _set_pipeline(self, handle: ModelHandle) -> None:
+        """Switch to a registry-held ASR pipeline, releasing the previous one."""
+        if self._pipeline_handle is not None:
+            self._pipeline_handle.release()
+        self._pipeline_handle = handle.bind(self)
+        self._pipeline = handle.model
+
     def transcribe(
         self,
         audio_path: Union[str, Path],
@@ -563,6 +688,11 @@ class IndianDialectASR:
         except Exception as e:
             raise RuntimeError(f"Failed to extract audio: {e}")
 
+    def _whisper_model_size(self) -> str:
+        """openai-whisper model size for the loaded model (default: medium)."""
+        model_size = self._model_loaded.replace("whisper_", "") if self._model_loaded else "medium"
+        return model_size.replace("openai/whisper-", "")
+
     def _transcribe_direct(self, file_path: str, progress_callback: Optional[callable] = None) -> List[TranscriptSegment]:
         """Transcribe directly from file using OpenAI Whisper (with progress bar).
 
@@ -590,10 +720,16 @@ class IndianDialectASR:
         except:
             duration = 0
 
-        # For long videos, optionally use chunked processing
-        # By default, use Whisper's native long-form transcription which is more stable
-        use_chunked = ASR_CHUNKED
-        if use_chunked and duration > 1800:  # Only if explicitly enabled and >30 min
+        # Long videos (>30 min) use VAD chunking when it is forced or when the
+        # parallel pool gets more than one worker; otherwise Whisper's native
+        # long-form transcription is more stable
+        use_chunked = False
+        if duration > 1800:
+            est_chunks = -(-int(duration) // ASR_CHUNK_DURATION)
+            use_chunked = ASR_CHUNKED or (
+                ASR_PARALLEL and _asr_worker_count(self._whisper_model_size(), est_chunks) > 1
+            )
+        if use_chunked:
             logger.info(f"Long video detected ({duration/60:.1f} min) - using chunked transcription")
             report(30, f"Long video - using chunked transcription")
             return self._transcribe_parallel(file_path, duration, progress_callback)
@@ -612,15 +748,13 @@ class IndianDialectASR:
         elif duration > 0:
             report(30, f"Transcribing {duration/60:.1f} min video (est. {estimated_time/60:.1f} min)...")
 
-        # Try OpenAI Whisper first (has progress bar!)
+        # Try OpenAI Whisper first (has progress bar!); _acquire_whisper
+        # raises ImportError when openai-whisper is missing
         try:
-            import whisper
             logger.info("Using OpenAI Whisper (with progress bar)")
 
             # Load model
-            model_size = self._model_loaded.replace("whisper_", "") if self._model_loaded else "medium"
-            if model_size.startswith("openai/whisper-"):
-                model_size = model_size.replace("openai/whisper-", "")
+            model_size = self._whisper_model_size()
 
             # IMPORTANT: Use CPU for Whisper - MPS has sparse tensor issues
             # MPS error: "Could not run 'aten::_sparse_coo_tensor_with_dims_and_tensors' with SparseMPS"
@@ -629,7 +763,7 @@ class IndianDialectASR:
             logger.info("(Note: Using CPU because MPS has compatibility issues with Whisper)")
             report(35, f"Loading Whisper {model_size} model...")
 
-            model = whisper.load_model(model_size, device=whisper_device)
+            handle = _acquire_whisper(model_size, whisper_device)
             logger.info(f"Model loaded on {whisper_device}")
             report(40, "Model loaded, transcribing... (see Whisper progress below)")
 
@@ -638,12 +772,13 @@ class IndianDialectASR:
             import time
             start = time.time()
 
-            result = model.transcribe(
-                file_path,
-                language="hi",
-                task="transcribe",
-                verbose=True  # Shows progress!
-            )
+            with handle as model:
+                result = model.transcribe(
+                    file_path,
+                    language="hi",
+                    task="transcribe",
+                    verbose=True  # Shows progress!
+                )
 
             elapsed = time.time() - start
             logger.info(f"Transcription finished in {elapsed/60:.1f} minutes")
@@ -761,8 +896,9 @@ class IndianDialectASR:
     def _transcribe_parallel(self, file_path: str, duration: float, progress_callback: Optional[callable] = None) -> List[TranscriptSegment]:
         """Transcribe long video using parallel chunk processing.
 
-        Splits audio into chunks and processes them concurrently for faster transcription.
-        Ideal for videos >30 minutes.
+        A VAD pre-pass finds speech; speech regions are packed into chunks cut at
+        silences and processed concurrently, so music and silence are never
+        decoded. Ideal for videos >30 minutes.
 
         Args:
             file_path: Path to video/audio file
@@ -775,100 +911,51 @@ class IndianDialectASR:
         def report(pct: float, msg: str):
             if progress_callback:
                 progress_callback(pct, msg)
-        import subprocess
-        import tempfile
-        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+        from concurrent.futures import ProcessPoolExecutor, as_completed
         import multiprocessing
 
         # Configuration
         chunk_duration = ASR_CHUNK_DURATION
-        overlap = 2  # 2 second overlap to avoid cutting words
 
         # Determine model size early (needed for memory estimation)
-        model_size = self._model_loaded.replace("whisper_", "") if self._model_loaded else "medium"
-        if model_size.startswith("openai/whisper-"):
-            model_size = model_size.replace("openai/whisper-", "")
-
-        # IMPORTANT: Default to 1 worker (sequential) to avoid OOM
-        # The medium model is ~3GB, scene detection also uses memory
-        # Increase ASR_WORKERS in constants.py if you have enough RAM
-        max_workers = ASR_WORKERS
+        model_size = self._whisper_model_size()
 
-        # Check available memory and warn if too low
+        # Decode the audio track once; chunks are built from the shared buffer
+        logger.info("Decoding audio track...")
+        report(35, "Decoding audio track...")
         try:
-            import psutil
-            available_gb = psutil.virtual_memory().available / (1024**3)
-            model_mem_gb = {"small": 1.5, "base": 0.5, "medium": 3, "large": 6}.get(model_size, 3)
-
-            if available_gb < model_mem_gb + 2:  # Need model + 2GB headroom
-                logger.warning(
-                    f"Low memory warning: {available_gb:.1f}GB available, model needs ~{model_mem_gb}GB. "
-                    f"Consider using WHISPER_MODEL=small for lower memory usage."
-                )
+            pcm = load_pcm(file_path, work_dir=self.work_dir)
+        except RuntimeError as e:
+            logger.error(f"Audio decode failed: {e}")
+            return []
 
-            # Force single worker if memory is really tight
-            if max_workers > 1 and available_gb < (model_mem_gb * max_workers + 2):
-                logger.warning(f"Forcing single worker due to memory constraints")
-                max_workers = 1
-        except ImportError:
-            pass  # psutil not available, continue with default
-
-        logger.info(f"Parallel ASR config: {chunk_duration}s chunks, {max_workers} workers")
-
-        # Calculate chunks
-        chunks = []
-        start = 0
-        chunk_idx = 0
-        while start < duration:
-            end = min(start + chunk_duration, duration)
-            chunks.append({
-                "idx": chunk_idx,
-                "start": start,
-                "end": end,
-                "duration": end - start
-            })
-            start = end - overlap  # Small overlap
-            chunk_idx += 1
-
-        logger.info(f"Split into {len(chunks)} chunks for parallel processing")
-        report(35, f"Split into {len(chunks)} chunks")
-
-        # Extract audio chunks using ffmpeg
-        temp_dir = tempfile.mkdtemp(prefix="asr_chunks_")
-        chunk_files = []
-
-        logger.info("Extracting audio chunks...")
-        report(40, "Extracting audio chunks...")
-        for chunk in chunks:
-            chunk_file = Path(temp_dir) / f"chunk_{chunk['idx']:03d}.wav"
-            cmd = [
-                'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
-                '-ss', str(chunk['start']),
-                '-i', file_path,
-                '-t', str(chunk['duration'] + overlap),  # Add overlap
-                '-vn',  # No video
-                '-acodec', 'pcm_s16le',
-                '-ar', '16000',
-                '-ac', '1',
-                str(chunk_file)
-            ]
-            try:
-                subprocess.run(cmd, check=True, capture_output=True, timeout=120)
-                chunk_files.append({
-                    **chunk,
-                    "file": str(chunk_file)
-                })
-            except Exception as e:
-                logger.warning(f"Failed to extract chunk {chunk['idx']}: {e}")
+        # VAD pre-pass: only speech reaches Whisper, chunks are cut at silences
+        report(40, "Detecting speech regions...")
+        regions = detect_speech_regions(pcm)
+        speech_total = sum(end - start for start, end in regions)
+        logger.info(
+            f"VAD: {speech_total/60:.1f} of {pcm.duration/60:.1f} min is speech "
+            f"({len(regions)} regions)"
+        )
 
-        logger.info(f"Extracted {len(chunk_files)} audio chunks")
+        chunks = plan_speech_chunks(regions, pcm.sample_rate, chunk_duration)
+        chunk_files = [
+            {"idx": chunk.idx, "pcm_path": pcm.path, "chunk": chunk}
+            for chunk in chunks
+        ]
+
+        logger.info(f"Split speech into {len(chunks)} chunks for parallel processing")
+
+        # Each worker process holds one model, so the pool is sized by RAM
+        max_workers = _asr_worker_count(model_size, len(chunks))
+        logger.info(f"Parallel ASR config: up to {chunk_duration}s speech per chunk, {max_workers} workers")
         logger.info(f"Using Whisper {model_size} model for chunked transcription...")
-        report(45, f"Extracted {len(chunk_files)} chunks, starting transcription...")
+        report(45, f"Prepared {len(chunk_files)} speech chunks, starting transcription...")
 
         # Choose between parallel and sequential processing
-        # Parallel: Faster but uses more memory (loads model per worker ~2-4GB each)
-        # Sequential: Slower but memory-efficient (single model, default)
-        # Set ASR_PARALLEL=True in constants.py to enable parallel mode if you have enough RAM
+        # Parallel: worker processes, each loads the model once (~2-4GB each)
+        # Sequential: single model in this process (memory-efficient)
+        # Set ASR_PARALLEL=False in constants.py to force sequential mode
         use_parallel = ASR_PARALLEL
 
         # Force sequential if only 1 worker anyway
@@ -881,40 +968,24 @@ class IndianDialectASR:
         completed = 0
 
         if use_parallel and max_workers > 1:
-            # PARALLEL MODE: Multiple workers, each loads own model
-            logger.info(f"Starting PARALLEL transcription with {max_workers} workers...")
+            # PARALLEL MODE: Worker processes load the model once, then pull chunks
+            logger.info(f"Starting PARALLEL transcription with {max_workers} worker processes...")
             logger.info("(Set ASR_PARALLEL=false for memory-efficient sequential mode)")
 
-            def transcribe_chunk(chunk_info):
-                """Transcribe a single chunk."""
-                try:
-                    import whisper
-                    # Each thread loads its own model
-                    model = whisper.load_model(model_size, device="cpu")
-                    result = model.transcribe(
-                        chunk_info["file"],
-                        language="hi",
-                        task="transcribe",
-                        verbose=False
-                    )
-                    return {
-                        "idx": chunk_info["idx"],
-                        "start_offset": chunk_info["start"],
-                        "segments": result.get("segments", []),
-                        "success": True
-                    }
-                except Exception as e:
-                    logger.error(f"Chunk {chunk_info['idx']} failed: {e}")
-                    return {
-                        "idx": chunk_info["idx"],
-                        "start_offset": chunk_info["start"],
-                        "segments": [],
-                        "success": False
-                    }
-
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            threads_per_worker = max(1, (os.cpu_count() or 1) // max_workers)
+
+            # Workers need the RAM more than idle models in this process do
+            get_model_registry().unload_idle()
+
+            # spawn: forking a process that already holds torch state is unsafe
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_asr_worker,
+                initargs=(model_size, threads_per_worker)
+            ) as executor:
                 future_to_chunk = {
-                    executor.submit(transcribe_chunk, chunk): chunk
+                    executor.submit(_transcribe_chunk_worker, chunk): chunk
                     for chunk in chunk_files
                 }
 
@@ -939,48 +1010,46 @@ class IndianDialectASR:
 
         else:
             # SEQUENTIAL MODE: Single model, process chunks one by one (memory-efficient, default)
-            logger.info(f"Starting chunked transcription: {len(chunk_files)} chunks of {chunk_duration}s each")
+            logger.info(f"Starting chunked transcription: {len(chunk_files)} chunks of up to {chunk_duration}s speech")
             logger.info("(Memory-efficient mode. Set ASR_PARALLEL=true for faster but high-memory parallel mode)")
 
             try:
-                import whisper
-                model = whisper.load_model(model_size, device="cpu")
+                handle = _acquire_whisper(model_size)
                 logger.info(f"Model loaded: {model_size}")
 
-                for chunk_info in chunk_files:
-                    try:
-                        result = model.transcribe(
-                            chunk_info["file"],
-                            language="hi",
-                            task="transcribe",
-                            verbose=False
+                with handle as model:
+                    for chunk_info in chunk_files:
+                        try:
+                            result = model.transcribe(
+                                chunk_info["chunk"].assemble(pcm.samples),
+                                language="hi",
+                                task="transcribe",
+                                verbose=False
+                            )
+                            results.append({
+                                "idx": chunk_info["idx"],
+                                "segments": result.get("segments", []),
+                                "success": True
+                            })
+                        except Exception as e:
+                            logger.error(f"Chunk {chunk_info['idx']} failed: {e}")
+                            results.append({
+                                "idx": chunk_info["idx"],
+                                "segments": [],
+                                "success": False
+                            })
+
+                        completed += 1
+                        elapsed = time.time() - start_time
+                        eta = (elapsed / completed) * (len(chunk_files) - completed) if completed > 0 else 0
+                        chunk_pct = 100 * completed / len(chunk_files)
+                        # Map chunk progress (0-100%) to overall progress (45-95%)
+                        overall_pct = 45 + (chunk_pct * 0.5)
+                        logger.info(
+                            f"Progress: {completed}/{len(chunk_files)} chunks "
+                            f"({chunk_pct:.0f}%) - ETA: {eta/60:.1f} min"
                         )
-                        results.append({
-                            "idx": chunk_info["idx"],
-                            "start_offset": chunk_info["start"],
-                            "segments": result.get("segments", []),
-                            "success": True
-                        })
-                    except Exception as e:
-                        logger.error(f"Chunk {chunk_info['idx']} failed: {e}")
-                        results.append({
-                            "idx": chunk_info["idx"],
-                            "start_offset": chunk_info["start"],
-                            "segments": [],
-                            "success": False
-                        })
-
-                    completed += 1
-                    elapsed = time.time() - start_time
-                    eta = (elapsed / completed) * (len(chunk_files) - completed) if completed > 0 else 0
-                    chunk_pct = 100 * completed / len(chunk_files)
-                    # Map chunk progress (0-100%) to overall progress (45-95%)
-                    overall_pct = 45 + (chunk_pct * 0.5)
-                    logger.info(
-                        f"Progress: {completed}/{len(chunk_files)} chunks "
-                        f"({chunk_pct:.0f}%) - ETA: {eta/60:.1f} min"
-                    )
-                    report(overall_pct, f"Transcribing: {completed}/{len(chunk_files)} chunks ({chunk_pct:.0f}%)")
+                        report(overall_pct, f"Transcribing: {completed}/{len(chunk_files)} chunks ({chunk_pct:.0f}%)")
             except ImportError:
                 logger.error("openai-whisper not installed for sequential processing")
                 return []
@@ -989,29 +1058,22 @@ class IndianDialectASR:
         results.sort(key=lambda x: x["idx"])
         report(95, "Merging transcribed segments...")
 
-        # Merge segments with timestamp offsets
+        # Merge segments, mapping chunk time back to source time
         all_segments = []
         segment_id = 1
-        seen_texts = set()  # Deduplicate overlapping segments
 
         for result in results:
             if not result["success"]:
                 continue
 
-            offset = result["start_offset"]
+            chunk = chunks[result["idx"]]
             for seg in result["segments"]:
                 text = seg.get("text", "").strip()
                 if not text or len(text) < 3:
                     continue
 
-                # Deduplicate based on similar text (from overlap)
-                text_key = text[:50].lower()
-                if text_key in seen_texts:
-                    continue
-                seen_texts.add(text_key)
-
-                seg_start = float(seg.get("start", 0)) + offset
-                seg_end = float(seg.get("end", 0)) + offset
+                seg_start = chunk.to_source_time(float(seg.get("start", 0)), pcm.sample_rate)
+                seg_end = chunk.to_source_time(float(seg.get("end", 0)), pcm.sample_rate)
 
                 all_segments.append(TranscriptSegment(
                     id=segment_id,
@@ -1025,13 +1087,6 @@ class IndianDialectASR:
         # Sort by start time
         all_segments.sort(key=lambda s: s.start_time)
 
-        # Cleanup temp files
-        try:
-            import shutil
-            shutil.rmtree(temp_dir)
-        except:
-            pass
-
         elapsed = time.time() - start_time
         speedup = duration / elapsed if elapsed > 0 else 1
         logger.info(
@@ -10,11 +10,13 @@ import re
 from typing import List, Dict, Optional, Tuple
 from loguru import logger
 
+from config import get_config
 from config.constants import LLM_MODEL, OLLAMA_MODEL
+from core.llm_cache import get_llm_cache, hf_generate_kwargs, ollama_options, sampling_params
+from core.model_registry import acquire_seq2seq
+from core.ollama_client import ollama_available, ollama_generate, ollama_generate_many
 
-# Globals for lazy loading
-_model = None
-_tokenizer = None
+# Backend chosen on first use; transformers weights live in the model registry
 _model_type = None  # 'transformers', 'ollama', or 'heuristic'
 
 # =============================================================================
@@ -139,44 +141,28 @@ def _score_dialogue_for_trailer(dialogue: str) -> int:
 
 def _init_model():
     """Initialize model - auto-downloads if needed."""
-    global _model, _tokenizer, _model_type
+    global _model_type
 
     if _model_type is not None:
         return _model_type != 'heuristic'
 
-    # Try 1: HuggingFace Transformers (auto-downloads)
+    # Try 1: HuggingFace Transformers (auto-downloads, shared via the registry)
     try:
-        from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
-        import torch
+        logger.info(f"Loading LLM: {LLM_MODEL} (auto-downloading if needed)...")
 
-        model_name = LLM_MODEL
-        logger.info(f"Loading LLM: {model_name} (auto-downloading if needed)...")
-
-        _tokenizer = AutoTokenizer.from_pretrained(model_name)
-        _model = AutoModelForSeq2SeqLM.from_pretrained(
-            model_name,
-            torch_dtype=torch.float16 if torch.cuda.is_available() else torch.float32,
-            device_map="auto" if torch.cuda.is_available() else None
-        )
-
-        if not torch.cuda.is_available():
-            if hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
-                _model = _model.to("mps")
-            else:
-                _model = _model.to("cpu")
+        # Load once; the registry keeps it cached for _generate
+        acquire_seq2seq(LLM_MODEL).release()
 
         _model_type = 'transformers'
-        logger.info(f"LLM ready: {model_name}")
+        logger.info(f"LLM ready: {LLM_MODEL}")
         return True
 
     except Exception as e:
         logger.warning(f"Transformers not available: {e}")
 
-    # Try 2: Ollama (if installed)
+    # Try 2: Ollama (if running)
     try:
-        import requests
-        r = requests.get("http://localhost:11434/api/tags", timeout=2)
-        if r.status_code == 200:
+        if ollama_available():
             _model_type = 'ollama'
             logger.info("Using Ollama for LLM")
             return True
@@ -190,48 +176,146 @@ def _init_model():
 
 
 def _generate(prompt: str, max_tokens: int = 150) -> str:
-    """Generate text using available model."""
-    global _model, _tokenizer, _model_type
-
+    """Generate text using available model (responses cached on disk)."""
     _init_model()
 
+    params = sampling_params(temperature=0.3, max_tokens=max_tokens)
+
     if _model_type == 'transformers':
-        try:
-            inputs = _tokenizer(prompt, return_tensors="pt", truncation=True, max_length=512)
-            inputs = {k: v.to(_model.device) for k, v in inputs.items()}
+        def run():
+            try:
+                with acquire_seq2seq(LLM_MODEL) as (tokenizer, model):
+                    inputs = tokenizer(prompt, return_tensors="pt", truncation=True, max_length=512)
+                    inputs = {k: v.to(model.device) for k, v in inputs.items()}
+
+                    outputs = model.generate(
+                        **inputs,
+                        max_new_tokens=max_tokens,
+                        pad_token_id=tokenizer.eos_token_id,
+                        **hf_generate_kwargs(params)
+                    )
+
+                    return tokenizer.decode(outputs[0], skip_special_tokens=True)
+            except Exception as e:
+                logger.warning(f"Generation error: {e}")
+                return ""
+
+        return get_llm_cache().generate('transformers', LLM_MODEL, prompt, params, run)
+
+    elif _model_type == 'ollama':
+        def run():
+            try:
+                return ollama_generate(prompt, OLLAMA_MODEL, ollama_options(params)).strip()
+            except Exception as e:
+                logger.warning(f"Ollama generation error: {e}")
+                return ""
+
+        return get_llm_cache().generate('ollama', OLLAMA_MODEL, prompt, params, run)
+
+    return ""
+
+
+def generate_seq2seq_batch(
+    tokenizer,
+    model,
+    prompts: List[str],
+    params: Dict,
+    batch_size: int
+) -> List[str]:
+    """Run a seq2seq model over many prompts in padded batches.
 
-            outputs = _model.generate(
+    Prompts are grouped by length so each batch carries little padding.
+
+    Args:
+        tokenizer: HuggingFace tokenizer
+        model: Seq2seq model
+        prompts: Prompt texts
+        params: Sampling parameters from sampling_params
+        batch_size: Prompts per forward pass
+
+    Returns:
+        Decoded responses in prompt order
+    """
+    import torch
+
+    order = sorted(range(len(prompts)), key=lambda i: len(prompts[i]))
+    results = [""] * len(prompts)
+
+    for start in range(0, len(order), batch_size):
+        batch = order[start:start + batch_size]
+        inputs = tokenizer(
+            [prompts[i] for i in batch],
+            return_tensors="pt",
+            padding=True,
+            truncation=True,
+            max_length=512
+        )
+        inputs = {k: v.to(model.device) for k, v in inputs.items()}
+
+        with torch.no_grad():
+            outputs = model.generate(
                 **inputs,
-                max_new_tokens=max_tokens,
-                temperature=0.3,
-                do_sample=True,
-                pad_token_id=_tokenizer.eos_token_id
+                max_new_tokens=params["max_tokens"],
+                pad_token_id=tokenizer.pad_token_id,
+                **hf_generate_kwargs(params)
             )
 
-            return _tokenizer.decode(outputs[0], skip_special_tokens=True)
-        except Exception as e:
-            logger.warning(f"Generation error: {e}")
-            return ""
+        for i, text in zip(batch, tokenizer.batch_decode(outputs, skip_special_tokens=True)):
+            results[i] = text
+
+    return results
+
+
+def generate_batch(prompts: List[str], max_tokens: int = 150) -> List[str]:
+    """Generate text for many prompts at once (responses cached on disk).
+
+    The transformers backend runs padded batches of ``LLMConfig.batch_size``
+    prompts per forward pass; Ollama requests are issued concurrently through
+    the pooled client (up to ``LLMConfig.ollama_max_concurrency`` in flight).
+    Decoding is greedy, so each response depends only on its own prompt and
+    can be cached regardless of which prompts share its batch.
+
+    Args:
+        prompts: Prompt texts
+        max_tokens: Max new tokens per response
+
+    Returns:
+        Responses in prompt order ("" where generation failed)
+    """
+    if not prompts:
+        return []
+
+    _init_model()
+
+    config = get_config().llm
+    batch_size = config.batch_size if config.enable_batching else 1
+
+    # Greedy: sampled batch outputs depend on batch composition
+    params = sampling_params(temperature=0, max_tokens=max_tokens)
+
+    if _model_type == 'transformers':
+        def run(pending: List[str]) -> List[str]:
+            try:
+                with acquire_seq2seq(LLM_MODEL) as (tokenizer, model):
+                    return generate_seq2seq_batch(tokenizer, model, pending, params, batch_size)
+            except Exception as e:
+                logger.warning(f"Batch generation error: {e}")
+                return [""] * len(pending)
+
+        return get_llm_cache().generate_many('transformers', LLM_MODEL, prompts, params, run)
 
     elif _model_type == 'ollama':
-        try:
-            import requests
-            response = requests.post(
-                "http://localhost:11434/api/generate",
-                json={
-                    "model": OLLAMA_MODEL,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {"temperature": 0.3, "num_predict": max_tokens}
-                },
-                timeout=30
-            )
-            if response.status_code == 200:
-                return response.json().get("response", "").strip()
-        except Exception:
-            pass
+        def run_ollama(pending: List[str]) -> List[str]:
+            try:
+                responses = ollama_generate_many(pending, OLLAMA_MODEL, ollama_options(params))
+                return [response.strip() for response in responses]
+            except Exception as e:
+                logger.warning(f"Batch generation error: {e}")
+                return [""] * len(pending)
 
-    return ""
+        return get_llm_cache().generate_many('ollama', OLLAMA_MODEL, prompts, params, run_ollama)
+
+    return [""] * len(prompts)
 
 
 def rank_scenes_for_trailer(scenes: List[Dict], top_n: int = 20) -> List[Dict]:
@@ -331,44 +415,63 @@ List top 6 numbers (best for trailer), comma-separated:"""
 
 def pick_best_quote(dialogue: str, scene_context: str = "") -> Optional[str]:
     """Pick the best trailer quote - dialect-aware."""
-    if not dialogue or len(dialogue) < 10:
-        return dialogue
+    return pick_best_quotes([dialogue])[0]
 
-    if len(dialogue) < 60:
-        return dialogue
 
-    # Split into sentences (handle Hindi/regional punctuation)
-    sentences = []
-    temp = dialogue
-    for delim in ["?", "!", "।", ".", "|"]:
-        temp = temp.replace(delim, delim + "||SPLIT||")
-    sentences = [s.strip() for s in temp.split("||SPLIT||") if s.strip() and len(s.strip()) > 3]
+def pick_best_quotes(dialogues: List[str]) -> List[Optional[str]]:
+    """Pick the best trailer quote for many dialogues - dialect-aware.
 
-    if not sentences:
-        return dialogue[:100]
+    Heuristics pick a quote for every dialogue; complex dialogues are then
+    refined by the LLM in a single generate_batch call.
 
-    # Score each sentence
-    best = None
-    best_score = 0
+    Args:
+        dialogues: Dialogue texts (e.g. one per scene)
 
-    for sent in sentences:
-        score = _score_dialogue_for_trailer(sent)
+    Returns:
+        Best quote per dialogue, in order
+    """
+    quotes: List[Optional[str]] = []
+    llm_jobs = []  # (index, prompt)
+
+    for dialogue in dialogues:
+        if not dialogue or len(dialogue) < 60:
+            quotes.append(dialogue)
+            continue
+
+        # Split into sentences (handle Hindi/regional punctuation)
+        temp = dialogue
+        for delim in ["?", "!", "।", ".", "|"]:
+            temp = temp.replace(delim, delim + "||SPLIT||")
+        sentences = [s.strip() for s in temp.split("||SPLIT||") if s.strip() and len(s.strip()) > 3]
+
+        if not sentences:
+            quotes.append(dialogue[:100])
+            continue
 
-        # Bonus for standalone power
-        words = sent.split()
-        if 5 <= len(words) <= 12:
-            score += 15
+        # Score each sentence
+        best = None
+        best_score = 0
 
-        if score > best_score:
-            best_score = score
-            best = sent
+        for sent in sentences:
+            score = _score_dialogue_for_trailer(sent)
 
-    # LLM enhancement for complex dialogues
-    if _init_model() and _model_type != 'heuristic' and len(sentences) > 4:
-        dialect, _ = _detect_dialect(dialogue)
-        dialect_hint = f" (Dialect: {dialect})" if dialect else ""
+            # Bonus for standalone power
+            words = sent.split()
+            if 5 <= len(words) <= 12:
+                score += 15
 
-        prompt = f"""Pick the SINGLE best line for a movie trailer{dialect_hint}:
+            if score > best_score:
+                best_score = score
+                best = sent
+
+        quotes.append(best[:100] if best else sentences[0][:100])
+
+        # LLM enhancement for complex dialogues
+        if len(sentences) > 4:
+            dialect, _ = _detect_dialect(dialogue)
+            dialect_hint = f" (Dialect: {dialect})" if dialect else ""
+
+            prompt = f"""Pick the SINGLE best line for a movie trailer{dialect_hint}:
 
 "{dialogue[:200]}"
 
@@ -379,15 +482,18 @@ Best line should:
 - Keep original dialect words
 
 Best line:"""
-
-        result = _generate(prompt, max_tokens=50)
-        if result and 5 < len(result) < 100:
-            result = result.strip().strip('"').strip("'")
-            # Validate it's not a meta-response
-            if result and not any(x in result.lower() for x in ['the best', 'i would', 'this line', 'the line']):
-                return result
-
-    return best[:100] if best else sentences[0][:100]
+            llm_jobs.append((len(quotes) - 1, prompt))
+
+    if llm_jobs and _init_model() and _model_type != 'heuristic':
+        results = generate_batch([prompt for _, prompt in llm_jobs], max_tokens=50)
+        for (idx, _), result in zip(llm_jobs, results):
+            if result and 5 < len(result) < 100:
+                result = result.strip().strip('"').strip("'")
+                # Validate it's not a meta-response
+                if result and not any(x in result.lower() for x in ['the best', 'i would', 'this line', 'the line']):
+                    quotes[idx] = result
+
+    return quotes
 
 
 def score_narrative_flow(shots: List[Dict]) -> int:
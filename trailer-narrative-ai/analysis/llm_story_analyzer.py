@@ -29,6 +29,7 @@ from enum import Enum
 from loguru import logger
 
 from config.constants import USE_LLM, LLM_MODEL, LLM_DEVICE
+from core.model_registry import acquire_seq2seq
 
 
 class CharacterRole(Enum):
@@ -207,44 +208,14 @@ class LLMStoryAnalyzer:
             return False
 
         try:
-            import torch
-            from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
-
             logger.info(f"Loading LLM model: {self.model_name}")
             logger.info("(First run will download ~3GB, subsequent runs use cache)")
 
-            # Determine device
-            if self.device == "auto":
-                if torch.cuda.is_available():
-                    device = "cuda"
-                elif hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
-                    device = "mps"
-                else:
-                    device = "cpu"
-            else:
-                device = self.device
-
-            logger.info(f"Using device: {device}")
-
-            # Load tokenizer
-            self._tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-
-            # Load model with appropriate settings
-            if device == "cuda":
-                self._model = AutoModelForSeq2SeqLM.from_pretrained(
-                    self.model_name,
-                    device_map="auto",
-                    torch_dtype=torch.float16
-                )
-            elif device == "mps":
-                self._model = AutoModelForSeq2SeqLM.from_pretrained(self.model_name)
-                self._model = self._model.to(device)
-            else:
-                self._model = AutoModelForSeq2SeqLM.from_pretrained(self.model_name)
-
-            self._model.eval()
+            # Shared with every other user of the same weights; released with self
+            handle = acquire_seq2seq(self.model_name, self.device).bind(self)
+            self._tokenizer, self._model = handle.model
             self._model_loaded = True
-            logger.info(f"LLM model loaded successfully on {device}")
+            logger.info(f"LLM model loaded successfully on {self._model.device}")
             return True
 
         except ImportError as e:
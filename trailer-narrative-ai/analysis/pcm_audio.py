@@ -0,0 +1,237 @@
+"""Decode-once PCM audio buffer shared by ASR and audio analysis.
+
+The audio track of a video is decoded a single time with ffmpeg into a raw
+16 kHz mono float32 file, which is then memory-mapped. ASR chunks, silence
+detection and energy analysis all read zero-copy NumPy slices of the same
+buffer, and worker processes can map the same file without copying it.
+
+A film's PCM is about 0.5 GB, so it is written into the job's work
+directory and released with release_pcm when the job's analysis is done.
+"""
+
+import hashlib
+import os
+import subprocess
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+from loguru import logger
+
+from config.constants import get_temp_dir
+
+
+# Whisper's expected input format
+PCM_SAMPLE_RATE = 16000
+PCM_DTYPE = np.float32
+
+_cache_lock = threading.Lock()
+_loaded: Dict[Tuple[str, int], "PCMAudio"] = {}
+
+
+@dataclass
+class PCMAudio:
+    """Memory-mapped mono PCM audio."""
+    path: str  # Raw float32 file backing the buffer
+    sample_rate: int
+    samples: np.ndarray  # float32 in [-1, 1], read-only memmap
+
+    @property
+    def duration(self) -> float:
+        return len(self.samples) / self.sample_rate
+
+    def slice(self, start: float, end: float) -> np.ndarray:
+        """Get a zero-copy view of the samples between two times (seconds)."""
+        first = max(0, int(start * self.sample_rate))
+        last = min(len(self.samples), int(end * self.sample_rate))
+        return self.samples[first:max(first, last)]
+
+    def frame_rms_db(self, frame_duration: float = 0.01) -> np.ndarray:
+        """Compute per-frame RMS level in dBFS.
+
+        Args:
+            frame_duration: Frame length in seconds
+
+        Returns:
+            Array with one dBFS value per full frame
+        """
+        frame_len = max(1, int(frame_duration * self.sample_rate))
+        n_frames = len(self.samples) // frame_len
+        frames = self.samples[:n_frames * frame_len].reshape(n_frames, frame_len)
+        mean_square = np.einsum("ij,ij->i", frames, frames) / frame_len
+        return 10 * np.log10(np.maximum(mean_square, 1e-10))
+
+
+def open_pcm(path: Union[str, Path], sample_rate: int = PCM_SAMPLE_RATE) -> PCMAudio:
+    """Map an existing raw PCM file (e.g. inside a worker process).
+
+    Args:
+        path: Raw float32 PCM file written by load_pcm
+        sample_rate: Sample rate of the file
+
+    Returns:
+        PCMAudio backed by the file
+    """
+    if os.path.getsize(path) == 0:
+        # mmap cannot map empty files (e.g. a source without audio)
+        samples = np.zeros(0, dtype=PCM_DTYPE)
+    else:
+        samples = np.memmap(str(path), dtype=PCM_DTYPE, mode="r")
+    return PCMAudio(path=str(path), sample_rate=sample_rate, samples=samples)
+
+
+def _pcm_dir(work_dir: Optional[Union[str, Path]]) -> Path:
+    """Directory PCM files are written to (default: <TEMP_DIR>/pcm)."""
+    return Path(work_dir) if work_dir else get_temp_dir() / "pcm"
+
+
+def _pcm_cache_path(source: Path, sample_rate: int, work_dir: Optional[Union[str, Path]]) -> Path:
+    """File path for a source's decoded PCM (changes when the source does)."""
+    stat = source.stat()
+    key = f"{source.resolve()}|{stat.st_size}|{stat.st_mtime_ns}|{sample_rate}"
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return _pcm_dir(work_dir) / f"trailer_ai_pcm_{source.stem}_{digest}.f32"
+
+
+def load_pcm(
+    source: Union[str, Path],
+    sample_rate: int = PCM_SAMPLE_RATE,
+    work_dir: Optional[Union[str, Path]] = None
+) -> PCMAudio:
+    """Decode a video/audio file's audio track once and memory-map it.
+
+    Repeated calls for the same (unchanged) source and work dir reuse the
+    decoded file until release_pcm is called for that directory. Without a
+    work dir, a buffer already loaded for the source in any job directory
+    is reused.
+
+    Args:
+        source: Path to video or audio file
+        sample_rate: Target sample rate
+        work_dir: Job directory for the PCM file (default: <TEMP_DIR>/pcm)
+
+    Returns:
+        PCMAudio for the source
+
+    Raises:
+        RuntimeError: If ffmpeg could not decode the audio
+    """
+    source = Path(source)
+    with _cache_lock:
+        pcm_path = _pcm_cache_path(source, sample_rate, work_dir)
+        cache_key = (str(pcm_path), sample_rate)
+        if cache_key in _loaded:
+            return _loaded[cache_key]
+        if work_dir is None:
+            for (loaded_path, loaded_rate), pcm in _loaded.items():
+                if loaded_rate == sample_rate and Path(loaded_path).name == pcm_path.name:
+                    return pcm
+
+        if not pcm_path.exists():
+            logger.info(f"Decoding audio to PCM: {source.name} ({sample_rate} Hz mono)")
+            pcm_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = pcm_path.with_suffix(".tmp")
+            cmd = [
+                'ffmpeg', '-y', '-hide_banner', '-loglevel', 'error',
+                '-i', str(source),
+                '-vn',
+                '-ac', '1',
+                '-ar', str(sample_rate),
+                '-f', 'f32le',
+                str(tmp_path)
+            ]
+            try:
+                result = subprocess.run(cmd, capture_output=True, text=True)
+            except FileNotFoundError:
+                raise RuntimeError("ffmpeg not found, cannot decode audio")
+            if result.returncode != 0:
+                tmp_path.unlink(missing_ok=True)
+                raise RuntimeError(f"ffmpeg audio decode failed: {result.stderr[-500:]}")
+            # Only complete decodes become visible to later calls
+            os.replace(tmp_path, pcm_path)
+        else:
+            logger.info(f"Using cached PCM audio: {pcm_path}")
+
+        pcm = open_pcm(pcm_path, sample_rate)
+        logger.info(
+            f"PCM audio ready: {pcm.duration/60:.1f} min "
+            f"({pcm_path.stat().st_size / 1024 / 1024:.0f}MB mapped)"
+        )
+        _loaded[cache_key] = pcm
+        return pcm
+
+
+def release_pcm(work_dir: Optional[Union[str, Path]] = None) -> int:
+    """Forget and delete the PCM files decoded into a work directory.
+
+    Call when a job's analysis is finished. Dropping the memmaps here lets the
+    mapping close once the last caller's views are gone; the file itself is
+    unlinked now (its space is freed when the last mapping closes).
+
+    Args:
+        work_dir: Directory passed to load_pcm (default: <TEMP_DIR>/pcm)
+
+    Returns:
+        Number of PCM files released
+    """
+    directory = _pcm_dir(work_dir).resolve()
+    released = 0
+
+    with _cache_lock:
+        for cache_key in list(_loaded):
+            if Path(cache_key[0]).resolve().parent == directory:
+                del _loaded[cache_key]
+
+        if directory.is_dir():
+            for path in directory.glob("trailer_ai_pcm_*"):
+                path.unlink(missing_ok=True)
+                released += 1
+
+    if released:
+        logger.info(f"Released {released} PCM file(s) in {directory}")
+    return released
+
+
+def detect_silent_ranges(
+    pcm: PCMAudio,
+    threshold_db: float = -40,
+    min_duration: float = 0.5,
+    frame_duration: float = 0.01
+) -> List[Tuple[float, float]]:
+    """Find ranges whose level stays below a threshold for a minimum duration.
+
+    Like pydub's detect_silence, a window of ``min_duration`` is silent when
+    its RMS level is below ``threshold_db``; overlapping silent windows merge.
+
+    Args:
+        pcm: Decoded audio
+        threshold_db: Silence threshold in dBFS
+        min_duration: Minimum silence duration in seconds
+        frame_duration: Analysis frame length in seconds
+
+    Returns:
+        List of (start, end) times in seconds
+    """
+    levels = pcm.frame_rms_db(frame_duration)
+    window = max(1, int(round(min_duration / frame_duration)))
+    if len(levels) < window:
+        return []
+
+    # Mean power over each sliding window via cumulative sums
+    power = np.concatenate([[0.0], np.cumsum(10 ** (levels / 10), dtype=np.float64)])
+    window_db = 10 * np.log10(np.maximum((power[window:] - power[:-window]) / window, 1e-10))
+    silent = window_db < threshold_db
+
+    # Each silent window starting at frame i covers frames [i, i + window)
+    covered = np.zeros(len(levels) + 1, dtype=np.int32)
+    starts = np.flatnonzero(silent)
+    np.add.at(covered, starts, 1)
+    np.add.at(covered, starts + window, -1)
+    mask = np.cumsum(covered[:-1]) > 0
+
+    edges = np.flatnonzero(np.diff(np.concatenate([[0], mask.astype(np.int8), [0]])))
+    return [
+        (float(start * frame_duration), float(end * frame_duration))
+        for start, end in zip(edges[::2], edges[1::2])
+    ]
@@ -1,17 +1,98 @@
-"""Scene detection using PySceneDetect."""
-
+"""Scene detection using PySceneDetect.
+
+Besides the exhaustive ContentDetector pass over every frame, a
+coarse-to-fine mode is available for large sources. A cheap ffmpeg pass
+samples a downscaled, frame-skipped stream and flags short intervals whose
+content change could hold a cut. Only the frames in those intervals are then
+scored by PySceneDetect at native resolution, exactly as the exhaustive pass
+would score them. Frames outside the intervals count as below threshold.
+Replaying the detector's minimum-scene-length filter over the scores gives
+the same DetectedScene list, while decoding a small fraction of the frames
+at full cost.
+"""
+
+import inspect
+import math
+import multiprocessing
+import os
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Union, Dict, Any
+from typing import List, Optional, Union, Dict, Any, Iterable, Iterator, Tuple
+import numpy as np
 from loguru import logger
 
+try:
+    import cv2
+    HAS_CV2 = True
+except ImportError:
+    HAS_CV2 = False
+
 try:
     from scenedetect import detect, ContentDetector, ThresholdDetector, AdaptiveDetector
-    from scenedetect import open_video, SceneManager
+    from scenedetect import open_video, SceneManager, StatsManager, FrameTimecode
     HAS_SCENEDETECT = True
 except ImportError:
     HAS_SCENEDETECT = False
 
+try:
+    # PySceneDetect >= 0.7
+    from scenedetect.detector import FlashFilter
+except ImportError:
+    try:
+        # PySceneDetect 0.6.4 - 0.6.x
+        from scenedetect.scene_detector import FlashFilter
+    except ImportError:
+        FlashFilter = None
+
+from config import get_config
+from core.scene_index import SceneIndex
+
+
+# Detection modes (see SCENE_DETECTION_MODE)
+DETECTION_MODES = ("exhaustive", "coarse_to_fine", "auto")
+
+# Refine windows closer than this many seconds are decoded as one (a forward
+# decode is cheaper than a fresh seek to the previous keyframe)
+REFINE_MERGE_GAP = 1.0
+
+# A content cut counts as a fade when it lies within this many seconds of a
+# fade-out/fade-in span found by the threshold detector
+FADE_MATCH_TOLERANCE = 0.5
+
+
+def _frame_number(position: Any) -> int:
+    """Frame number of a detector position (int before PySceneDetect 0.7)."""
+    return position.get_frames() if hasattr(position, 'get_frames') else int(position)
+
+
+if HAS_SCENEDETECT:
+    class _FadeSpanDetector(ThresholdDetector):
+        """ThresholdDetector that records fade spans instead of emitting cuts.
+
+        Runs next to ContentDetector in the same SceneManager, so scene
+        boundaries stay content-driven while the fades are found on the same
+        decoded frames.
+        """
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            # (fade-out frame, fade-in frame), in time order
+            self.fade_spans: List[Tuple[int, int]] = []
+
+        def process_frame(self, position, frame_img):
+            fade_out = self.last_fade["frame"]
+            if super().process_frame(position, frame_img):
+                self.fade_spans.append((_frame_number(fade_out), _frame_number(position)))
+            return []
+
+        def post_process(self, position):
+            # A trailing fade-out with no fade-in
+            for cut in super().post_process(position):
+                self.fade_spans.append((_frame_number(cut), _frame_number(position)))
+            return []
+
 
 @dataclass
 class DetectedScene:
@@ -67,6 +148,8 @@ class SceneDetectionResult:
     video_duration: float
     video_fps: float
     total_frames: int
+    # How the scenes were found (mode, refined frame counts, ...)
+    stats: Dict[str, Any] = field(default_factory=dict)
 
     @property
     def scene_count(self) -> int:
@@ -97,7 +180,8 @@ class SceneDetector:
         content_threshold: float = 27.0,
         threshold_threshold: float = 12.0,
         min_scene_length: float = 0.5,  # seconds
-        adaptive_threshold: float = 3.0
+        adaptive_threshold: float = 3.0,
+        mode: Optional[str] = None
     ):
         """Initialize scene detector.
 
@@ -106,6 +190,7 @@ class SceneDetector:
             threshold_threshold: Threshold for fade detection
             min_scene_length: Minimum scene length in seconds
             adaptive_threshold: Threshold for adaptive detection
+            mode: "exhaustive", "coarse_to_fine" or "auto" (default from config)
         """
         if not HAS_SCENEDETECT:
             raise ImportError(
@@ -118,11 +203,82 @@ class SceneDetector:
         self.min_scene_length = min_scene_length
         self.adaptive_threshold = adaptive_threshold
 
+        self._scene_index: Optional[SceneIndex] = None
+
+        self.mode = mode or get_config().scene.mode
+        if self.mode not in DETECTION_MODES:
+            raise ValueError(f"Unknown scene detection mode: {self.mode}")
+
+    @property
+    def params(self) -> Dict[str, Any]:
+        """Detection parameters (used to version cached results)."""
+        params = {
+            "content_threshold": self.content_threshold,
+            "threshold_threshold": self.threshold_threshold,
+            "min_scene_length": self.min_scene_length,
+            "adaptive_threshold": self.adaptive_threshold,
+            "mode": self.mode
+        }
+        scene_cfg = get_config().scene
+        # Shard boundaries change which detector state each frame sees
+        params.update({
+            "workers": scene_cfg.workers if scene_cfg.workers > 0 else (os.cpu_count() or 1),
+            "shard_min_duration": scene_cfg.shard_min_duration
+        })
+        if self.mode != "exhaustive":
+            params.update({
+                "coarse_min_height": scene_cfg.coarse_min_height,
+                "coarse_fps": scene_cfg.coarse_fps,
+                "coarse_width": scene_cfg.coarse_width,
+                "coarse_threshold_ratio": scene_cfg.coarse_threshold_ratio,
+                "refine_margin": scene_cfg.refine_margin,
+                "refine_seek_gap": scene_cfg.refine_seek_gap
+            })
+        return params
+
+    def create_detectors(self, method: str, fps: float) -> List[Any]:
+        """Create PySceneDetect detectors for a detection method.
+
+        Args:
+            method: Detection method ('content', 'threshold', 'adaptive', 'all')
+            fps: Video frame rate (used to convert min_scene_length to frames)
+
+        Returns:
+            List of detector instances
+        """
+        min_scene_len = int(self.min_scene_length * fps)
+
+        if method == "content":
+            return [ContentDetector(
+                threshold=self.content_threshold,
+                min_scene_len=min_scene_len
+            )]
+        elif method == "threshold":
+            return [ThresholdDetector(
+                threshold=self.threshold_threshold,
+                min_scene_len=min_scene_len
+            )]
+        elif method == "adaptive":
+            return [AdaptiveDetector(
+                adaptive_threshold=self.adaptive_threshold,
+                min_scene_len=min_scene_len
+            )]
+        elif method == "all":
+            # Use multiple detectors
+            return [
+                ContentDetector(
+                    threshold=self.content_threshold,
+                    min_scene_len=min_scene_len
+                )
+            ]
+        raise ValueError(f"Unknown detection method: {method}")
+
     def detect(
         self,
         video_path: Union[str, Path],
         method: str = "content",
-        show_progress: bool = True
+        show_progress: bool = True,
+        mode: Optional[str] = None
     ) -> SceneDetectionResult:
         """Detect scenes in video.
 
@@ -130,12 +286,15 @@ class SceneDetector:
             video_path: Path to video file
             method: Detection method ('content', 'threshold', 'adaptive', 'all')
             show_progress: Show progress bar
+            mode: Override the detector's mode for this call; coarse-to-fine
+                only applies to content detection
 
         Returns:
             SceneDetectionResult object
         """
         video_path = Path(video_path)
-        logger.info(f"Detecting scenes in: {video_path} (method: {method})")
+        mode = mode or self.mode
+        logger.info(f"Detecting scenes in: {video_path} (method: {method}, mode: {mode})")
 
         # Open video
         video = open_video(str(video_path))
@@ -143,32 +302,30 @@ class SceneDetector:
         total_frames = video.duration.get_frames()
         duration = video.duration.get_seconds()
 
+        mode = self._resolve_mode(video, mode)
+
+        if mode == "coarse_to_fine" and method in ("content", "all"):
+            if FlashFilter is None or not HAS_CV2:
+                logger.warning("Coarse-to-fine detection needs PySceneDetect >= 0.6.4 and OpenCV, using exhaustive")
+            else:
+                try:
+                    return self._detect_coarse_to_fine(video_path, video)
+                except Exception as e:
+                    logger.warning(f"Coarse-to-fine detection failed ({e}), using exhaustive")
+                    video.reset()
+
+        if method in ("content", "all") and FlashFilter is not None:
+            shards = self._frame_shards(total_frames, fps)
+            if len(shards) > 1:
+                _close_video(video)
+                try:
+                    return self._detect_sharded(video_path, shards, fps, total_frames)
+                except Exception as e:
+                    logger.warning(f"Sharded scene detection failed ({e}), using a single pass")
+                    video = open_video(str(video_path))
+
         # Create detector(s)
-        if method == "content":
-            detectors = [ContentDetector(
-                threshold=self.content_threshold,
-                min_scene_len=int(self.min_scene_length * fps)
-            )]
-        elif method == "threshold":
-            detectors = [ThresholdDetector(
-                threshold=self.threshold_threshold,
-                min_scene_len=int(self.min_scene_length * fps)
-            )]
-        elif method == "adaptive":
-            detectors = [AdaptiveDetector(
-                adaptive_threshold=self.adaptive_threshold,
-                min_scene_len=int(self.min_scene_length * fps)
-            )]
-        elif method == "all":
-            # Use multiple detectors
-            detectors = [
-                ContentDetector(
-                    threshold=self.content_threshold,
-                    min_scene_len=int(self.min_scene_length * fps)
-                )
-            ]
-        else:
-            raise ValueError(f"Unknown detection method: {method}")
+        detectors = self.create_detectors(method, fps)
 
         # Create scene manager
         scene_manager = SceneManager()
@@ -179,14 +336,7 @@ class SceneDetector:
         scene_manager.detect_scenes(video, show_progress=show_progress)
         scene_list = scene_manager.get_scene_list()
 
-        # Close video (API varies by version)
-        try:
-            if hasattr(video, 'release'):
-                video.release()
-            elif hasattr(video, 'close'):
-                video.close()
-        except Exception:
-            pass  # Video cleanup is optional
+        _close_video(video)
 
         # Convert to DetectedScene objects
         scenes = []
@@ -207,7 +357,248 @@ class SceneDetector:
             scenes=scenes,
             video_duration=duration,
             video_fps=fps,
-            total_frames=total_frames
+            total_frames=total_frames,
+            stats={"mode": "exhaustive", "decoded_frames": total_frames}
+        )
+
+    def _resolve_mode(self, video: Any, mode: str) -> str:
+        """Resolve "auto" to a concrete mode from the source resolution."""
+        if mode == "auto":
+            min_height = get_config().scene.coarse_min_height
+            return "coarse_to_fine" if video.frame_size[1] >= min_height else "exhaustive"
+        return mode
+
+    def plan(self, video_path: Union[str, Path], method: str = "content") -> str:
+        """Report how detect() will process a video, without decoding it.
+
+        Args:
+            video_path: Path to video file
+            method: Detection method (see detect)
+
+        Returns:
+            "coarse_to_fine", "sharded" or "single_pass"
+        """
+        video = open_video(str(video_path))
+        try:
+            mode = self._resolve_mode(video, self.mode)
+            if method not in ("content", "all") or FlashFilter is None:
+                return "single_pass"
+            if mode == "coarse_to_fine" and HAS_CV2:
+                return "coarse_to_fine"
+            if len(self._frame_shards(video.duration.get_frames(), video.frame_rate)) > 1:
+                return "sharded"
+            return "single_pass"
+        finally:
+            _close_video(video)
+
+    def _detect_coarse_to_fine(self, video_path: Path, video: Any) -> SceneDetectionResult:
+        """Content detection that fully decodes only frames near candidate cuts.
+
+        Args:
+            video_path: Path to video file
+            video: Opened PySceneDetect video stream (closed on return)
+
+        Returns:
+            SceneDetectionResult in the same format as the exhaustive pass
+        """
+        scene_cfg = get_config().scene
+        fps = video.frame_rate
+        total_frames = video.duration.get_frames()
+        duration = video.duration.get_seconds()
+        min_scene_len = int(self.min_scene_length * fps)
+
+        # Steps 1-2: candidate intervals from the cheap pass, widened into frame
+        # windows. Both are streamed so refinement overlaps the ffmpeg pass
+        candidates = self._coarse_candidates(video_path, video.frame_size)
+        windows = _refine_windows(candidates, scene_cfg.refine_margin, fps, total_frames)
+
+        # Step 3: exact per-frame scores inside each window at native resolution
+        seek_gap = int(scene_cfg.refine_seek_gap * fps)
+        above: List[int] = []
+        refined_frames = 0
+        num_windows = 0
+        for first, last in windows:
+            num_windows += 1
+
+            # Start one frame early: a frame's score compares it to the previous one.
+            # Short gaps are skipped without colour conversion rather than
+            # seeking, which restarts decoding at the previous keyframe
+            skip = first - 1 - video.frame_number
+            if 0 <= skip <= seek_gap:
+                for _ in range(skip):
+                    if video.read(decode=False) is False:
+                        break
+            else:
+                video.seek(first - 1)
+            above.extend(_score_frames(video, first, last, self.content_threshold, fps))
+            refined_frames += last - first + 2
+
+        _close_video(video)
+
+        # Step 4: the detector's min-scene-length filter over the whole timeline
+        cuts = _replay_flash_filter(above, min_scene_len, total_frames, fps)
+        scenes = _scenes_from_cuts(cuts, total_frames, fps)
+
+        logger.info(
+            f"Detected {len(scenes)} scenes coarse-to-fine: {num_windows} windows, "
+            f"{refined_frames}/{total_frames} frames refined ({refined_frames / max(1, total_frames):.1%})"
+        )
+
+        return SceneDetectionResult(
+            scenes=scenes,
+            video_duration=duration,
+            video_fps=fps,
+            total_frames=total_frames,
+            stats={
+                "mode": "coarse_to_fine",
+                "refine_windows": num_windows,
+                "decoded_frames": refined_frames
+            }
+        )
+
+    def _frame_shards(self, total_frames: int, fps: float) -> List[Tuple[int, int]]:
+        """Split frames 1..total_frames-1 into ranges for parallel scoring.
+
+        Returns:
+            Inclusive (first, last) frame ranges; a single range means no sharding
+        """
+        scene_cfg = get_config().scene
+        workers = scene_cfg.workers if scene_cfg.workers > 0 else (os.cpu_count() or 1)
+        duration = total_frames / fps if fps else 0.0
+        count = max(1, min(workers, int(duration // max(scene_cfg.shard_min_duration, 1e-9))))
+
+        bounds = np.linspace(1, total_frames, count + 1).astype(int)
+        return [(int(bounds[i]), int(bounds[i + 1]) - 1) for i in range(count)]
+
+    def _detect_sharded(
+        self,
+        video_path: Path,
+        shards: List[Tuple[int, int]],
+        fps: float,
+        total_frames: int
+    ) -> SceneDetectionResult:
+        """Exhaustive content detection with shards scored in a process pool.
+
+        A frame's score only depends on that frame and the one before it, so
+        each worker seeks to one frame before its range and scores exactly
+        the frames it owns. The min-scene-length filter is then replayed over
+        the stitched scores, which reconciles cuts near shard edges the same
+        way a single pass would.
+
+        Args:
+            video_path: Path to video file
+            shards: Inclusive (first, last) frame ranges covering the video
+            fps: Frame rate
+            total_frames: Number of frames in the video
+
+        Returns:
+            SceneDetectionResult identical to a sequential exhaustive pass
+        """
+        logger.info(f"Scoring {total_frames} frames in {len(shards)} shards")
+
+        # spawn: the caller may already hold decoder or torch state
+        with ProcessPoolExecutor(
+            max_workers=len(shards),
+            mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = [
+                executor.submit(_detect_shard, str(video_path), first, last, self.content_threshold)
+                for first, last in shards
+            ]
+            above: List[int] = []
+            for i, future in enumerate(futures):
+                above.extend(future.result())
+                logger.debug(f"Shard {i + 1}/{len(shards)} scored")
+
+        min_scene_len = int(self.min_scene_length * fps)
+        cuts = _replay_flash_filter(above, min_scene_len, total_frames, fps)
+        scenes = _scenes_from_cuts(cuts, total_frames, fps)
+
+        logger.info(f"Detected {len(scenes)} scenes (avg duration: {sum(s.duration for s in scenes)/len(scenes) if scenes else 0:.2f}s)")
+
+        return SceneDetectionResult(
+            scenes=scenes,
+            video_duration=float(total_frames / fps),
+            video_fps=fps,
+            total_frames=total_frames,
+            stats={"mode": "exhaustive", "decoded_frames": total_frames, "shards": len(shards)}
+        )
+
+    def _coarse_candidates(
+        self,
+        video_path: Path,
+        frame_size: Tuple[int, int]
+    ) -> Iterator[Tuple[float, float]]:
+        """Yield time intervals that may contain a cut, from a cheap ffmpeg pass.
+
+        ffmpeg decodes reference frames only, skips the deblocking filter,
+        samples the stream at ``coarse_fps`` and downscales it, all in its own
+        process. Consecutive samples are compared with ContentDetector's HSV
+        metric against a lowered threshold.
+
+        Yields:
+            (start, end) intervals in seconds, in time order
+
+        Raises:
+            RuntimeError: If ffmpeg fails
+        """
+        scene_cfg = get_config().scene
+        width = scene_cfg.coarse_width
+        height = max(2, int(round(width * frame_size[1] / frame_size[0] / 2)) * 2)
+        step = 1.0 / scene_cfg.coarse_fps
+        threshold = self.content_threshold * scene_cfg.coarse_threshold_ratio
+
+        cmd = [
+            'ffmpeg', '-hide_banner', '-loglevel', 'error', '-nostdin',
+            '-skip_frame', 'noref', '-skip_loop_filter', 'all',
+            '-i', str(video_path),
+            '-an', '-sn', '-dn',
+            '-vf', f'fps={scene_cfg.coarse_fps},scale={width}:{height}:flags=area',
+            '-pix_fmt', 'bgr24', '-f', 'rawvideo', 'pipe:1'
+        ]
+        frame_bytes = width * height * 3
+
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        previous = None
+        index = 0
+        candidates = 0
+        try:
+            while True:
+                data = proc.stdout.read(frame_bytes)
+                if len(data) < frame_bytes:
+                    break
+                frame = np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3)
+                hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+                if previous is not None:
+                    # Mean of the per-channel mean absolute differences (H, S, V)
+                    score = float(cv2.absdiff(hsv, previous).mean())
+                    if score >= threshold:
+                        candidates += 1
+                        yield ((index - 1) * step, index * step)
+                previous = hsv
+                index += 1
+        finally:
+            # Also reached when the consumer stops early
+            if proc.poll() is None:
+                proc.kill()
+            proc.stdout.close()
+            returncode = proc.wait()
+
+        if returncode != 0 or index == 0:
+            raise RuntimeError(f"coarse ffmpeg pass failed (exit {returncode})")
+
+        logger.debug(f"Coarse pass: {index} samples, {candidates} candidate intervals")
+
+    def create_fade_detector(self, fps: float) -> Any:
+        """Create a detector that records fade spans next to content detection.
+
+        Feed it the same frames as the content detector, then pass its
+        ``fade_spans`` to mark_fades.
+        """
+        return _FadeSpanDetector(
+            threshold=self.threshold_threshold,
+            min_scene_len=int(self.min_scene_length * fps),
+            fade_bias=0.5  # Balance between fade-in and fade-out
         )
 
     def detect_with_fades(
@@ -217,6 +608,11 @@ class SceneDetector:
     ) -> SceneDetectionResult:
         """Detect scenes including fade transitions.
 
+        Content and fade detection share one decode: both detectors run in
+        the same SceneManager. Scene boundaries come from content detection;
+        a boundary inside (or next to) a fade-out/fade-in span is marked as a
+        fade.
+
         Args:
             video_path: Path to video file
             show_progress: Show progress bar
@@ -227,43 +623,45 @@ class SceneDetector:
         video_path = Path(video_path)
         logger.info(f"Detecting scenes with fade detection: {video_path}")
 
-        # First pass: content detection
-        content_result = self.detect(video_path, method="content", show_progress=show_progress)
-
-        # Second pass: threshold detection for fades
         video = open_video(str(video_path))
         fps = video.frame_rate
+        total_frames = video.duration.get_frames()
+        duration = video.duration.get_seconds()
 
-        fade_detector = ThresholdDetector(
-            threshold=self.threshold_threshold,
-            min_scene_len=int(self.min_scene_length * fps),
-            fade_bias=0.5  # Balance between fade-in and fade-out
-        )
+        fade_detector = self.create_fade_detector(fps)
 
         scene_manager = SceneManager()
+        for detector in self.create_detectors("content", fps):
+            scene_manager.add_detector(detector)
         scene_manager.add_detector(fade_detector)
-        scene_manager.detect_scenes(video, show_progress=False)
-        fade_scenes = scene_manager.get_scene_list()
+        scene_manager.detect_scenes(video, show_progress=show_progress)
+        scene_list = scene_manager.get_scene_list()
 
-        # Close video (API varies by version)
-        try:
-            if hasattr(video, 'release'):
-                video.release()
-            elif hasattr(video, 'close'):
-                video.close()
-        except Exception:
-            pass
+        _close_video(video)
 
-        # Mark fade transitions
-        fade_times = set()
-        for start, end in fade_scenes:
-            fade_times.add(round(start.get_seconds(), 1))
+        scenes = [
+            DetectedScene(
+                id=f"scene_{i+1:04d}",
+                start_time=start.get_seconds(),
+                end_time=end.get_seconds(),
+                start_frame=start.get_frames(),
+                end_frame=end.get_frames(),
+                transition_type="cut"
+            )
+            for i, (start, end) in enumerate(scene_list)
+        ]
+        fade_spans = fade_detector.fade_spans
+        mark_fades(scenes, fade_spans, fps)
 
-        for scene in content_result.scenes:
-            if round(scene.start_time, 1) in fade_times:
-                scene.transition_type = "fade"
+        logger.info(f"Detected {len(scenes)} scenes, {sum(s.transition_type == 'fade' for s in scenes)} fades")
 
-        return content_result
+        return SceneDetectionResult(
+            scenes=scenes,
+            video_duration=duration,
+            video_fps=fps,
+            total_frames=total_frames,
+            stats={"mode": "exhaustive", "decoded_frames": total_frames, "fade_spans": len(fade_spans)}
+        )
 
     def get_scene_at_time(
         self,
@@ -279,10 +677,10 @@ class SceneDetector:
         Returns:
             DetectedScene or None
         """
-        for scene in scenes:
-            if scene.start_time <= timestamp <= scene.end_time:
-                return scene
-        return None
+        # Index the list once; repeated lookups on it are O(log n)
+        if self._scene_index is None or not self._scene_index.is_built_from(scenes):
+            self._scene_index = SceneIndex(scenes)
+        return self._scene_index.covering(timestamp, skip_used=False)
 
     def merge_short_scenes(
         self,
@@ -323,3 +721,178 @@ class SceneDetector:
 
         logger.info(f"Merged {len(scenes)} scenes to {len(merged)} scenes")
         return merged
+
+
+def mark_fades(
+    scenes: List[DetectedScene],
+    fade_spans: List[Tuple[int, int]],
+    fps: float
+) -> int:
+    """Mark scene boundaries inside (or next to) a fade span as fades.
+
+    Args:
+        scenes: Scenes in time order (transition_type is updated in place)
+        fade_spans: (fade-out frame, fade-in frame) spans in time order
+        fps: Frame rate
+
+    Returns:
+        Number of scenes marked as fades
+    """
+    # Both lists are in time order, so one walk classifies every boundary
+    tolerance = int(FADE_MATCH_TOLERANCE * fps)
+    span_index = 0
+    fades = 0
+
+    for i, scene in enumerate(scenes):
+        while span_index < len(fade_spans) and fade_spans[span_index][1] + tolerance < scene.start_frame:
+            span_index += 1
+        if (
+            i > 0
+            and span_index < len(fade_spans)
+            and fade_spans[span_index][0] - tolerance <= scene.start_frame
+        ):
+            scene.transition_type = "fade"
+            fades += 1
+
+    return fades
+
+
+def _close_video(video: Any) -> None:
+    """Release a PySceneDetect video stream (API varies by version)."""
+    try:
+        if hasattr(video, 'release'):
+            video.release()
+        elif hasattr(video, 'close'):
+            video.close()
+    except Exception:
+        pass  # Video cleanup is optional
+
+
+def _score_frames(video: Any, first: int, last: int, threshold: float, fps: float) -> List[int]:
+    """Score frames first..last with ContentDetector from the current position.
+
+    The stream must be positioned at or before ``first - 1``: a frame's score
+    compares it with the previous frame.
+
+    Returns:
+        Frame numbers in [first, last] whose score reaches the threshold
+    """
+    stats = StatsManager()
+    scene_manager = SceneManager(stats_manager=stats)
+    # Min scene length is applied over the whole timeline by the caller
+    scene_manager.add_detector(ContentDetector(threshold=threshold, min_scene_len=0))
+    scene_manager.detect_scenes(video, end_time=FrameTimecode(last + 1, fps), show_progress=False)
+
+    above = []
+    for frame_num in range(first, last + 1):
+        score = stats.get_metrics(frame_num, [ContentDetector.FRAME_SCORE_KEY])[0]
+        if score is not None and score >= threshold:
+            above.append(frame_num)
+    return above
+
+
+def _detect_shard(video_path: str, first: int, last: int, threshold: float) -> List[int]:
+    """Process pool worker: above-threshold frames of one shard."""
+    video = open_video(video_path)
+    try:
+        video.seek(first - 1)
+        return _score_frames(video, first, last, threshold, video.frame_rate)
+    finally:
+        _close_video(video)
+
+
+def _scenes_from_cuts(cuts: List[int], total_frames: int, fps: float) -> List[DetectedScene]:
+    """Build DetectedScenes from cut frames like SceneManager.get_scene_list."""
+    boundaries = [0] + cuts + [total_frames] if cuts else []
+    scenes = []
+    for i in range(len(boundaries) - 1):
+        start, end = boundaries[i], boundaries[i + 1]
+        scenes.append(DetectedScene(
+            id=f"scene_{i+1:04d}",
+            start_time=float(start / fps),
+            end_time=float(end / fps),
+            start_frame=start,
+            end_frame=end,
+            transition_type="cut"
+        ))
+    return scenes
+
+
+def _refine_windows(
+    intervals: Iterable[Tuple[float, float]],
+    margin: float,
+    fps: float,
+    total_frames: int
+) -> Iterator[Tuple[int, int]]:
+    """Turn candidate time intervals into inclusive frame windows to refine.
+
+    Each interval is widened by ``margin`` seconds on both sides. Windows
+    closer than REFINE_MERGE_GAP are joined, since decoding forward through
+    the gap is cheaper than seeking again. Frame 0 is never refined: it has
+    no score.
+
+    Args:
+        intervals: (start, end) seconds, in time order
+        margin: Seconds to add on each side
+        fps: Frame rate
+        total_frames: Number of frames in the video
+
+    Yields:
+        (first, last) frame numbers, in time order
+    """
+    merge_gap = int(REFINE_MERGE_GAP * fps)
+    current = None
+    for start, end in intervals:
+        first = max(1, int(math.floor((start - margin) * fps)))
+        last = min(total_frames - 1, int(math.ceil((end + margin) * fps)))
+        if first > last:
+            continue
+        if current and first <= current[1] + merge_gap:
+            current = (current[0], max(current[1], last))
+        else:
+            if current:
+                yield current
+            current = (first, last)
+    if current:
+        yield current
+
+
+def _replay_flash_filter(
+    above: List[int],
+    min_scene_len: int,
+    total_frames: int,
+    fps: float
+) -> List[int]:
+    """Apply ContentDetector's min-scene-length filter to above-threshold frames.
+
+    Equivalent to feeding every frame of the video through the filter: it
+    only changes state on above-threshold frames, and can only emit on a
+    below-threshold frame exactly min_scene_len frames after the last
+    above-threshold one. So only frame 0, the above frames and those
+    follow-up frames are fed.
+
+    Args:
+        above: Sorted frame numbers whose score reached the threshold
+        min_scene_len: Minimum scene length in frames
+        total_frames: Number of frames in the video
+        fps: Frame rate
+
+    Returns:
+        Sorted cut frame numbers
+    """
+    above_set = set(above)
+    events = {0, *above}
+    events.update(f + min_scene_len for f in above if f + min_scene_len < total_frames)
+
+    flash_filter = FlashFilter(FlashFilter.Mode.MERGE, min_scene_len)
+    timecode_api = "timecode" in inspect.signature(flash_filter.filter).parameters
+
+    cuts = []
+    for frame_num in sorted(events):
+        is_above = frame_num in above_set
+        if timecode_api:
+            emitted = flash_filter.filter(FrameTimecode(frame_num, fps), is_above)
+            cuts.extend(tc.get_frames() for tc in emitted)
+        else:
+            cuts.extend(flash_filter.filter(frame_num, is_above))
+    return cuts
@@ -0,0 +1,227 @@
+"""Voice activity detection and speech-only chunk planning for ASR.
+
+A VAD pre-pass over the shared PCM buffer finds speech regions. Regions are
+packed into ASR chunks that are cut only at silences, and everything between
+regions (music, action, silence) is left out, so Whisper only ever decodes
+speech. Each chunk remembers where its pieces came from, so transcript
+timestamps map back to source time without overlap or text deduplication.
+
+Uses Silero VAD when installed (robust to music); otherwise falls back to an
+adaptive energy detector.
+"""
+
+import bisect
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+import numpy as np
+from loguru import logger
+
+try:
+    from silero_vad import load_silero_vad, get_speech_timestamps
+    HAS_SILERO_VAD = True
+except ImportError:
+    HAS_SILERO_VAD = False
+
+from .pcm_audio import PCMAudio
+from config.constants import (
+    ASR_VAD_MIN_SILENCE, ASR_VAD_MIN_SPEECH, ASR_VAD_SPEECH_PAD
+)
+
+
+# Silence inserted between non-adjacent pieces of a chunk (seconds)
+PIECE_GAP = 0.5
+
+# Energy VAD: speech must be this far above the noise floor (dB)
+ENERGY_MARGIN_DB = 12.0
+ENERGY_MIN_THRESHOLD_DB = -50.0
+ENERGY_FRAME = 0.03  # seconds
+
+
+@dataclass
+class SpeechChunk:
+    """A batch of speech regions transcribed as one Whisper input."""
+    idx: int
+    pieces: List[Tuple[int, int]] = field(default_factory=list)  # source sample ranges
+    gap_samples: int = 0
+
+    @property
+    def num_samples(self) -> int:
+        pieces = sum(end - start for start, end in self.pieces)
+        return pieces + self.gap_samples * max(0, len(self.pieces) - 1)
+
+    def assemble(self, samples: np.ndarray) -> np.ndarray:
+        """Build the chunk's audio from the source buffer.
+
+        A single piece is returned as a zero-copy view; multiple pieces are
+        joined with short silences so Whisper sees clear boundaries.
+        """
+        if len(self.pieces) == 1:
+            start, end = self.pieces[0]
+            return samples[start:end]
+
+        out = np.zeros(self.num_samples, dtype=samples.dtype)
+        pos = 0
+        for start, end in self.pieces:
+            out[pos:pos + end - start] = samples[start:end]
+            pos += end - start + self.gap_samples
+        return out
+
+    def to_source_time(self, t: float, sample_rate: int) -> float:
+        """Map a time within the assembled chunk back to source time (seconds)."""
+        offsets = self._offsets()
+        sample = t * sample_rate
+        i = max(0, bisect.bisect_right(offsets, sample) - 1)
+        start, end = self.pieces[i]
+        # Times that land in an inserted gap snap to the end of the piece
+        return min(start + (sample - offsets[i]), end) / sample_rate
+
+    def _offsets(self) -> List[int]:
+        offsets = []
+        pos = 0
+        for start, end in self.pieces:
+            offsets.append(pos)
+            pos += end - start + self.gap_samples
+        return offsets
+
+
+def vad_params() -> Dict[str, Any]:
+    """VAD backend and settings (used to version cached transcripts)."""
+    return {
+        "backend": "silero" if HAS_SILERO_VAD else "energy",
+        "min_silence": ASR_VAD_MIN_SILENCE,
+        "min_speech": ASR_VAD_MIN_SPEECH,
+        "speech_pad": ASR_VAD_SPEECH_PAD,
+        "piece_gap": PIECE_GAP,
+    }
+
+
+def detect_speech_regions(
+    pcm: PCMAudio,
+    min_silence: float = ASR_VAD_MIN_SILENCE,
+    min_speech: float = ASR_VAD_MIN_SPEECH,
+    speech_pad: float = ASR_VAD_SPEECH_PAD
+) -> List[Tuple[float, float]]:
+    """Find speech regions in decoded audio.
+
+    Args:
+        pcm: Decoded 16 kHz mono audio
+        min_silence: Pauses shorter than this stay inside a region (seconds)
+        min_speech: Regions shorter than this are dropped (seconds)
+        speech_pad: Padding added around each region (seconds)
+
+    Returns:
+        Sorted, non-overlapping (start, end) times in seconds
+    """
+    if len(pcm.samples) == 0:
+        return []
+
+    if HAS_SILERO_VAD:
+        try:
+            regions = _silero_regions(pcm, min_silence, min_speech)
+            return _pad_and_merge(regions, speech_pad, pcm.duration)
+        except Exception as e:
+            logger.warning(f"Silero VAD failed: {e}, using energy VAD")
+
+    regions = _energy_regions(pcm, min_silence, min_speech)
+    return _pad_and_merge(regions, speech_pad, pcm.duration)
+
+
+def _silero_regions(
+    pcm: PCMAudio,
+    min_silence: float,
+    min_speech: float
+) -> List[Tuple[float, float]]:
+    """Speech regions from Silero VAD."""
+    import torch
+
+    model = load_silero_vad()
+    timestamps = get_speech_timestamps(
+        torch.from_numpy(np.asarray(pcm.samples)),
+        model,
+        sampling_rate=pcm.sample_rate,
+        min_silence_duration_ms=int(min_silence * 1000),
+        min_speech_duration_ms=int(min_speech * 1000),
+        return_seconds=True
+    )
+    return [(float(ts["start"]), float(ts["end"])) for ts in timestamps]
+
+
+def _energy_regions(
+    pcm: PCMAudio,
+    min_silence: float,
+    min_speech: float
+) -> List[Tuple[float, float]]:
+    """Speech regions from frame energy above an adaptive noise floor."""
+    levels = pcm.frame_rms_db(ENERGY_FRAME)
+    if len(levels) == 0:
+        return []
+
+    noise_floor = np.percentile(levels, 10)
+    threshold = max(noise_floor + ENERGY_MARGIN_DB, ENERGY_MIN_THRESHOLD_DB)
+    active = levels > threshold
+
+    edges = np.flatnonzero(np.diff(np.concatenate([[0], active.astype(np.int8), [0]])))
+    regions = []
+    for start, end in zip(edges[::2], edges[1::2]):
+        start_t, end_t = float(start * ENERGY_FRAME), float(end * ENERGY_FRAME)
+        # Bridge short pauses
+        if regions and start_t - regions[-1][1] < min_silence:
+            regions[-1] = (regions[-1][0], end_t)
+        else:
+            regions.append((start_t, end_t))
+
+    return [(s, e) for s, e in regions if e - s >= min_speech]
+
+
+def _pad_and_merge(
+    regions: List[Tuple[float, float]],
+    pad: float,
+    duration: float
+) -> List[Tuple[float, float]]:
+    """Pad regions and merge any that now touch."""
+    merged: List[Tuple[float, float]] = []
+    for start, end in sorted(regions):
+        start, end = max(0.0, start - pad), min(duration, end + pad)
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def plan_speech_chunks(
+    regions: List[Tuple[float, float]],
+    sample_rate: int,
+    max_duration: float
+) -> List[SpeechChunk]:
+    """Pack speech regions into ASR chunks, cutting only between regions.
+
+    Args:
+        regions: Speech regions from detect_speech_regions
+        sample_rate: Sample rate of the PCM buffer
+        max_duration: Max audio per chunk in seconds
+
+    Returns:
+        Chunks in source order
+    """
+    gap = int(PIECE_GAP * sample_rate)
+    limit = int(max_duration * sample_rate)
+    chunks: List[SpeechChunk] = []
+    current = SpeechChunk(idx=0, gap_samples=gap)
+
+    for start_t, end_t in regions:
+        start, end = int(start_t * sample_rate), int(end_t * sample_rate)
+
+        # Continuous speech longer than a chunk has no silence to cut at
+        pieces = [(s, min(s + limit, end)) for s in range(start, end, limit)]
+
+        for piece in pieces:
+            added = piece[1] - piece[0] + (gap if current.pieces else 0)
+            if current.pieces and current.num_samples + added > limit:
+                chunks.append(current)
+                current = SpeechChunk(idx=len(chunks), gap_samples=gap)
+            current.pieces.append(piece)
+
+    if current.pieces:
+        chunks.append(current)
+    return chunks
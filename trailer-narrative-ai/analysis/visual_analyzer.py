@@ -25,6 +25,10 @@ try:
 except ImportError:
     HAS_CLIP = False
 
+from config import get_config
+from core.model_registry import get_model_registry
+from .frame_stream import SampledFrame
+
 
 @dataclass
 class FrameAnalysis:
@@ -136,11 +140,17 @@ class VisualAnalyzer:
         "suspenseful tense scene": "suspense"
     }
 
+    # Default CLIP model
+    DEFAULT_MODEL = "ViT-B/32"
+
     def __init__(
         self,
-        model_name: str = "ViT-B/32",
+        model_name: str = DEFAULT_MODEL,
         device: Optional[str] = None,
-        frames_per_scene: int = 5
+        frames_per_scene: int = 5,
+        parallel_frames: bool = True,
+        batch_size: int = 16,
+        analysis_width: Optional[int] = None
     ):
         """Initialize visual analyzer.
 
@@ -148,12 +158,19 @@ class VisualAnalyzer:
             model_name: CLIP model name
             device: Device for inference
             frames_per_scene: Number of frames to sample per scene
+            parallel_frames: Batch CLIP inference across frames and scenes
+            batch_size: Frames per CLIP forward pass when batching
+            analysis_width: Width frames are downscaled to for per-frame
+                features (default: config visual.analysis_width)
         """
         if not HAS_CV2:
             raise ImportError("OpenCV is required. Install with: pip install opencv-python")
 
         self.model_name = model_name
         self.frames_per_scene = frames_per_scene
+        self.parallel_frames = parallel_frames
+        self.batch_size = max(1, batch_size) if parallel_frames else 1
+        self.analysis_width = analysis_width or get_config().visual.analysis_width
         self._model = None
         self._preprocess = None
 
@@ -195,7 +212,14 @@ class VisualAnalyzer:
             return
 
         logger.info(f"Loading CLIP model: {self.model_name}")
-        self._model, self._preprocess = clip.load(self.model_name, device=self.device)
+        # Shared via the model registry; released with this analyzer
+        handle = get_model_registry().acquire(
+            "clip", self.model_name,
+            lambda: clip.load(self.model_name, device=self.device),
+            device=self.device,
+            dtype="float16" if self.device == "cuda" else "float32"
+        ).bind(self)
+        self._model, self._preprocess = handle.model
 
         # Pre-encode text categories
         text_tokens = clip.tokenize(self.SCENE_CATEGORIES).to(self.device)
@@ -205,28 +229,55 @@ class VisualAnalyzer:
 
         logger.info("CLIP model loaded")
 
-    def analyze_frame(self, frame: np.ndarray, timestamp: float, frame_number: int) -> FrameAnalysis:
+    def analyze_frame(
+        self,
+        frame: np.ndarray,
+        timestamp: float,
+        frame_number: int,
+        classify: bool = True
+    ) -> FrameAnalysis:
         """Analyze a single frame.
 
         Args:
             frame: BGR frame from OpenCV
             timestamp: Frame timestamp in seconds
             frame_number: Frame number
+            classify: Run CLIP classification (False when the caller batches it)
 
         Returns:
             FrameAnalysis object
         """
-        # Convert to grayscale for basic analysis
+        frame = self._analysis_frame(frame)
         gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        return self._analyze_features(frame, gray, timestamp, frame_number, classify)
+
+    def _analysis_frame(self, frame: np.ndarray) -> np.ndarray:
+        """Downscale a frame to the analysis width (no-op if already that small)."""
+        height, width = frame.shape[:2]
+        if width <= self.analysis_width:
+            return frame
+
+        scale = self.analysis_width / width
+        return cv2.resize(
+            frame, (self.analysis_width, max(1, int(height * scale))),
+            interpolation=cv2.INTER_AREA
+        )
 
-        # Calculate brightness (mean intensity)
-        brightness = np.mean(gray) / 255.0
-
-        # Calculate contrast (standard deviation)
-        contrast = np.std(gray) / 128.0
-        contrast = min(1.0, contrast)
-
-        # Detect faces
+    def _analyze_features(
+        self,
+        frame: np.ndarray,
+        gray: np.ndarray,
+        timestamp: float,
+        frame_number: int,
+        classify: bool
+    ) -> FrameAnalysis:
+        """Per-frame features from an analysis-resolution frame and its grayscale."""
+        # Brightness (mean intensity) and contrast (standard deviation) in one pass
+        mean, std = cv2.meanStdDev(gray)
+        brightness = float(mean[0, 0]) / 255.0
+        contrast = min(1.0, float(std[0, 0]) / 128.0)
+
+        # Detect faces (minSize is in analysis-frame pixels, as for shared decode)
         faces = self._face_cascade.detectMultiScale(
             gray, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30)
         )
@@ -239,37 +290,8 @@ class VisualAnalyzer:
         categories = {}
         dominant_category = "unknown"
 
-        if self._model is not None and HAS_CLIP:
-            try:
-                # Convert frame to PIL Image
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                image = Image.fromarray(frame_rgb)
-
-                # Preprocess and encode
-                image_input = self._preprocess(image).unsqueeze(0).to(self.device)
-
-                with torch.no_grad():
-                    image_features = self._model.encode_image(image_input)
-                    image_features /= image_features.norm(dim=-1, keepdim=True)
-
-                    # Calculate similarities
-                    similarities = (image_features @ self._text_features.T).squeeze(0)
-                    probs = similarities.softmax(dim=0).cpu().numpy()
-
-                # Map to simplified categories
-                for i, cat in enumerate(self.SCENE_CATEGORIES):
-                    simple_cat = self.CATEGORY_MAP.get(cat, cat)
-                    categories[simple_cat] = float(probs[i])
-
-                # Get dominant category
-                max_idx = np.argmax(probs)
-                dominant_category = self.CATEGORY_MAP.get(
-                    self.SCENE_CATEGORIES[max_idx],
-                    self.SCENE_CATEGORIES[max_idx]
-                )
-
-            except Exception as e:
-                logger.warning(f"CLIP analysis failed: {e}")
+        if classify:
+            categories, dominant_category = self.classify_frames([frame])[0]
 
         return FrameAnalysis(
             timestamp=timestamp,
@@ -283,6 +305,60 @@ class VisualAnalyzer:
             colors=colors
         )
 
+    def classify_frames(
+        self,
+        frames: List[np.ndarray]
+    ) -> List[Tuple[Dict[str, float], str]]:
+        """Classify frames with CLIP in a single batched forward pass.
+
+        Args:
+            frames: BGR frames from OpenCV
+
+        Returns:
+            List of (categories, dominant_category) per frame
+        """
+        empty = [({}, "unknown") for _ in frames]
+
+        if not frames or self._model is None or not HAS_CLIP:
+            return empty
+
+        try:
+            # Convert frames to PIL Images and preprocess into one tensor
+            image_input = torch.stack([
+                self._preprocess(Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)))
+                for frame in frames
+            ]).to(self.device)
+
+            with torch.no_grad():
+                image_features = self._model.encode_image(image_input)
+                image_features /= image_features.norm(dim=-1, keepdim=True)
+
+                # Calculate similarities against cached text features
+                similarities = image_features @ self._text_features.T
+                probs = similarities.softmax(dim=-1).cpu().numpy()
+
+        except Exception as e:
+            logger.warning(f"CLIP analysis failed: {e}")
+            return empty
+
+        results = []
+        for frame_probs in probs:
+            # Map to simplified categories
+            categories = {}
+            for i, cat in enumerate(self.SCENE_CATEGORIES):
+                simple_cat = self.CATEGORY_MAP.get(cat, cat)
+                categories[simple_cat] = float(frame_probs[i])
+
+            # Get dominant category
+            max_idx = np.argmax(frame_probs)
+            dominant_category = self.CATEGORY_MAP.get(
+                self.SCENE_CATEGORIES[max_idx],
+                self.SCENE_CATEGORIES[max_idx]
+            )
+            results.append((categories, dominant_category))
+
+        return results
+
     def _get_dominant_colors(
         self,
         frame: np.ndarray,
@@ -299,21 +375,20 @@ class VisualAnalyzer:
         """
         # Resize for faster processing
         small = cv2.resize(frame, (100, 100))
-        pixels = small.reshape(-1, 3)
-
-        # Simple k-means would be better, but using histogram for speed
-        # Convert to RGB
-        pixels_rgb = pixels[:, ::-1]
 
-        # Quantize colors
-        quantized = (pixels_rgb // 32) * 32
+        # Simple k-means would be better, but using histogram for speed:
+        # quantize each channel to 3 bits and pack as an RGB key (0-511)
+        quantized = (small.reshape(-1, 3) >> 5).astype(np.intp)
+        keys = (quantized[:, 2] << 6) | (quantized[:, 1] << 3) | quantized[:, 0]
+        counts = np.bincount(keys, minlength=512)
 
-        # Find most common colors
-        unique, counts = np.unique(quantized, axis=0, return_counts=True)
-        top_indices = np.argsort(counts)[-n_colors:]
+        # Most common colors first (ties: higher RGB key first)
+        top_keys = np.argsort(counts, kind="stable")[-n_colors:][::-1]
 
-        colors = [tuple(int(c) for c in unique[i]) for i in top_indices[::-1]]
-        return colors
+        return [
+            (int(key >> 6) * 32, int((key >> 3) & 7) * 32, int(key & 7) * 32)
+            for key in top_keys if counts[key] > 0
+        ]
 
     def compute_motion_score(
         self,
@@ -329,10 +404,13 @@ class VisualAnalyzer:
         Returns:
             Motion score (0-1)
         """
-        # Convert to grayscale
-        prev_gray = cv2.cvtColor(prev_frame, cv2.COLOR_BGR2GRAY)
-        curr_gray = cv2.cvtColor(curr_frame, cv2.COLOR_BGR2GRAY)
+        # Convert to grayscale at analysis resolution
+        prev_gray = cv2.cvtColor(self._analysis_frame(prev_frame), cv2.COLOR_BGR2GRAY)
+        curr_gray = cv2.cvtColor(self._analysis_frame(curr_frame), cv2.COLOR_BGR2GRAY)
+        return self._motion_score(prev_gray, curr_gray)
 
+    def _motion_score(self, prev_gray: np.ndarray, curr_gray: np.ndarray) -> float:
+        """Motion score between two grayscale analysis frames."""
         # Compute absolute difference
         diff = cv2.absdiff(prev_gray, curr_gray)
 
@@ -340,7 +418,7 @@ class VisualAnalyzer:
         _, thresh = cv2.threshold(diff, 25, 255, cv2.THRESH_BINARY)
 
         # Calculate percentage of changed pixels
-        motion_score = np.sum(thresh > 0) / thresh.size
+        motion_score = cv2.countNonZero(thresh) / thresh.size
 
         return min(1.0, motion_score * 5)  # Scale up and cap at 1
 
@@ -365,19 +443,27 @@ class VisualAnalyzer:
         video_path = Path(video_path)
         cap = cv2.VideoCapture(str(video_path))
 
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        duration = end_time - start_time
-
         # Calculate frame timestamps to sample
-        if duration <= 0:
+        if end_time - start_time <= 0:
             cap.release()
             return self._empty_scene_analysis(scene_id, start_time, end_time)
 
+        samples = self._read_scene_samples(cap, start_time, end_time)
+        cap.release()
+
+        return self.analyze_sampled_frames(scene_id, start_time, end_time, samples)
+
+    def _read_scene_samples(
+        self,
+        cap: "cv2.VideoCapture",
+        start_time: float,
+        end_time: float
+    ) -> List[SampledFrame]:
+        """Seek and read evenly spaced frames of a scene from an open capture."""
         # Sample frames evenly across the scene
         sample_times = np.linspace(start_time, end_time, self.frames_per_scene + 2)[1:-1]
 
-        frames = []
-        prev_frame = None
+        samples = []
 
         for timestamp in sample_times:
             # Seek to timestamp
@@ -388,16 +474,32 @@ class VisualAnalyzer:
                 continue
 
             frame_number = int(cap.get(cv2.CAP_PROP_POS_FRAMES))
-            analysis = self.analyze_frame(frame, timestamp, frame_number)
+            # Keep only the analysis-resolution frame (features and CLIP use it)
+            samples.append(SampledFrame(timestamp, frame_number, self._analysis_frame(frame)))
 
-            # Compute motion if we have previous frame
-            if prev_frame is not None:
-                analysis.motion_score = self.compute_motion_score(prev_frame, frame)
+        return samples
 
-            frames.append(analysis)
-            prev_frame = frame.copy()
+    def analyze_sampled_frames(
+        self,
+        scene_id: str,
+        start_time: float,
+        end_time: float,
+        samples: List[SampledFrame]
+    ) -> SceneVisualAnalysis:
+        """Analyze already-decoded frames of a scene.
 
-        cap.release()
+        Used by analyze_scene and by the shared single-pass decoder.
+
+        Args:
+            scene_id: Scene identifier
+            start_time: Scene start time in seconds
+            end_time: Scene end time in seconds
+            samples: Decoded frames in time order
+
+        Returns:
+            SceneVisualAnalysis object
+        """
+        frames = self._analyze_samples(samples, classify=True)
 
         if not frames:
             return self._empty_scene_analysis(scene_id, start_time, end_time)
@@ -405,6 +507,36 @@ class VisualAnalyzer:
         # Aggregate analysis
         return self._aggregate_scene_analysis(scene_id, start_time, end_time, frames)
 
+    def _analyze_samples(
+        self,
+        samples: List[SampledFrame],
+        classify: bool
+    ) -> List[FrameAnalysis]:
+        """Run per-frame analysis and motion scoring over a scene's samples."""
+        frames = []
+        prev_gray = None
+
+        for sample in samples:
+            # One grayscale analysis frame per sample, shared with motion scoring
+            image = self._analysis_frame(sample.image)
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            analysis = self._analyze_features(
+                image, gray, sample.timestamp, sample.frame_number, classify=classify
+            )
+
+            # Compute motion if we have previous frame
+            if prev_gray is not None:
+                analysis.motion_score = self._motion_score(prev_gray, gray)
+
+            frames.append(analysis)
+            prev_gray = gray
+
+        return frames
+
+    def scene_batcher(self) -> "SceneBatcher":
+        """Create a batcher that classifies frames across scenes in batches."""
+        return SceneBatcher(self)
+
     def _empty_scene_analysis(
         self,
         scene_id: str,
@@ -488,21 +620,26 @@ class VisualAnalyzer:
         # Load CLIP model
         self._load_clip_model()
 
-        scene_analyses = []
-        total_frames = 0
+        batcher = self.scene_batcher()
+        cap = cv2.VideoCapture(str(video_path))
 
-        for i, scene in enumerate(scenes):
-            if show_progress and i % 10 == 0:
-                logger.info(f"Analyzing scene {i+1}/{len(scenes)}")
+        try:
+            for i, scene in enumerate(scenes):
+                if show_progress and i % 10 == 0:
+                    logger.info(f"Analyzing scene {i+1}/{len(scenes)}")
 
-            analysis = self.analyze_scene(
-                video_path,
-                scene.get("id", f"scene_{i}"),
-                scene.get("start_time", 0),
-                scene.get("end_time", 0)
-            )
-            scene_analyses.append(analysis)
-            total_frames += len(analysis.frames)
+                start_time = scene.get("start_time", 0)
+                end_time = scene.get("end_time", 0)
+                samples = []
+                if end_time - start_time > 0:
+                    samples = self._read_scene_samples(cap, start_time, end_time)
+
+                batcher.add(scene.get("id", f"scene_{i}"), start_time, end_time, samples)
+        finally:
+            cap.release()
+
+        scene_analyses = batcher.finish()
+        total_frames = sum(len(a.frames) for a in scene_analyses)
 
         logger.info(f"Visual analysis complete: {len(scene_analyses)} scenes, {total_frames} frames")
 
@@ -511,3 +648,79 @@ class VisualAnalyzer:
             scenes=scene_analyses,
             total_frames_analyzed=total_frames
         )
+
+
+class SceneBatcher:
+    """Classify sampled frames with CLIP in fixed-size batches across scenes.
+
+    Cheap per-frame features (brightness, faces, colors, motion) are computed
+    as scenes arrive; frames are then queued and classified ``batch_size`` at a
+    time with one encode_image call and one similarity matmul. Scenes are
+    aggregated, in arrival order, once all of their frames are classified.
+    """
+
+    def __init__(self, analyzer: VisualAnalyzer):
+        self.analyzer = analyzer
+        self.results: List[SceneVisualAnalysis] = []
+        self._pending_scenes: List[Tuple[str, float, float, List[FrameAnalysis]]] = []
+        self._pending_frames: List[FrameAnalysis] = []
+        self._pending_images: List[np.ndarray] = []
+        self._classified_carry = 0
+
+    def add(
+        self,
+        scene_id: str,
+        start_time: float,
+        end_time: float,
+        samples: List[SampledFrame]
+    ) -> None:
+        """Queue a scene's sampled frames for analysis."""
+        frames = self.analyzer._analyze_samples(samples, classify=False)
+        self._pending_scenes.append((scene_id, start_time, end_time, frames))
+        self._pending_frames.extend(frames)
+        self._pending_images.extend(sample.image for sample in samples)
+
+        if len(self._pending_images) >= self.analyzer.batch_size:
+            self._flush()
+
+    def finish(self) -> List[SceneVisualAnalysis]:
+        """Classify any remaining frames and return all scene analyses."""
+        self._flush(final=True)
+        return self.results
+
+    def _flush(self, final: bool = False) -> None:
+        """Classify full batches of queued frames and aggregate completed scenes.
+
+        A partial trailing batch is kept queued unless ``final`` is set.
+        """
+        batch_size = self.analyzer.batch_size
+        queued = len(self._pending_images)
+        limit = queued if final else (queued // batch_size) * batch_size
+
+        for i in range(0, limit, batch_size):
+            batch_frames = self._pending_frames[i:min(i + batch_size, limit)]
+            batch_images = self._pending_images[i:min(i + batch_size, limit)]
+            for frame, (categories, dominant) in zip(
+                batch_frames, self.analyzer.classify_frames(batch_images)
+            ):
+                frame.categories = categories
+                frame.dominant_category = dominant
+
+        self._pending_frames = self._pending_frames[limit:]
+        self._pending_images = self._pending_images[limit:]
+
+        # Scenes are queued in frame order, so the classified frames belong to
+        # a prefix of the pending scenes (the head may be partly classified)
+        classified = self._classified_carry + limit
+        while self._pending_scenes and len(self._pending_scenes[0][3]) <= classified:
+            scene_id, start_time, end_time, frames = self._pending_scenes.pop(0)
+            classified -= len(frames)
+            if frames:
+                analysis = self.analyzer._aggregate_scene_analysis(
+                    scene_id, start_time, end_time, frames
+                )
+            else:
+                analysis = self.analyzer._empty_scene_analysis(scene_id, start_time, end_time)
+            self.results.append(analysis)
+
+        self._classified_carry = classified
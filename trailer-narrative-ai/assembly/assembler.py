@@ -3,10 +3,13 @@
 import os
 import shutil
 import tempfile
+import threading
 import subprocess
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Union, Dict, Any
+from typing import Callable, List, Optional, Tuple, Union, Dict, Any
 from loguru import logger
 
 from config import get_config
@@ -52,6 +55,61 @@ class TrailerOutput:
         }
 
 
+class ShotCache:
+    """Job-scoped cache of extracted shots shared across trailer variants.
+
+    Shots are keyed by (source, start, end/duration, resolution, encode
+    params). The first variant that needs a shot encodes it; any other
+    variant asking for the same key - even while that encode is still
+    running - waits for and reuses the same file. Files live until the job
+    closes the cache, after every variant has been assembled.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._entries: Dict[Tuple, Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_extract(self, key: Tuple, suffix: str, extract: Callable[[Path], None]) -> Path:
+        """Return the cached shot for ``key``, extracting it on first request.
+
+        Args:
+            key: Shot cache key
+            suffix: Output file extension
+            extract: Function that encodes the shot to the given path
+
+        Returns:
+            Path to the extracted shot
+        """
+        with self._lock:
+            future = self._entries.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._entries[key] = future
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if owner:
+            path = self.cache_dir / f"shot_{uuid.uuid4().hex[:12]}.{suffix}"
+            try:
+                extract(path)
+                future.set_result(path)
+            except Exception as e:
+                future.set_exception(e)
+
+        return future.result()
+
+    def close(self) -> None:
+        """Delete all cached shots."""
+        logger.info(f"Shot cache: {self.misses} encoded, {self.hits} reused across variants")
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+
 class TrailerAssembler:
     """Assemble trailer videos from narrative shot sequences."""
 
@@ -62,6 +120,10 @@ class TrailerAssembler:
         "480p": (854, 480)
     }
 
+    # Per-shot encode settings (also part of the shot cache key)
+    SHOT_VIDEO_ARGS = ['-c:v', 'libx264', '-preset', 'medium', '-crf', '18']
+    SHOT_AUDIO_ARGS = ['-c:a', 'aac', '-b:a', '320k']
+
     def __init__(
         self,
         output_format: str = "mp4",
@@ -113,6 +175,27 @@ class TrailerAssembler:
             logger.info("MusicGen not available, AI music disabled")
             self.enable_ai_music = False
 
+        # Bounded ffmpeg worker pool: every encode (from any variant) takes a
+        # slot, so concurrent variants never oversubscribe the CPU
+        self.parallel_extraction = config.assembly.parallel_extraction
+        self.ffmpeg_threads = max(1, config.assembly.ffmpeg_threads)
+        self.max_encoders = config.assembly.max_parallel_shots or max(
+            1, (os.cpu_count() or 1) // self.ffmpeg_threads
+        )
+        self.max_parallel_variants = max(1, config.assembly.max_parallel_variants)
+        self._encoder_slots = threading.BoundedSemaphore(self.max_encoders)
+        self._music_lock = threading.Lock()
+
+        # Set while assemble_all_variants runs, so variants share shot encodes
+        self._shot_cache: Optional[ShotCache] = None
+
+        # single_pass: one filter_complex encode per variant; multi_step: extract/concat/mix/watermark
+        self.render_mode = config.assembly.render_mode
+        self.single_pass_threads = config.assembly.single_pass_threads
+        # Variants rendering at once (set by assemble_all_variants)
+        self._concurrent_variants = 1
+        self._audio_streams: Dict[str, bool] = {}
+
         # Ensure temp directory exists
         Path(self.temp_dir).mkdir(parents=True, exist_ok=True)
 
@@ -146,6 +229,17 @@ class TrailerAssembler:
         has_ai_music = False
 
         try:
+            if self.render_mode == "single_pass":
+                try:
+                    return self._assemble_single_pass(
+                        source_video, narrative, output_dir, variant_temp
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"Single-pass render failed for {narrative.style}: {e}, "
+                        f"falling back to multi-step assembly"
+                    )
+
             # Step 1: Extract all shots
             shot_paths = self._extract_shots(
                 source_video,
@@ -170,13 +264,7 @@ class TrailerAssembler:
                 try:
                     logger.info(f"Generating AI music for {narrative.style} trailer...")
                     trailer_duration = self._get_video_duration(raw_trailer)
-
-                    # Generate music
-                    music_file = self._music_generator.generate_music(
-                        style=narrative.style,
-                        duration=min(int(trailer_duration) + 5, 30),
-                        output_path=variant_temp / f"music_{narrative.style}.wav"
-                    )
+                    music_file = self._generate_music(narrative, trailer_duration, variant_temp)
 
                     # Mix music with video
                     mixed_trailer = variant_temp / f"mixed_{narrative.id}.{self.output_format}"
@@ -198,31 +286,240 @@ class TrailerAssembler:
             else:
                 shutil.copy2(processed_trailer, final_path)
 
-            # Get video info
-            duration = self._get_video_duration(final_path)
-            file_size = final_path.stat().st_size
+            return self._build_output(narrative, final_path, has_ai_music, music_path)
+
+        finally:
+            # Cleanup temp directory
+            self._cleanup(variant_temp)
+
+    def _assemble_single_pass(
+        self,
+        source_video: Path,
+        narrative: NarrativeVariant,
+        output_dir: Path,
+        variant_temp: Path
+    ) -> TrailerOutput:
+        """Render a variant with one ffmpeg filter_complex encode.
+
+        Each shot is an input-seeked view of the source; trim/scale, concat,
+        music mix and watermark all happen in one filtergraph, so the pixels
+        go through a single lossy encode and no intermediate files are written.
+
+        Args:
+            source_video: Path to source video
+            narrative: Narrative variant to render
+            output_dir: Output directory
+            variant_temp: Temp directory for generated music
+
+        Returns:
+            TrailerOutput object
+        """
+        spans = [self._shot_span(shot) for shot in narrative.shot_sequence]
+        spans = [(start, duration) for start, duration in spans if duration > 0]
+        if not spans:
+            raise ValueError("No shots to render")
+
+        music_file = None
+        if self.enable_ai_music and self._music_generator:
+            try:
+                logger.info(f"Generating AI music for {narrative.style} trailer...")
+                music_file = self._generate_music(
+                    narrative, sum(d for _, d in spans), variant_temp
+                )
+            except Exception as e:
+                logger.warning(f"AI music generation failed: {e}, using original audio")
+
+        output_filename = f"trailer_{narrative.style}_{narrative.id}.{self.output_format}"
+        final_path = output_dir / output_filename
+
+        cmd = self._build_single_pass_command(source_video, spans, music_file, final_path)
+        result = self._run_ffmpeg(cmd)
+
+        if result.returncode != 0:
+            raise RuntimeError(f"FFmpeg single-pass render failed: {result.stderr[-2000:]}")
+
+        return self._build_output(
+            narrative, final_path,
+            has_ai_music=music_file is not None,
+            music_path=str(music_file) if music_file else None
+        )
+
+    def _build_single_pass_command(
+        self,
+        source_video: Path,
+        spans: List[Tuple[float, float]],
+        music_file: Optional[Path],
+        output: Path
+    ) -> List[str]:
+        """Build the single-pass ffmpeg command for a list of shot spans.
+
+        Args:
+            source_video: Source video path
+            spans: (start_seconds, duration_seconds) per shot, in trailer order
+            music_file: Optional AI music to mix in
+            output: Output video path
+
+        Returns:
+            ffmpeg command line
+        """
+        width, height = self.RESOLUTION_MAP.get(self.resolution, (1920, 1080))
+        # Source audio is dropped when music replaces it
+        has_audio = self._has_audio_stream(source_video) and (
+            music_file is None or self.keep_original_audio
+        )
 
-            logger.info(
-                f"Assembled {narrative.style} trailer: {final_path} "
-                f"({duration:.1f}s, {file_size/1024/1024:.1f}MB)"
-                f"{' [with AI music]' if has_ai_music else ''}"
+        cmd = ['ffmpeg', '-y']
+        for start, duration in spans:
+            cmd.extend(['-ss', f'{start:.3f}', '-t', f'{duration:.3f}', '-i', str(source_video)])
+        if music_file:
+            cmd.extend(['-i', str(music_file)])
+
+        filters = []
+        concat_inputs = ""
+        for i in range(len(spans)):
+            filters.append(
+                f"[{i}:v:0]setpts=PTS-STARTPTS,"
+                f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+                f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1[v{i}]"
             )
+            concat_inputs += f"[v{i}]"
+            if has_audio:
+                filters.append(f"[{i}:a:0]asetpts=PTS-STARTPTS,aresample=48000[a{i}]")
+                concat_inputs += f"[a{i}]"
+
+        audio_out = "[acat]" if has_audio else None
+        filters.append(
+            f"{concat_inputs}concat=n={len(spans)}:v=1:a={1 if has_audio else 0}"
+            f"[vcat]{audio_out or ''}"
+        )
+
+        # Music mix (same levels as _mix_audio_with_music)
+        if music_file:
+            music_input = f"[{len(spans)}:a]"
+            if has_audio:
+                filters.append(
+                    f"[acat]volume=0.7[am0];"
+                    f"{music_input}volume={self.music_volume}[am1];"
+                    f"[am0][am1]amix=inputs=2:duration=first[aout]"
+                )
+            else:
+                # Pad/trim music to the cut length (-shortest can stall on filtergraphs)
+                total = sum(duration for _, duration in spans)
+                filters.append(
+                    f"{music_input}volume={self.music_volume},"
+                    f"apad,atrim=duration={total:.3f}[aout]"
+                )
+            audio_out = "[aout]"
+
+        video_out = "[vcat]"
+        if self.include_watermark:
+            filters.append(f"[vcat]{self._drawtext_filter()}[vout]")
+            video_out = "[vout]"
+
+        cmd.extend(['-filter_complex', ';'.join(filters), '-map', video_out])
+        if audio_out:
+            cmd.extend(['-map', audio_out, *self.SHOT_AUDIO_ARGS])
+        cmd.extend([*self.SHOT_VIDEO_ARGS, '-threads', str(self._single_pass_thread_count())])
+        cmd.extend(['-movflags', '+faststart', str(output)])
+
+        return cmd
 
-            return TrailerOutput(
-                variant_id=narrative.id,
+    def _single_pass_thread_count(self) -> int:
+        """Encoder threads for one single-pass render.
+
+        A single-pass render is the variant's only encode, so instead of the
+        per-shot ffmpeg_threads it gets an even share of the cores among the
+        variants rendering concurrently.
+        """
+        if self.single_pass_threads > 0:
+            return self.single_pass_threads
+        return max(1, (os.cpu_count() or 1) // self._concurrent_variants)
+
+    def _shot_span(self, shot: ShotInstruction) -> Tuple[float, float]:
+        """Get (start_seconds, duration_seconds) of a shot, as _extract_shot cuts it."""
+        start = self._timecode_to_seconds(shot.timecode_start)
+        if shot.recommended_duration:
+            return start, float(shot.recommended_duration)
+        return start, self._timecode_to_seconds(shot.timecode_end) - start
+
+    @staticmethod
+    def _timecode_to_seconds(timecode: Union[str, float]) -> float:
+        """Convert HH:MM:SS.mmm (or MM:SS / plain seconds) to seconds."""
+        if isinstance(timecode, (int, float)):
+            return float(timecode)
+        seconds = 0.0
+        for part in str(timecode).strip().split(':'):
+            seconds = seconds * 60 + float(part)
+        return seconds
+
+    def _has_audio_stream(self, video_path: Path) -> bool:
+        """Check (once per source) whether a video has an audio stream."""
+        key = str(video_path)
+        if key not in self._audio_streams:
+            cmd = [
+                'ffprobe', '-v', 'error',
+                '-select_streams', 'a',
+                '-show_entries', 'stream=index',
+                '-of', 'csv=p=0',
+                str(video_path)
+            ]
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            self._audio_streams[key] = result.returncode == 0 and bool(result.stdout.strip())
+        return self._audio_streams[key]
+
+    def _generate_music(
+        self,
+        narrative: NarrativeVariant,
+        trailer_duration: float,
+        temp_dir: Path
+    ) -> Path:
+        """Generate AI music for a variant.
+
+        Args:
+            narrative: Narrative variant (style drives the music prompt)
+            trailer_duration: Trailer duration in seconds
+            temp_dir: Directory for the generated audio
+
+        Returns:
+            Path to generated music file
+        """
+        # One variant at a time - the model is shared
+        with self._music_lock:
+            return self._music_generator.generate_music(
                 style=narrative.style,
-                local_path=str(final_path),
-                format=self.output_format,
-                resolution=self.resolution,
-                duration=duration,
-                file_size=file_size,
-                has_ai_music=has_ai_music,
-                music_path=music_path
+                duration=min(int(trailer_duration) + 5, 30),
+                output_path=temp_dir / f"music_{narrative.style}.wav"
             )
 
-        finally:
-            # Cleanup temp directory
-            self._cleanup(variant_temp)
+    def _build_output(
+        self,
+        narrative: NarrativeVariant,
+        final_path: Path,
+        has_ai_music: bool,
+        music_path: Optional[str]
+    ) -> TrailerOutput:
+        """Probe a finished trailer and describe it as a TrailerOutput."""
+        # Get video info
+        duration = self._get_video_duration(final_path)
+        file_size = final_path.stat().st_size
+
+        logger.info(
+            f"Assembled {narrative.style} trailer: {final_path} "
+            f"({duration:.1f}s, {file_size/1024/1024:.1f}MB)"
+            f"{' [with AI music]' if has_ai_music else ''}"
+        )
+
+        return TrailerOutput(
+            variant_id=narrative.id,
+            style=narrative.style,
+            local_path=str(final_path),
+            format=self.output_format,
+            resolution=self.resolution,
+            duration=duration,
+            file_size=file_size,
+            has_ai_music=has_ai_music,
+            music_path=music_path
+        )
 
     def assemble_all_variants(
         self,
@@ -243,15 +540,31 @@ class TrailerAssembler:
         source_video = Path(source_video)
         output_dir = Path(output_dir)
 
-        logger.info(f"Assembling {len(narratives)} trailer variants")
+        logger.info(
+            f"Assembling {len(narratives)} trailer variants "
+            f"({self.max_parallel_variants} concurrent, {self.max_encoders} encoders)"
+        )
 
-        outputs = []
-        for narrative in narratives:
+        def assemble(narrative: NarrativeVariant) -> Optional[TrailerOutput]:
             try:
-                output = self.assemble_variant(source_video, narrative, output_dir)
-                outputs.append(output)
+                return self.assemble_variant(source_video, narrative, output_dir)
             except Exception as e:
                 logger.error(f"Failed to assemble {narrative.style} variant: {e}")
+                return None
+
+        workers = min(self.max_parallel_variants, len(narratives)) or 1
+        self._concurrent_variants = workers
+        self._shot_cache = ShotCache(Path(self.temp_dir) / f"shots_{uuid.uuid4().hex[:12]}")
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(assemble, narratives))
+        finally:
+            # Shots are only released once every variant has finished
+            self._shot_cache.close()
+            self._shot_cache = None
+            self._concurrent_variants = 1
+
+        outputs = [output for output in results if output is not None]
 
         logger.info(f"Successfully assembled {len(outputs)}/{len(narratives)} trailers")
         return outputs
@@ -272,12 +585,12 @@ class TrailerAssembler:
         Returns:
             List of extracted shot paths
         """
-        shot_paths = []
+        shot_cache = self._shot_cache
 
-        for i, shot in enumerate(shots):
-            output_path = temp_dir / f"shot_{i:03d}.{self.output_format}"
+        def extract(indexed_shot) -> Optional[Path]:
+            i, shot = indexed_shot
 
-            try:
+            def encode(output_path: Path) -> None:
                 self._extract_shot(
                     source_video,
                     shot.timecode_start,
@@ -285,13 +598,44 @@ class TrailerAssembler:
                     output_path,
                     shot.recommended_duration
                 )
-                shot_paths.append(output_path)
+
+            try:
+                if shot_cache is not None:
+                    return shot_cache.get_or_extract(
+                        self._shot_key(source_video, shot), self.output_format, encode
+                    )
+                output_path = temp_dir / f"shot_{i:03d}.{self.output_format}"
+                encode(output_path)
+                return output_path
             except Exception as e:
                 logger.warning(f"Failed to extract shot {i}: {e}")
+                return None
+
+        if self.parallel_extraction and len(shots) > 1:
+            # Encoder slots bound the real concurrency; map() keeps shot order
+            with ThreadPoolExecutor(max_workers=min(self.max_encoders, len(shots))) as executor:
+                results = list(executor.map(extract, enumerate(shots)))
+        else:
+            results = [extract(item) for item in enumerate(shots)]
+
+        shot_paths = [path for path in results if path is not None]
 
         logger.info(f"Extracted {len(shot_paths)}/{len(shots)} shots")
         return shot_paths
 
+    def _shot_key(self, source_video: Path, shot: ShotInstruction) -> Tuple:
+        """Cache key identifying an encoded shot."""
+        # _extract_shot uses the duration when given, otherwise the end timecode
+        if shot.recommended_duration:
+            span = (shot.timecode_start, None, float(shot.recommended_duration))
+        else:
+            span = (shot.timecode_start, shot.timecode_end, None)
+        return (
+            str(source_video.resolve()), *span,
+            self.resolution, self.output_format,
+            *self.SHOT_VIDEO_ARGS, *self.SHOT_AUDIO_ARGS
+        )
+
     def _extract_shot(
         self,
         source: Path,
@@ -327,29 +671,33 @@ class TrailerAssembler:
         cmd.extend([
             '-vf', f'scale={width}:{height}:force_original_aspect_ratio=decrease,'
                    f'pad={width}:{height}:(ow-iw)/2:(oh-ih)/2',
-            '-c:v', 'libx264',
-            '-preset', 'medium',
-            '-crf', '18',
+            *self.SHOT_VIDEO_ARGS,
+            '-threads', str(self.ffmpeg_threads),
         ])
 
         # Audio settings
-        cmd.extend([
-            '-c:a', 'aac',
-            '-b:a', '320k',
-        ])
+        cmd.extend(self.SHOT_AUDIO_ARGS)
 
         cmd.append(str(output))
 
         # Run ffmpeg
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True
-        )
+        result = self._run_ffmpeg(cmd)
 
         if result.returncode != 0:
             raise RuntimeError(f"FFmpeg failed: {result.stderr}")
 
+    def _run_ffmpeg(self, cmd: List[str]) -> subprocess.CompletedProcess:
+        """Run an ffmpeg command once an encoder slot is free.
+
+        Args:
+            cmd: ffmpeg command line
+
+        Returns:
+            Completed process
+        """
+        with self._encoder_slots:
+            return subprocess.run(cmd, capture_output=True, text=True)
+
     def _create_concat_file(
         self,
         shot_paths: List[Path],
@@ -413,12 +761,13 @@ class TrailerAssembler:
             '-c:v', 'libx264',
             '-preset', 'medium',
             '-crf', '18',
+            '-threads', str(self.ffmpeg_threads),
             '-c:a', 'aac',
             '-b:a', '320k',
             str(output)
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = self._run_ffmpeg(cmd)
 
         if result.returncode != 0:
             raise RuntimeError(f"FFmpeg concat failed: {result.stderr}")
@@ -465,7 +814,7 @@ class TrailerAssembler:
             str(output_path)
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = self._run_ffmpeg(cmd)
 
         if result.returncode != 0:
             # Try simpler approach without filter_complex
@@ -481,7 +830,7 @@ class TrailerAssembler:
                 '-shortest',
                 str(output_path)
             ]
-            result = subprocess.run(cmd_simple, capture_output=True, text=True)
+            result = self._run_ffmpeg(cmd_simple)
 
             if result.returncode != 0:
                 raise RuntimeError(f"Audio mixing failed: {result.stderr}")
@@ -497,29 +846,35 @@ class TrailerAssembler:
             input_video: Input video path
             output_video: Output video path
         """
-        # Escape special characters in watermark text
-        escaped_text = self.watermark_text.replace("'", "'\\''")
-
         cmd = [
             'ffmpeg', '-y',
             '-i', str(input_video),
-            '-vf', f"drawtext=text='{escaped_text}':"
-                   f"fontsize=24:fontcolor=white@0.5:"
-                   f"x=w-tw-20:y=h-th-20",
+            '-vf', self._drawtext_filter(),
             '-c:v', 'libx264',
             '-preset', 'medium',
             '-crf', '18',
+            '-threads', str(self.ffmpeg_threads),
             '-c:a', 'copy',
             str(output_video)
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = self._run_ffmpeg(cmd)
 
         if result.returncode != 0:
             # Fall back to copying without watermark
             logger.warning("Watermark failed, copying without watermark")
             shutil.copy2(input_video, output_video)
 
+    def _drawtext_filter(self) -> str:
+        """Build the watermark drawtext filter."""
+        # Escape special characters in watermark text
+        escaped_text = self.watermark_text.replace("'", "'\\''")
+        return (
+            f"drawtext=text='{escaped_text}':"
+            f"fontsize=24:fontcolor=white@0.5:"
+            f"x=w-tw-20:y=h-th-20"
+        )
+
     def _get_video_duration(self, video_path: Path) -> float:
         """Get video duration using ffprobe.
 
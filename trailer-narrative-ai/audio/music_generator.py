@@ -59,6 +59,10 @@ class TrailerMusicGenerator:
                 "Install with: pip install audiocraft"
             )
 
+        # Make room: drop LLM/ASR/CLIP models nobody is using anymore
+        from core.model_registry import get_model_registry
+        get_model_registry().unload_idle()
+
         logger.info(f"Loading MusicGen model: {self.model_size}")
         self._model = MusicGen.get_pretrained(f'facebook/musicgen-{self.model_size}')
         self._model.set_generation_params(duration=30)  # Default 30 seconds
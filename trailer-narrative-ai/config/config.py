@@ -13,12 +13,26 @@ from pathlib import Path
 
 from config.constants import (
     AWS_S3_BUCKET, AWS_REGION, AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY,
+    S3_DOWNLOAD_PART_SIZE_MB, S3_DOWNLOAD_CONCURRENCY, S3_MULTIPART_THRESHOLD_MB,
     WHISPER_MODEL, INDIAN_ASR_MODEL, ASR_FALLBACK_MODEL, ASR_DEVICE, ASR_BATCH_SIZE,
     LLM_PROVIDER, LLM_MODEL, LLM_HINDI_MODEL, OLLAMA_HOST, OLLAMA_MODEL, LLM_DEVICE,
+    OLLAMA_MAX_CONCURRENCY, OLLAMA_TIMEOUT, OLLAMA_MAX_RETRIES, OLLAMA_RETRY_BACKOFF,
+    SCENE_DETECTION_MODE, SCENE_COARSE_MIN_HEIGHT, SCENE_COARSE_FPS, SCENE_COARSE_WIDTH,
+    SCENE_COARSE_THRESHOLD_RATIO, SCENE_REFINE_MARGIN, SCENE_REFINE_SEEK_GAP,
+    SCENE_DETECTION_WORKERS, SCENE_SHARD_MIN_DURATION,
     VISUAL_MODEL, CAPTION_MODEL, VISUAL_DEVICE,
+    SHARED_FRAME_DECODE, SHARED_DECODE_PRECEDENCE,
+    ANALYSIS_FRAME_WIDTH, ANALYSIS_MAX_BUFFERED_FRAMES,
+    VISUAL_BATCH_SIZE,
     MUSIC_ENABLED, MUSICGEN_MODEL, MUSICGEN_DEVICE,
     TEMP_DIR, MAX_CPU_WORKERS, MAX_IO_WORKERS,
+    ASSEMBLY_FFMPEG_THREADS, ASSEMBLY_MAX_ENCODERS, ASSEMBLY_PARALLEL_VARIANTS,
+    ASSEMBLY_RENDER_MODE, ASSEMBLY_SINGLE_PASS_THREADS,
     OUTPUT_DIR, MODELS_CACHE, PRODUCTION_MODE,
+    ANALYSIS_CACHE_ENABLED, ANALYSIS_CACHE_DIR, ANALYSIS_CACHE_MAX_GB,
+    LLM_CACHE_ENABLED, LLM_CACHE_DIR, LLM_CACHE_MAX_MB, LLM_CACHE_TTL_DAYS,
+    LLM_DETERMINISTIC, LLM_SEED,
+    MODEL_REGISTRY_MAX_GB,
     get_output_dir, get_models_cache_dir,
 )
 
@@ -30,6 +44,9 @@ class S3Config:
     region: str = AWS_REGION
     access_key: Optional[str] = AWS_ACCESS_KEY_ID
     secret_key: Optional[str] = AWS_SECRET_ACCESS_KEY
+    download_part_size: int = S3_DOWNLOAD_PART_SIZE_MB * 1024 * 1024
+    download_concurrency: int = S3_DOWNLOAD_CONCURRENCY
+    multipart_threshold: int = S3_MULTIPART_THRESHOLD_MB * 1024 * 1024
 
 
 @dataclass
@@ -88,6 +105,10 @@ class LLMConfig:
     # Ollama configuration (if using local Ollama)
     ollama_host: str = OLLAMA_HOST
     ollama_model: str = OLLAMA_MODEL
+    ollama_max_concurrency: int = OLLAMA_MAX_CONCURRENCY
+    ollama_timeout: float = OLLAMA_TIMEOUT
+    ollama_max_retries: int = OLLAMA_MAX_RETRIES
+    ollama_retry_backoff: float = OLLAMA_RETRY_BACKOFF
     # Generation parameters
     max_tokens: int = 512
     temperature: float = 0.7
@@ -96,6 +117,28 @@ class LLMConfig:
     # Enable batch processing
     enable_batching: bool = True
     batch_size: int = 8
+    # Fixed sampling seed so generations are reproducible (and cacheable)
+    deterministic: bool = LLM_DETERMINISTIC
+    seed: int = LLM_SEED
+    # Persistent prompt/response cache
+    cache_enabled: bool = LLM_CACHE_ENABLED
+    cache_dir: str = LLM_CACHE_DIR
+    cache_max_bytes: int = LLM_CACHE_MAX_MB * 1024 * 1024
+    cache_ttl_seconds: float = LLM_CACHE_TTL_DAYS * 24 * 3600
+
+
+@dataclass
+class SceneDetectionConfig:
+    """Scene detection configuration (see SCENE_DETECTION_MODE)."""
+    mode: str = SCENE_DETECTION_MODE
+    coarse_min_height: int = SCENE_COARSE_MIN_HEIGHT
+    coarse_fps: float = SCENE_COARSE_FPS
+    coarse_width: int = SCENE_COARSE_WIDTH
+    coarse_threshold_ratio: float = SCENE_COARSE_THRESHOLD_RATIO
+    refine_margin: float = SCENE_REFINE_MARGIN
+    refine_seek_gap: float = SCENE_REFINE_SEEK_GAP
+    workers: int = SCENE_DETECTION_WORKERS
+    shard_min_duration: float = SCENE_SHARD_MIN_DURATION
 
 
 @dataclass
@@ -115,8 +158,18 @@ class VisualConfig:
     device: str = VISUAL_DEVICE
     # Frames to analyze per scene
     frames_per_scene: int = 3
-    # Enable parallel frame processing
+    # Batch CLIP inference across frames and scenes
     parallel_frames: bool = True
+    # Frames per CLIP forward pass when parallel_frames is enabled
+    batch_size: int = VISUAL_BATCH_SIZE
+    # Single decode pass shared by scene detection and frame sampling
+    shared_decode: bool = SHARED_FRAME_DECODE
+    # "detector" or "shared" (see SHARED_DECODE_PRECEDENCE)
+    shared_decode_precedence: str = SHARED_DECODE_PRECEDENCE
+    # Downscaled frame width for shared-decode analysis
+    analysis_width: int = ANALYSIS_FRAME_WIDTH
+    # Max frames buffered per open scene during shared decode
+    max_buffered_frames: int = ANALYSIS_MAX_BUFFERED_FRAMES
     # Face detection for character tracking
     enable_face_detection: bool = True
     face_model: str = "retinaface"
@@ -192,7 +245,16 @@ class AssemblyConfig:
     temp_dir: str = TEMP_DIR
     # Enable parallel shot extraction
     parallel_extraction: bool = True
-    max_parallel_shots: int = 4
+    # Global cap on simultaneous ffmpeg encoders (0 = cores / ffmpeg_threads)
+    max_parallel_shots: int = ASSEMBLY_MAX_ENCODERS
+    # Threads per ffmpeg encoder
+    ffmpeg_threads: int = ASSEMBLY_FFMPEG_THREADS
+    # Variants assembled concurrently
+    max_parallel_variants: int = ASSEMBLY_PARALLEL_VARIANTS
+    # single_pass (one filtergraph encode) or multi_step (fallback pipeline)
+    render_mode: str = ASSEMBLY_RENDER_MODE
+    # Threads per single-pass render (0 = cores / concurrent variants)
+    single_pass_threads: int = ASSEMBLY_SINGLE_PASS_THREADS
     # Transition settings
     default_transition_duration: float = 0.5
     enable_audio_ducking: bool = True
@@ -222,17 +284,38 @@ class ParallelConfig:
     ])
 
 
+@dataclass
+class CacheConfig:
+    """Persistent analysis artifact cache configuration."""
+    # Reuse scene/ASR/visual results across runs on the same video
+    enabled: bool = ANALYSIS_CACHE_ENABLED
+    # Cache directory (relative to Config.models_cache_dir unless absolute)
+    cache_dir: str = ANALYSIS_CACHE_DIR
+    # Size budget before least-recently-used entries are evicted
+    max_size_bytes: int = ANALYSIS_CACHE_MAX_GB * 1024 * 1024 * 1024
+
+
+@dataclass
+class ModelsConfig:
+    """Shared model registry configuration."""
+    # Memory budget for loaded models before idle ones are unloaded (0 = unlimited)
+    max_bytes: int = MODEL_REGISTRY_MAX_GB * 1024 * 1024 * 1024
+
+
 @dataclass
 class Config:
     """Main configuration class - Production Grade."""
     s3: S3Config = field(default_factory=S3Config)
     indian_asr: IndianASRConfig = field(default_factory=IndianASRConfig)
     llm: LLMConfig = field(default_factory=LLMConfig)
+    scene: SceneDetectionConfig = field(default_factory=SceneDetectionConfig)
     visual: VisualConfig = field(default_factory=VisualConfig)
     music: MusicConfig = field(default_factory=MusicConfig)
     narrative: NarrativeConfig = field(default_factory=NarrativeConfig)
     assembly: AssemblyConfig = field(default_factory=AssemblyConfig)
     parallel: ParallelConfig = field(default_factory=ParallelConfig)
+    cache: CacheConfig = field(default_factory=CacheConfig)
+    models: ModelsConfig = field(default_factory=ModelsConfig)
 
     # Paths
     prompts_dir: Path = Path(__file__).parent.parent / "prompts"
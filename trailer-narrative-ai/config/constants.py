@@ -20,6 +20,11 @@ AWS_REGION = "ap-south-1"
 AWS_ACCESS_KEY_ID = None  # Set your key here if needed
 AWS_SECRET_ACCESS_KEY = None  # Set your secret here if needed
 
+# S3 downloads: multipart ranged GETs over parallel connections
+S3_DOWNLOAD_PART_SIZE_MB = 16  # size of each ranged part
+S3_DOWNLOAD_CONCURRENCY = 10  # parallel connections per download
+S3_MULTIPART_THRESHOLD_MB = 32  # smaller objects use a single GET
+
 
 # =============================================================================
 # ASR (AUTOMATIC SPEECH RECOGNITION) CONFIGURATION
@@ -41,19 +46,28 @@ ASR_DEVICE = "auto"
 # Batch size for parallel processing
 ASR_BATCH_SIZE = 4
 
-# Use chunked processing for long videos (>30 min)
-# Set to True if you have memory constraints
+# Always use VAD-chunked processing for long videos (>30 min). Long videos
+# are also chunked whenever ASR_PARALLEL gets more than one worker
 ASR_CHUNKED = False
 
-# Chunk duration in seconds for parallel ASR
+# Max speech audio per chunk in seconds for parallel ASR
 ASR_CHUNK_DURATION = 300  # 5 minutes
 
-# Number of ASR workers for parallel processing
-# Keep at 1 to avoid OOM, increase if you have enough RAM
-ASR_WORKERS = 1
+# Voice activity detection for chunked ASR: chunks are cut at silences and
+# non-speech (music, action, silence) is never sent to Whisper
+ASR_VAD_MIN_SILENCE = 0.5  # seconds; shorter pauses stay inside a region
+ASR_VAD_MIN_SPEECH = 0.25  # seconds; shorter blips are ignored
+ASR_VAD_SPEECH_PAD = 0.2  # seconds of context kept around each region
+
+# Max ASR worker processes for parallel processing (0 = derive from RAM)
+# Each worker process loads the Whisper model once and reuses it for all chunks
+ASR_WORKERS = 0
+
+# Enable parallel ASR mode (worker count is capped by available memory)
+ASR_PARALLEL = True
 
-# Enable parallel ASR mode (faster but uses more memory)
-ASR_PARALLEL = False
+# RAM kept free for the rest of the pipeline when sizing the ASR pool (GB)
+ASR_MEMORY_HEADROOM_GB = 2
 
 
 # =============================================================================
@@ -76,10 +90,55 @@ LLM_HINDI_MODEL = "ai4bharat/IndicBARTSS"
 OLLAMA_HOST = "http://localhost:11434"
 OLLAMA_MODEL = "mistral"  # or "llama3.2"
 
+# Ollama client: max in-flight generations sharing one pooled HTTP session
+OLLAMA_MAX_CONCURRENCY = 4
+
+# Seconds to wait for the next streamed chunk (covers model load on first call)
+OLLAMA_TIMEOUT = 60
+
+# Retries for transient failures (connection errors, timeouts, 5xx/429),
+# with exponential backoff starting at OLLAMA_RETRY_BACKOFF seconds
+OLLAMA_MAX_RETRIES = 3
+OLLAMA_RETRY_BACKOFF = 1.0
+
 # Device for LLM inference: "auto", "cuda", "mps", "cpu"
 LLM_DEVICE = "auto"
 
 
+# =============================================================================
+# SCENE DETECTION CONFIGURATION
+# =============================================================================
+
+# "exhaustive": ContentDetector on every full-resolution frame
+# "coarse_to_fine": find candidate cuts on a cheap downscaled, frame-skipped
+#   pass, then score only the frames around each candidate at native resolution
+# "auto": coarse_to_fine for sources at least SCENE_COARSE_MIN_HEIGHT tall
+SCENE_DETECTION_MODE = "auto"
+SCENE_COARSE_MIN_HEIGHT = 1440
+
+# Coarse pass: sample rate and width of the downscaled stream
+SCENE_COARSE_FPS = 6.0
+SCENE_COARSE_WIDTH = 192
+
+# Coarse candidates need this fraction of the content threshold (lower = more
+# recall, more refine windows)
+SCENE_COARSE_THRESHOLD_RATIO = 0.5
+
+# Seconds added around each candidate interval when refining
+SCENE_REFINE_MARGIN = 0.25
+
+# Gaps between refine windows up to this many seconds are decoded through
+# instead of seeking (a seek restarts decoding at the previous keyframe)
+SCENE_REFINE_SEEK_GAP = 4.0
+
+# Exhaustive content detection on long videos is split into time shards
+# scored by a process pool (0 = one worker per CPU core, 1 = sequential).
+# Shards score every frame they own; the min-scene-length filter is applied
+# once over the stitched timeline, so results match a sequential pass
+SCENE_DETECTION_WORKERS = 0
+SCENE_SHARD_MIN_DURATION = 300  # seconds per shard at least
+
+
 # =============================================================================
 # VISUAL ANALYSIS CONFIGURATION
 # =============================================================================
@@ -93,6 +152,29 @@ CAPTION_MODEL = "Salesforce/blip2-opt-2.7b"
 # Device for visual inference
 VISUAL_DEVICE = "auto"
 
+# Decode the video once and feed scene detection and visual frame sampling
+# from the same frame stream (False = separate decodes with per-scene seeks)
+SHARED_FRAME_DECODE = True
+
+# Which wins when shared decode is on but SceneDetector would not run a single
+# sequential pass (coarse-to-fine for large sources, or time sharding on
+# multi-core hosts):
+# "shared": always one shared pass (exhaustive content + fade detection). Any
+#   film of 10+ minutes on a multi-core host plans a sharded detect, so this
+#   is what keeps long films on one decode instead of detect + per-scene seeks
+# "detector": SceneDetector.detect runs in its chosen mode and visual analysis
+#   samples frames with its own seeks (shared decode only for single-pass plans)
+SHARED_DECODE_PRECEDENCE = "shared"
+
+# Width in pixels that shared-decode frames are downscaled to for analysis
+ANALYSIS_FRAME_WIDTH = 640
+
+# Max frames held per open scene while waiting for its cut (bounds memory)
+ANALYSIS_MAX_BUFFERED_FRAMES = 48
+
+# Frames per batched CLIP forward pass (CPU CLIP is much faster batched)
+VISUAL_BATCH_SIZE = 16
+
 
 # =============================================================================
 # MUSIC GENERATION CONFIGURATION
@@ -121,6 +203,24 @@ MAX_CPU_WORKERS = 4
 # Max I/O workers for async operations
 MAX_IO_WORKERS = 8
 
+# Threads given to each ffmpeg encoder during trailer assembly
+ASSEMBLY_FFMPEG_THREADS = 2
+
+# Max simultaneous ffmpeg encoders across all variants (0 = cores / threads per encoder)
+ASSEMBLY_MAX_ENCODERS = 0
+
+# Trailer variants assembled concurrently
+ASSEMBLY_PARALLEL_VARIANTS = 3
+
+# Trailer render mode: "single_pass" (one filter_complex encode per variant)
+# or "multi_step" (extract shots -> concat -> mix music -> watermark)
+ASSEMBLY_RENDER_MODE = "single_pass"
+
+# Threads per single-pass render. A single-pass variant is one encode instead
+# of many parallel shot encodes, so it gets the CPU budget of the variants
+# running beside it (0 = cores / concurrent variants)
+ASSEMBLY_SINGLE_PASS_THREADS = 0
+
 # Output directory
 OUTPUT_DIR = "./output"
 
@@ -130,6 +230,36 @@ MODELS_CACHE = "~/.cache/trailer-ai"
 # Production mode (disables watermark, uses higher quality)
 PRODUCTION_MODE = True
 
+# Cache scene/ASR/visual analysis per video so re-runs skip re-analysis
+ANALYSIS_CACHE_ENABLED = True
+
+# Analysis cache directory; relative paths live under the models cache
+ANALYSIS_CACHE_DIR = "analysis"
+
+# Analysis cache size budget before LRU eviction
+ANALYSIS_CACHE_MAX_GB = 20
+
+# Cache LLM responses on disk, keyed by backend/model/prompt/sampling params
+LLM_CACHE_ENABLED = True
+
+# LLM response cache directory
+LLM_CACHE_DIR = "~/.cache/trailer-ai/llm"
+
+# LLM response cache size budget before LRU eviction
+LLM_CACHE_MAX_MB = 512
+
+# Cached LLM responses expire after this many days (0 = never)
+LLM_CACHE_TTL_DAYS = 30
+
+# Deterministic generation: pin the sampling seed so identical prompts give
+# identical responses (required for cached responses to be valid)
+LLM_DETERMINISTIC = True
+LLM_SEED = 42
+
+# Memory budget for models shared through the model registry (LLM, ASR, CLIP).
+# Idle models are unloaded least-recently-used first beyond this (0 = unlimited)
+MODEL_REGISTRY_MAX_GB = 12
+
 
 # =============================================================================
 # PROGRESS REPORTING CONFIGURATION
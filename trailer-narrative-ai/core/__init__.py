@@ -2,5 +2,12 @@
 
 from .storage import StorageHandler
 from .progress import ProgressReporter
+from .artifact_cache import AnalysisCache, fingerprint_file
+from .model_registry import ModelRegistry, ModelHandle, get_model_registry
+from .llm_cache import LLMCache, get_llm_cache
 
-__all__ = ["StorageHandler", "ProgressReporter"]
+__all__ = [
+    "StorageHandler", "ProgressReporter", "AnalysisCache", "fingerprint_file",
+    "ModelRegistry", "ModelHandle", "get_model_registry",
+    "LLMCache", "get_llm_cache"
+]
@@ -0,0 +1,222 @@
+"""Persistent, content-addressed cache for per-video analysis artifacts.
+
+Scene detection, ASR and visual analysis results are stored on local disk,
+keyed by a fast fingerprint of the video file plus the model and parameter
+versions that produced them. A draft-narrative run and the approved-narrative
+run that follows it (or re-generations with different styles) therefore
+analyze the video only once.
+
+Eviction is size-based LRU: entries are touched on every hit, and the oldest
+entries are deleted once the cache grows past its size budget.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+from loguru import logger
+
+from config import get_config
+
+
+# Bump when the pickled artifact dataclasses change shape
+ARTIFACT_SCHEMA_VERSION = 1
+
+# Bytes read from each of the start, middle and end of a file for fingerprinting
+FINGERPRINT_SAMPLE_SIZE = 4 * 1024 * 1024
+
+
+def fingerprint_file(path: Union[str, Path]) -> str:
+    """Compute a fast content fingerprint of a (possibly huge) file.
+
+    Hashes the file size plus fixed-size samples from the start, middle and
+    end instead of the whole file, so a multi-GB master costs a few reads.
+
+    Args:
+        path: File to fingerprint
+
+    Returns:
+        Hex digest string
+    """
+    path = Path(path)
+    size = path.stat().st_size
+    digest = hashlib.sha256(str(size).encode())
+
+    with open(path, "rb") as f:
+        for offset in (0, size // 2, max(0, size - FINGERPRINT_SAMPLE_SIZE)):
+            f.seek(offset)
+            digest.update(f.read(FINGERPRINT_SAMPLE_SIZE))
+
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    """Disk-backed artifact cache with size-based LRU eviction."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_size_bytes: Optional[int] = None,
+        enabled: Optional[bool] = None
+    ):
+        """Initialize analysis cache.
+
+        Args:
+            cache_dir: Cache directory; relative paths are resolved under the
+                models cache directory (default from config)
+            max_size_bytes: Size budget before LRU eviction (default from config)
+            enabled: Enable caching (default from config)
+        """
+        config = get_config()
+        self.cache_dir = Path(cache_dir or config.cache.cache_dir).expanduser()
+        if not self.cache_dir.is_absolute():
+            self.cache_dir = config.models_cache_dir / self.cache_dir
+        self.max_size_bytes = max_size_bytes or config.cache.max_size_bytes
+        self.enabled = config.cache.enabled if enabled is None else enabled
+        self._lock = threading.Lock()
+
+        if self.enabled:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def make_key(
+        self,
+        video_fingerprint: str,
+        artifact: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Build a cache key for an artifact of a video.
+
+        Args:
+            video_fingerprint: Result of fingerprint_file for the source video
+            artifact: Artifact name (e.g. "scenes", "asr", "visual")
+            params: Model names and parameters that affect the artifact
+
+        Returns:
+            Cache key string
+        """
+        payload = json.dumps({
+            "schema": ARTIFACT_SCHEMA_VERSION,
+            "video": video_fingerprint,
+            "artifact": artifact,
+            "params": params or {}
+        }, sort_keys=True, default=str)
+        return f"{artifact}-{hashlib.sha256(payload.encode()).hexdigest()[:32]}"
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Load a cached artifact.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached object, or None on miss
+        """
+        if not self.enabled:
+            return None
+
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {key}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        # Touch for LRU ordering
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        logger.info(f"Analysis cache hit: {key}")
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store an artifact, then evict old entries if over budget.
+
+        Args:
+            key: Cache key from make_key
+            value: Picklable artifact
+        """
+        if not self.enabled:
+            return
+
+        path = self._path(key)
+        tmp_path = None
+        try:
+            # Write atomically so concurrent readers never see partial files
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            logger.info(f"Analysis cache stored: {key} ({path.stat().st_size / (1024*1024):.1f} MB)")
+        except Exception as e:
+            logger.warning(f"Failed to cache {key}: {e}")
+            # Partial writes are not *.pkl, so eviction would never see them
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+            return
+
+        self._evict()
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        should_store: Optional[Callable[[Any], bool]] = None,
+        on_hit: Optional[Callable[[], None]] = None
+    ) -> Any:
+        """Return a cached artifact or compute and store it.
+
+        Args:
+            key: Cache key from make_key
+            compute: Function producing the artifact on a miss
+            should_store: Optional predicate; results it rejects are not cached
+            on_hit: Optional callback run when the artifact came from the cache
+
+        Returns:
+            Cached or freshly computed artifact
+        """
+        value = self.get(key)
+        if value is not None:
+            if on_hit is not None:
+                on_hit()
+            return value
+
+        value = compute()
+        if value is not None and (should_store is None or should_store(value)):
+            self.put(key, value)
+        return value
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until under the size budget."""
+        with self._lock:
+            entries = []
+            total = 0
+            for path in self.cache_dir.glob("*.pkl"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            if total <= self.max_size_bytes:
+                return
+
+            for _, size, path in sorted(entries):
+                if total <= self.max_size_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                logger.info(f"Analysis cache evicted: {path.stem}")
@@ -0,0 +1,92 @@
+"""Sorted interval index for time-ranged items (transcript/subtitle segments).
+
+Scene-by-scene analysis asks "which segments overlap this scene?" once per
+scene. Scanning every segment each time is quadratic over a feature film
+(~1,500 scenes x ~2,000 segments). The index sorts items by start time once
+and answers range and point queries with bisect in O(log n + k).
+
+Items may overlap and have any length. A running maximum of end times
+bounds where overlapping items can begin, so long items are never missed.
+"""
+
+import bisect
+from operator import attrgetter
+from typing import Callable, Generic, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+class IntervalIndex(Generic[T]):
+    """Read-only index over items with start/end times, built once."""
+
+    def __init__(
+        self,
+        items: Sequence[T],
+        start: Callable[[T], float] = attrgetter("start_time"),
+        end: Callable[[T], float] = attrgetter("end_time")
+    ):
+        """Build the index.
+
+        Args:
+            items: Items to index (order is kept for items with equal starts)
+            start: Gets an item's start time
+            end: Gets an item's end time
+        """
+        self._source = items
+        self._size = len(items)
+
+        order = sorted(range(len(items)), key=lambda i: start(items[i]))
+        self._items: List[T] = [items[i] for i in order]
+        self._starts: List[float] = [start(item) for item in self._items]
+        self._ends: List[float] = [end(item) for item in self._items]
+
+        # _max_ends[i] = latest end among the first i+1 items (non-decreasing)
+        self._max_ends: List[float] = []
+        latest = float("-inf")
+        for e in self._ends:
+            latest = max(latest, e)
+            self._max_ends.append(latest)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def is_built_from(self, items: Sequence[T]) -> bool:
+        """Whether this index was built from ``items`` (same list, same length)."""
+        return items is self._source and len(items) == self._size
+
+    def overlapping(self, start: float, end: float) -> List[T]:
+        """Get items overlapping the open range (start, end).
+
+        Matches ``item.start < end and item.end > start``.
+
+        Returns:
+            Matching items in start-time order
+        """
+        hi = bisect.bisect_left(self._starts, end)
+        lo = bisect.bisect_right(self._max_ends, start, 0, hi)
+        return [self._items[i] for i in range(lo, hi) if self._ends[i] > start]
+
+    def starting_in(self, start: float, end: float) -> List[T]:
+        """Get items whose start time falls in [start, end).
+
+        Returns:
+            Matching items in start-time order
+        """
+        lo = bisect.bisect_left(self._starts, start)
+        hi = bisect.bisect_left(self._starts, end)
+        return self._items[lo:hi]
+
+    def at(self, timestamp: float, tolerance: float = 0.0) -> Optional[T]:
+        """Get the earliest-starting item covering a timestamp.
+
+        Matches ``item.start - tolerance <= timestamp <= item.end + tolerance``.
+
+        Returns:
+            Matching item or None
+        """
+        hi = bisect.bisect_right(self._starts, timestamp + tolerance)
+        lo = bisect.bisect_left(self._max_ends, timestamp - tolerance, 0, hi)
+        for i in range(lo, hi):
+            if self._ends[i] >= timestamp - tolerance:
+                return self._items[i]
+        return None
@@ -0,0 +1,465 @@
+"""Persistent prompt/response cache for LLM generations.
+
+Narrative generation sends the same prompts on every re-run of a film
+(character extraction, story analysis, dialogue selection), and each
+generation costs seconds to minutes. Responses are stored on local disk,
+keyed by backend, model, a hash of the prompt and the sampling parameters,
+so identical requests are answered from disk.
+
+A response can only be reused if generating it again would give the same
+text. That holds for greedy decoding (temperature 0) or sampling with a fixed
+seed. Deterministic mode (on by default) pins the seed for every call, and
+non-deterministic requests are never cached. Batched generations are only
+cached when greedy: a sampled output from a padded batch depends on the other
+prompts in the batch, so it is not a function of its own prompt.
+
+Entries expire after a TTL. Eviction is size-based LRU, as in AnalysisCache.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+from loguru import logger
+
+from config import get_config
+
+
+# Bump when the key layout or entry format changes
+LLM_CACHE_SCHEMA_VERSION = 1
+
+
+def sampling_params(
+    temperature: float,
+    max_tokens: int,
+    top_p: Optional[float] = None
+) -> Dict[str, Any]:
+    """Build the sampling parameters for one generation.
+
+    In deterministic mode the configured seed is added, so the output is a
+    pure function of (model, prompt, params) and can be cached.
+
+    Args:
+        temperature: Sampling temperature (0 = greedy)
+        max_tokens: Max new tokens
+        top_p: Nucleus sampling threshold, if used
+
+    Returns:
+        Dict with temperature, max_tokens, top_p and seed (None if unseeded)
+    """
+    config = get_config().llm
+    return {
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "top_p": top_p,
+        "seed": config.seed if config.deterministic else None,
+    }
+
+
+def is_deterministic(params: Dict[str, Any]) -> bool:
+    """Whether a generation with these parameters is reproducible."""
+    return params.get("temperature", 1.0) == 0 or params.get("seed") is not None
+
+
+def is_batch_deterministic(params: Dict[str, Any]) -> bool:
+    """Whether each output of a batched generation is reproducible on its own."""
+    return params.get("temperature", 1.0) == 0
+
+
+def ollama_options(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Translate sampling parameters into Ollama ``options``."""
+    options = {"temperature": params["temperature"], "num_predict": params["max_tokens"]}
+    if params.get("top_p") is not None:
+        options["top_p"] = params["top_p"]
+    if params.get("seed") is not None:
+        options["seed"] = params["seed"]
+    return options
+
+
+class _SeededSampler:
+    """Logits processor that samples with a private, seeded torch.Generator.
+
+    Adds Gumbel noise to the temperature-scaled (and top-p filtered) scores,
+    so greedy search picks each token with the same probabilities as
+    sampling. The noise comes from a local generator, leaving the global
+    torch RNG untouched and unaffected by other threads.
+    """
+
+    def __init__(self, temperature: float, seed: int, top_p: Optional[float] = None):
+        self.temperature = temperature
+        self.seed = seed
+        self.top_p = top_p
+        self._generator = None
+
+    def __call__(self, input_ids, scores):
+        import torch
+
+        if self._generator is None:
+            self._generator = torch.Generator(device=scores.device).manual_seed(self.seed)
+
+        scores = scores.float() / self.temperature
+
+        if self.top_p is not None and self.top_p < 1.0:
+            sorted_scores, sorted_idx = torch.sort(scores, descending=True)
+            probs = sorted_scores.softmax(dim=-1)
+            # Drop tokens once the mass before them reaches top_p (keeps the top one)
+            drop = (probs.cumsum(dim=-1) - probs) >= self.top_p
+            scores = scores.masked_fill(
+                drop.scatter(-1, sorted_idx, drop), float("-inf")
+            )
+
+        uniform = torch.rand(
+            scores.shape, generator=self._generator, device=scores.device
+        ).clamp_(min=1e-20)
+        return scores - torch.log(-torch.log(uniform))
+
+
+def hf_generate_kwargs(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Translate sampling parameters into transformers ``generate`` kwargs.
+
+    With a seed set, sampling draws from a per-call local generator (see
+    _SeededSampler), so it repeats exactly without touching global RNG state.
+    Call once per generate() so every call starts from the seed.
+    """
+    if params["temperature"] == 0:
+        return {"do_sample": False}
+
+    if params.get("seed") is not None:
+        from transformers import LogitsProcessorList
+        sampler = _SeededSampler(params["temperature"], params["seed"], params.get("top_p"))
+        return {"do_sample": False, "logits_processor": LogitsProcessorList([sampler])}
+
+    kwargs = {"do_sample": True, "temperature": params["temperature"]}
+    if params.get("top_p") is not None:
+        kwargs["top_p"] = params["top_p"]
+    return kwargs
+
+
+class LLMCache:
+    """Disk-backed LLM response cache with TTL and size-based LRU eviction."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_size_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        enabled: Optional[bool] = None
+    ):
+        """Initialize LLM cache.
+
+        Args:
+            cache_dir: Cache directory (default from config)
+            max_size_bytes: Size budget before LRU eviction (default from config)
+            ttl_seconds: Entry lifetime, 0 = never expire (default from config)
+            enabled: Enable caching (default from config)
+        """
+        config = get_config().llm
+        self.cache_dir = Path(cache_dir or config.cache_dir).expanduser()
+        self.max_size_bytes = max_size_bytes or config.cache_max_bytes
+        self.ttl_seconds = config.cache_ttl_seconds if ttl_seconds is None else ttl_seconds
+        self.enabled = config.cache_enabled if enabled is None else enabled
+        self._lock = threading.Lock()
+        # Total bytes on disk; scanned once on first write, then kept current
+        self._size: Optional[int] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+
+        if self.enabled:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def make_key(
+        self,
+        backend: str,
+        model: str,
+        prompt: str,
+        params: Dict[str, Any]
+    ) -> str:
+        """Build a cache key for a generation request.
+
+        Args:
+            backend: LLM backend (e.g. "ollama", "transformers")
+            model: Model name
+            prompt: Full prompt text
+            params: Sampling parameters from sampling_params
+
+        Returns:
+            Cache key string
+        """
+        payload = json.dumps({
+            "schema": LLM_CACHE_SCHEMA_VERSION,
+            "backend": backend,
+            "model": model,
+            "prompt": hashlib.sha256(prompt.encode()).hexdigest(),
+            "params": params
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()[:40]
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """Load a cached response.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached response text, or None on miss or expiry
+        """
+        if not self.enabled:
+            return None
+
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable LLM cache entry {key}: {e}")
+            self._remove(path)
+            return None
+
+        if self.ttl_seconds and time.time() - entry.get("created", 0) > self.ttl_seconds:
+            self._remove(path)
+            return None
+
+        # Touch for LRU ordering
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return entry.get("response")
+
+    def put(self, key: str, response: str, backend: str = "", model: str = "") -> None:
+        """Store a response, then evict old entries if over budget.
+
+        Args:
+            key: Cache key from make_key
+            response: Generated text
+            backend: Backend name (informational)
+            model: Model name (informational)
+        """
+        if not self.enabled:
+            return
+
+        entry = {
+            "created": time.time(),
+            "backend": backend,
+            "model": model,
+            "response": response
+        }
+        path = self._path(key)
+        try:
+            old_size = path.stat().st_size
+        except OSError:
+            old_size = 0
+
+        tmp_path = None
+        try:
+            # Write atomically so concurrent readers never see partial files
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            new_size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to cache LLM response {key}: {e}")
+            # Partial writes are not *.json, so eviction would never see them
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            if self._size is None:
+                # First write: one directory scan (this entry is included)
+                self._evict_locked()
+                return
+            self._size += new_size - old_size
+            over_budget = self._size > self.max_size_bytes
+
+        if over_budget:
+            self._evict()
+
+    def generate(
+        self,
+        backend: str,
+        model: str,
+        prompt: str,
+        params: Dict[str, Any],
+        generate: Callable[[], str]
+    ) -> str:
+        """Return a cached response or generate and store it.
+
+        Non-deterministic requests and empty (failed) generations are never
+        stored.
+
+        Args:
+            backend: LLM backend (e.g. "ollama", "transformers")
+            model: Model name
+            prompt: Full prompt text
+            params: Sampling parameters from sampling_params
+            generate: Function that runs the actual generation
+
+        Returns:
+            Response text
+        """
+        if not self.enabled or not is_deterministic(params):
+            with self._lock:
+                self.uncacheable += 1
+            return generate()
+
+        key = self.make_key(backend, model, prompt, params)
+        response = self.get(key)
+        if response is not None:
+            with self._lock:
+                self.hits += 1
+            logger.info(f"LLM cache hit: {backend}/{model} ({self.hit_rate:.0%} hit rate)")
+            return response
+
+        with self._lock:
+            self.misses += 1
+
+        response = generate()
+        if response:
+            self.put(key, response, backend=backend, model=model)
+        return response
+
+    def generate_many(
+        self,
+        backend: str,
+        model: str,
+        prompts: List[str],
+        params: Dict[str, Any],
+        generate_batch: Callable[[List[str]], List[str]]
+    ) -> List[str]:
+        """Batched generate(): answer cached prompts, generate the rest in one call.
+
+        Only greedy (temperature 0) batches are cached; sampled batch outputs
+        depend on batch composition, so they are generated every time.
+
+        Args:
+            backend: LLM backend (e.g. "ollama", "transformers")
+            model: Model name
+            prompts: Prompt texts
+            params: Sampling parameters from sampling_params
+            generate_batch: Function generating responses for a list of prompts
+
+        Returns:
+            Responses in prompt order
+        """
+        if not self.enabled or not is_batch_deterministic(params):
+            with self._lock:
+                self.uncacheable += len(prompts)
+            return generate_batch(prompts) if prompts else []
+
+        keys = [self.make_key(backend, model, prompt, params) for prompt in prompts]
+        responses: List[Optional[str]] = [self.get(key) for key in keys]
+        missing = [i for i, response in enumerate(responses) if response is None]
+
+        with self._lock:
+            self.hits += len(prompts) - len(missing)
+            self.misses += len(missing)
+        if len(missing) < len(prompts):
+            logger.info(
+                f"LLM cache: {len(prompts) - len(missing)}/{len(prompts)} prompts cached "
+                f"({backend}/{model})"
+            )
+
+        if missing:
+            generated = generate_batch([prompts[i] for i in missing])
+            for i, response in zip(missing, generated):
+                responses[i] = response
+                if response:
+                    self.put(keys[i], response, backend=backend, model=model)
+
+        return [response or "" for response in responses]
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of cacheable lookups answered from disk."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters for this process."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "uncacheable": self.uncacheable,
+            "hit_rate": self.hit_rate
+        }
+
+    def log_stats(self) -> None:
+        """Log a one-line summary of cache effectiveness."""
+        if self.hits or self.misses or self.uncacheable:
+            logger.info(
+                f"LLM cache: {self.hits} hits, {self.misses} misses, "
+                f"{self.uncacheable} uncacheable ({self.hit_rate:.0%} hit rate)"
+            )
+
+    def _remove(self, path: Path) -> None:
+        """Delete an entry and keep the tracked size current."""
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except OSError:
+            return
+        with self._lock:
+            if self._size is not None:
+                self._size -= size
+
+    def _evict(self) -> None:
+        """Delete expired entries, then least recently used ones until under budget."""
+        with self._lock:
+            self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        """Scan the cache directory and evict; resets the tracked size. Holds _lock."""
+        now = time.time()
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            # mtime is refreshed on hits, so this only drops entries
+            # that have been neither written nor read for a full TTL
+            if self.ttl_seconds and now - stat.st_mtime > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        if total > self.max_size_bytes:
+            for _, size, path in sorted(entries):
+                if total <= self.max_size_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+
+        self._size = total
+
+
+# Singleton cache instance
+_llm_cache: Optional[LLMCache] = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMCache:
+    """Get or create the process-wide LLM response cache."""
+    global _llm_cache
+    with _llm_cache_lock:
+        if _llm_cache is None:
+            _llm_cache = LLMCache()
+            atexit.register(_llm_cache.log_stats)
+        return _llm_cache
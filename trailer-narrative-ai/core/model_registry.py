@@ -0,0 +1,324 @@
+"""Process-wide registry of loaded models (LLM, ASR, CLIP).
+
+Every component that needs model weights asks the registry instead of
+loading them itself. Models are loaded lazily, keyed by (kind, name,
+device, dtype), and shared: the whole pipeline holds at most one copy of
+each. Handles are reference counted; models nobody holds stay cached until
+the memory budget is exceeded or a memory-hungry stage (ASR, MusicGen)
+asks for idle models to be dropped, least recently used first.
+"""
+
+import gc
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+from loguru import logger
+
+from config import get_config
+
+
+ModelKey = Tuple[str, str, str, str]  # (kind, name, device, dtype)
+
+
+@dataclass
+class _Entry:
+    key: ModelKey
+    value: Any = None
+    size_bytes: int = 0
+    refcount: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+    ready: threading.Event = field(default_factory=threading.Event)
+    error: Optional[BaseException] = None
+
+
+class ModelHandle:
+    """Reference to a shared model; release it (or exit the context) when done."""
+
+    def __init__(self, registry: "ModelRegistry", entry: _Entry):
+        self._registry = registry
+        self._entry = entry
+        self._released = False
+
+    @property
+    def model(self) -> Any:
+        """The loaded model object (whatever the loader returned)."""
+        return self._entry.value
+
+    def release(self) -> None:
+        """Drop this reference (idempotent)."""
+        if not self._released:
+            self._released = True
+            self._registry._release(self._entry)
+
+    def bind(self, owner: Any) -> "ModelHandle":
+        """Release this handle automatically when ``owner`` is garbage collected."""
+        weakref.finalize(owner, self.release)
+        return self
+
+    def __enter__(self) -> Any:
+        return self.model
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+def resolve_device(device: Optional[str] = "auto") -> str:
+    """Resolve "auto" to the best available torch device."""
+    if device and device != "auto":
+        return device
+    try:
+        import torch
+        if torch.cuda.is_available():
+            return "cuda"
+        if hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
+            return "mps"
+    except ImportError:
+        pass
+    return "cpu"
+
+
+def estimate_model_bytes(value: Any) -> int:
+    """Estimate memory held by a model (or a tuple/pipeline wrapping one)."""
+    if isinstance(value, (tuple, list)):
+        return sum(estimate_model_bytes(v) for v in value)
+
+    module = getattr(value, "model", value)  # transformers pipelines wrap .model
+    if not hasattr(module, "parameters"):
+        return 0
+
+    try:
+        total = sum(p.numel() * p.element_size() for p in module.parameters())
+        total += sum(b.numel() * b.element_size() for b in module.buffers())
+        return total
+    except Exception:
+        return 0
+
+
+class ModelRegistry:
+    """Shared, lazily loaded, reference-counted models with an LRU memory budget."""
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        """Initialize model registry.
+
+        Args:
+            max_bytes: Memory budget for loaded models (default from config;
+                0 means unlimited)
+        """
+        config = get_config()
+        self.max_bytes = config.models.max_bytes if max_bytes is None else max_bytes
+        self._entries: Dict[ModelKey, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def acquire(
+        self,
+        kind: str,
+        name: str,
+        loader: Callable[[], Any],
+        device: str = "cpu",
+        dtype: str = "float32"
+    ) -> ModelHandle:
+        """Get a handle to a model, loading it on first use.
+
+        Concurrent callers for the same key wait for a single load.
+
+        Args:
+            kind: Model family/task (e.g. "seq2seq", "text-generation", "clip")
+            name: Model name or path
+            loader: Called once to load the model if it is not cached
+            device: Device the model lives on
+            dtype: Weight dtype name
+
+        Returns:
+            ModelHandle (release it when done)
+
+        Raises:
+            Whatever the loader raised, if loading failed
+        """
+        key = (kind, name, device, dtype)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            owner = entry is None
+            if owner:
+                entry = _Entry(key=key)
+                self._entries[key] = entry
+            entry.refcount += 1
+            entry.last_used = time.monotonic()
+
+        if owner:
+            self._load(entry, loader)
+        else:
+            entry.ready.wait()
+
+        if entry.error is not None:
+            with self._lock:
+                entry.refcount -= 1
+            raise entry.error
+
+        return ModelHandle(self, entry)
+
+    def _load(self, entry: _Entry, loader: Callable[[], Any]) -> None:
+        kind, name, device, dtype = entry.key
+        logger.info(f"Model registry: loading {kind} {name} ({device}, {dtype})")
+        try:
+            entry.value = loader()
+            entry.size_bytes = estimate_model_bytes(entry.value)
+            logger.info(
+                f"Model registry: {name} ready "
+                f"(~{entry.size_bytes / (1024**3):.2f}GB, {self.loaded_bytes() / (1024**3):.2f}GB total)"
+            )
+        except BaseException as e:
+            entry.error = e
+            with self._lock:
+                self._entries.pop(entry.key, None)
+        finally:
+            entry.ready.set()
+
+        if entry.error is None:
+            self._enforce_budget()
+
+    def _release(self, entry: _Entry) -> None:
+        with self._lock:
+            entry.refcount = max(0, entry.refcount - 1)
+            entry.last_used = time.monotonic()
+        self._enforce_budget()
+
+    def loaded_bytes(self) -> int:
+        """Estimated memory held by all loaded models."""
+        with self._lock:
+            return sum(e.size_bytes for e in self._entries.values() if e.ready.is_set())
+
+    def unload_idle(self, keep_bytes: Optional[int] = None) -> int:
+        """Unload models nobody holds, least recently used first.
+
+        Call before memory-hungry stages (ASR workers, MusicGen).
+
+        Args:
+            keep_bytes: Stop once loaded models fit in this many bytes
+                (default: unload every idle model)
+
+        Returns:
+            Estimated bytes freed
+        """
+        with self._lock:
+            idle = sorted(
+                (e for e in self._entries.values() if e.refcount == 0 and e.ready.is_set()),
+                key=lambda e: e.last_used
+            )
+            total = sum(e.size_bytes for e in self._entries.values() if e.ready.is_set())
+            evicted = []
+            for entry in idle:
+                if keep_bytes is not None and total <= keep_bytes:
+                    break
+                del self._entries[entry.key]
+                total -= entry.size_bytes
+                evicted.append(entry)
+
+        freed = 0
+        for entry in evicted:
+            logger.info(f"Model registry: unloading idle {entry.key[1]} ({entry.key[2]})")
+            freed += entry.size_bytes
+            entry.value = None
+
+        if evicted:
+            gc.collect()
+            try:
+                import torch
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
+            except ImportError:
+                pass
+
+        return freed
+
+    def _enforce_budget(self) -> None:
+        if self.max_bytes and self.loaded_bytes() > self.max_bytes:
+            self.unload_idle(keep_bytes=self.max_bytes)
+
+
+# Singleton registry instance
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Get or create the process-wide model registry."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry()
+        return _registry
+
+
+# =============================================================================
+# SHARED LOADERS
+# =============================================================================
+
+def acquire_seq2seq(
+    model_name: str,
+    device: str = "auto",
+    half_on_gpu: bool = True
+) -> ModelHandle:
+    """Acquire a shared (tokenizer, model) pair for a seq2seq LM (e.g. flan-t5).
+
+    Args:
+        model_name: HuggingFace model name
+        device: Target device ("auto" picks cuda > mps > cpu)
+        half_on_gpu: Use float16 weights on CUDA
+
+    Returns:
+        ModelHandle whose model is (tokenizer, model)
+    """
+    import torch
+
+    device = resolve_device(device)
+    dtype = torch.float16 if (device == "cuda" and half_on_gpu) else torch.float32
+
+    def load():
+        from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+        tokenizer = AutoTokenizer.from_pretrained(model_name)
+        if device == "cuda":
+            model = AutoModelForSeq2SeqLM.from_pretrained(
+                model_name, device_map="auto", torch_dtype=dtype
+            )
+        else:
+            model = AutoModelForSeq2SeqLM.from_pretrained(model_name).to(device)
+        model.eval()
+        return tokenizer, model
+
+    return get_model_registry().acquire(
+        "seq2seq", model_name, load, device=device, dtype=str(dtype).replace("torch.", "")
+    )
+
+
+def acquire_text_generation(model_name: str, device: str = "auto") -> ModelHandle:
+    """Acquire a shared transformers text-generation pipeline.
+
+    Args:
+        model_name: HuggingFace model name
+        device: Target device ("auto" picks cuda > mps > cpu)
+
+    Returns:
+        ModelHandle whose model is the pipeline
+    """
+    import torch
+
+    device = resolve_device(device)
+    dtype = torch.float16 if device != "cpu" else torch.float32
+
+    def load():
+        from transformers import pipeline
+        return pipeline(
+            "text-generation",
+            model=model_name,
+            device_map="auto" if device != "cpu" else None,
+            torch_dtype=dtype,
+            trust_remote_code=True,
+        )
+
+    return get_model_registry().acquire(
+        "text-generation", model_name, load, device=device, dtype=str(dtype).replace("torch.", "")
+    )
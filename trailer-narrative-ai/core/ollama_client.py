@@ -0,0 +1,323 @@
+"""Async Ollama client with connection pooling and bounded concurrency.
+
+One pooled HTTP session is kept per event loop instead of a fresh request
+per prompt. In-flight generations are capped so a local server is not
+flooded. Responses are streamed token by token, so a caller can stop as
+soon as it has what it needs (e.g. a complete JSON object). Transient
+failures (connection errors, timeouts, 5xx/429) are retried with
+exponential backoff.
+
+Async code creates its own AsyncOllamaClient. Synchronous code (most of
+the pipeline) uses the module-level helpers, which run a shared client on
+a background event loop, so all threads share one pool and one limit.
+"""
+
+import asyncio
+import json
+import random
+import threading
+from typing import Any, Callable, Dict, List, Optional
+from loguru import logger
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+from config import get_config
+
+
+# Status codes worth retrying (server busy / model loading / transient errors)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Upper bound for a single backoff sleep (seconds)
+MAX_BACKOFF = 10.0
+
+
+class OllamaError(RuntimeError):
+    """An Ollama request failed after all retries."""
+
+
+class _RetryableStatus(Exception):
+    """Transient HTTP status from the server."""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class JsonObjectStop:
+    """Early-stop predicate: true once the first top-level JSON object closes.
+
+    Scans only newly streamed text on each call, so checking after every
+    token stays linear in the response length.
+    """
+
+    def __init__(self):
+        self._pos = 0
+        self._depth = 0
+        self._started = False
+        self._in_string = False
+        self._escape = False
+
+    def __call__(self, text: str) -> bool:
+        for ch in text[self._pos:]:
+            self._pos += 1
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"' and self._started:
+                self._in_string = True
+            elif ch == "{":
+                self._started = True
+                self._depth += 1
+            elif ch == "}" and self._started:
+                self._depth -= 1
+                if self._depth == 0:
+                    return True
+        return False
+
+
+class AsyncOllamaClient:
+    """Pooled, concurrency-limited async client for the Ollama HTTP API."""
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        model: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        retry_backoff: Optional[float] = None
+    ):
+        """Initialize Ollama client.
+
+        Args:
+            host: Server URL (default from config)
+            model: Default model (default from config)
+            max_concurrency: Max in-flight generations (default from config)
+            timeout: Max seconds to wait for the next streamed chunk (default from config)
+            max_retries: Retries per request after the first attempt (default from config)
+            retry_backoff: Base backoff in seconds, doubled per retry (default from config)
+
+        Raises:
+            RuntimeError: If httpx is not installed
+        """
+        if not HAS_HTTPX:
+            raise RuntimeError("httpx not installed. Run: pip install httpx")
+
+        config = get_config().llm
+        self.host = (host or config.ollama_host).rstrip("/")
+        self.model = model or config.ollama_model
+        self.max_concurrency = max_concurrency or config.ollama_max_concurrency
+        self.timeout = timeout or config.ollama_timeout
+        self.max_retries = config.ollama_max_retries if max_retries is None else max_retries
+        self.retry_backoff = config.ollama_retry_backoff if retry_backoff is None else retry_backoff
+
+        self._client = httpx.AsyncClient(
+            base_url=self.host,
+            timeout=httpx.Timeout(self.timeout, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency
+            )
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def __aenter__(self) -> "AsyncOllamaClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        await self._client.aclose()
+
+    async def list_models(self) -> List[str]:
+        """List model names pulled on the server."""
+        response = await self._client.get("/api/tags")
+        response.raise_for_status()
+        return [m["name"] for m in response.json().get("models", [])]
+
+    async def is_available(self, timeout: float = 2.0) -> bool:
+        """Check whether the server is reachable."""
+        try:
+            response = await self._client.get("/api/tags", timeout=timeout)
+            return response.status_code == 200
+        except httpx.HTTPError:
+            return False
+
+    async def generate(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None,
+        stop_when: Optional[Callable[[], Callable[[str], bool]]] = None
+    ) -> str:
+        """Generate a response, streaming tokens as they arrive.
+
+        Args:
+            prompt: Prompt text
+            model: Model name (default: client model)
+            options: Ollama options (temperature, num_predict, seed, ...)
+            stop_when: Factory for an early-stop predicate. A fresh predicate
+                is created per attempt (predicates such as JsonObjectStop are
+                stateful) and called with the text so far after every chunk;
+                returning True stops generation early (the stream is closed,
+                which makes the server stop generating)
+
+        Returns:
+            Generated text
+
+        Raises:
+            OllamaError: If the request still fails after all retries
+        """
+        payload = {
+            "model": model or self.model,
+            "prompt": prompt,
+            "stream": True,
+            "options": options or {}
+        }
+
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    return await self._stream_generate(
+                        payload, stop_when() if stop_when else None
+                    )
+                except (httpx.TransportError, _RetryableStatus) as e:
+                    if attempt == self.max_retries:
+                        raise OllamaError(f"Ollama request failed after {attempt + 1} attempts: {e}") from e
+                    delay = min(MAX_BACKOFF, self.retry_backoff * (2 ** attempt))
+                    delay *= 1 + random.random() * 0.25  # jitter
+                    logger.warning(f"Ollama request failed ({e}), retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+                except httpx.HTTPError as e:
+                    raise OllamaError(f"Ollama request failed: {e}") from e
+
+        return ""  # unreachable
+
+    async def _stream_generate(
+        self,
+        payload: Dict[str, Any],
+        stop_when: Optional[Callable[[str], bool]]
+    ) -> str:
+        """Run one streaming /api/generate request."""
+        text = ""
+
+        async with self._client.stream("POST", "/api/generate", json=payload) as response:
+            if response.status_code in RETRY_STATUS_CODES:
+                raise _RetryableStatus(response.status_code)
+            if response.status_code != 200:
+                await response.aread()
+                response.raise_for_status()
+
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                try:
+                    chunk = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise OllamaError(f"Malformed Ollama stream line: {line[:100]!r}") from e
+                if chunk.get("error"):
+                    raise OllamaError(chunk["error"])
+
+                text += chunk.get("response", "")
+                if chunk.get("done"):
+                    break
+                if stop_when is not None and stop_when(text):
+                    break
+
+        return text
+
+    async def generate_many(
+        self,
+        prompts: List[str],
+        model: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None,
+        stop_when: Optional[Callable[[], Callable[[str], bool]]] = None
+    ) -> List[str]:
+        """Generate responses for many prompts concurrently.
+
+        At most ``max_concurrency`` requests are in flight at once.
+
+        Args:
+            prompts: Prompt texts
+            model: Model name (default: client model)
+            options: Ollama options shared by all prompts
+            stop_when: Factory for a fresh early-stop predicate per request
+
+        Returns:
+            Responses in prompt order ("" where a request failed)
+        """
+        async def run(prompt: str) -> str:
+            try:
+                return await self.generate(prompt, model, options, stop_when)
+            except Exception as e:
+                # One failed prompt must not abort the rest of the batch
+                logger.error(f"Ollama generation failed: {e}")
+                return ""
+
+        return list(await asyncio.gather(*(run(p) for p in prompts)))
+
+
+# =============================================================================
+# SYNC FACADE (shared client on a background event loop)
+# =============================================================================
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_shared_client: Optional[AsyncOllamaClient] = None
+_shared_lock = threading.Lock()
+
+
+def _run(coro_factory: Callable[[AsyncOllamaClient], Any]) -> Any:
+    """Run a coroutine on the shared client's background loop and wait for it."""
+    global _loop, _shared_client
+
+    with _shared_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="ollama-client", daemon=True).start()
+        if _shared_client is None:
+            async def create() -> AsyncOllamaClient:
+                return AsyncOllamaClient()
+            _shared_client = asyncio.run_coroutine_threadsafe(create(), _loop).result()
+
+    return asyncio.run_coroutine_threadsafe(coro_factory(_shared_client), _loop).result()
+
+
+def ollama_available(timeout: float = 2.0) -> bool:
+    """Check whether the configured Ollama server is reachable."""
+    if not HAS_HTTPX:
+        return False
+    return _run(lambda client: client.is_available(timeout))
+
+
+def ollama_generate(
+    prompt: str,
+    model: Optional[str] = None,
+    options: Optional[Dict[str, Any]] = None,
+    stop_when: Optional[Callable[[], Callable[[str], bool]]] = None
+) -> str:
+    """Blocking AsyncOllamaClient.generate on the shared client.
+
+    Raises:
+        OllamaError: If the request still fails after all retries
+    """
+    return _run(lambda client: client.generate(prompt, model, options, stop_when))
+
+
+def ollama_generate_many(
+    prompts: List[str],
+    model: Optional[str] = None,
+    options: Optional[Dict[str, Any]] = None,
+    stop_when: Optional[Callable[[], Callable[[str], bool]]] = None
+) -> List[str]:
+    """Blocking AsyncOllamaClient.generate_many on the shared client."""
+    return _run(lambda client: client.generate_many(prompts, model, options, stop_when))
@@ -307,6 +307,7 @@ def create_analysis_pipeline(
     from analysis.scene_detector import SceneDetector
     from analysis.indian_asr import IndianDialectASR
     from analysis.visual_analyzer import VisualAnalyzer
+    from analysis.frame_stream import run_shared_analysis, use_shared_decode
 
     config = config or get_config()
     pipeline = ParallelPipeline(max_workers=config.parallel.max_cpu_workers)
@@ -328,19 +329,38 @@ def create_analysis_pipeline(
     def run_visual_analysis(scene_detection_result=None):
         analyzer = VisualAnalyzer(
             device=config.visual.device,
-            frames_per_scene=config.visual.frames_per_scene
+            frames_per_scene=config.visual.frames_per_scene,
+            parallel_frames=config.visual.parallel_frames,
+            batch_size=config.visual.batch_size
         )
         scenes = [s.to_dict() for s in scene_detection_result.scenes] if scene_detection_result else []
         return analyzer.analyze_video(video_path, scenes=scenes, show_progress=True)
 
+    # Scene + visual analysis from one shared decode pass
+    def run_shared_scene_visual_analysis():
+        analyzer = VisualAnalyzer(
+            device=config.visual.device,
+            frames_per_scene=config.visual.frames_per_scene,
+            parallel_frames=config.visual.parallel_frames,
+            batch_size=config.visual.batch_size
+        )
+        return run_shared_analysis(
+            video_path, SceneDetector(), analyzer,
+            analysis_width=config.visual.analysis_width,
+            max_buffered_frames=config.visual.max_buffered_frames
+        )
+
     # Add stages
-    pipeline.add_stage("scene_detection", run_scene_detection)
     pipeline.add_stage("audio_analysis", run_audio_analysis)
-    pipeline.add_stage(
-        "visual_analysis",
-        run_visual_analysis,
-        depends_on=["scene_detection"]
-    )
+    if use_shared_decode(video_path, SceneDetector()):
+        pipeline.add_stage("scene_visual_analysis", run_shared_scene_visual_analysis)
+    else:
+        pipeline.add_stage("scene_detection", run_scene_detection)
+        pipeline.add_stage(
+            "visual_analysis",
+            run_visual_analysis,
+            depends_on=["scene_detection"]
+        )
 
     return pipeline
 
@@ -361,8 +381,12 @@ def run_parallel_analysis(
     pipeline = create_analysis_pipeline(video_path, subtitle_path)
     result = pipeline.execute()
 
-    scene_result = result.stages.get("scene_detection", {}).get("result")
     audio_result = result.stages.get("audio_analysis", {}).get("result")
-    visual_result = result.stages.get("visual_analysis", {}).get("result")
+    if "scene_visual_analysis" in result.stages:
+        shared_result = result.stages["scene_visual_analysis"].get("result")
+        scene_result, visual_result = shared_result if shared_result else (None, None)
+    else:
+        scene_result = result.stages.get("scene_detection", {}).get("result")
+        visual_result = result.stages.get("visual_analysis", {}).get("result")
 
     return scene_result, audio_result, visual_result
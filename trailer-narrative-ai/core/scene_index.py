@@ -0,0 +1,184 @@
+"""Scene index for narrative builders (time, position and unused-scene queries).
+
+Narrative builders pick a scene per beat: the scene covering a dialogue
+timestamp, the nearest unused scene, or an unused scene in a slice of the
+film. Scanning every scene on each query is quadratic over a run (beats x
+variants x ~3,000 scenes). The index is built once per run on top of
+IntervalIndex and adds id, position, category and score columns plus a
+used mask, so every query is a bisect plus a walk over the matches.
+
+Scenes may be dicts (analysis output) or objects with attributes.
+"""
+
+import bisect
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, TypeVar
+
+from core.interval_index import IntervalIndex
+
+T = TypeVar("T")
+
+
+def scene_field(scene: Any, name: str, default: Any = None) -> Any:
+    """Read a field from a scene dict or scene object."""
+    if isinstance(scene, dict):
+        return scene.get(name, default)
+    return getattr(scene, name, default)
+
+
+def scene_id_of(scene: Any) -> Any:
+    """Scene id as the builders read it ("scene_id", falling back to "id")."""
+    return scene_field(scene, "scene_id", scene_field(scene, "id", ""))
+
+
+class SceneIndex(IntervalIndex[T]):
+    """Scenes sorted by start time with columns and a used mask, built once."""
+
+    def __init__(
+        self,
+        scenes: Sequence[T],
+        duration: Optional[float] = None,
+        start: Callable[[T], float] = lambda s: scene_field(s, "start_time", 0),
+        end: Callable[[T], float] = lambda s: scene_field(s, "end_time", 0),
+        scene_id: Callable[[T], Any] = scene_id_of,
+        category: Callable[[T], Any] = lambda s: scene_field(s, "scene_type", ""),
+        score: Callable[[T], float] = lambda s: scene_field(s, "trailer_potential", 0)
+    ):
+        """Build the index.
+
+        Args:
+            scenes: Scenes to index (order is kept for equal start times)
+            duration: Video duration for positions (default: latest scene end)
+            start: Gets a scene's start time
+            end: Gets a scene's end time
+            scene_id: Gets a scene's id (used-mask key)
+            category: Gets a scene's category column value
+            score: Gets a scene's score column value
+        """
+        super().__init__(scenes, start=start, end=end)
+
+        self.ids: List[Any] = [scene_id(s) for s in self._items]
+        self.categories: List[Any] = [category(s) for s in self._items]
+        self.scores: List[float] = [score(s) for s in self._items]
+
+        if duration is None:
+            duration = max(self._ends, default=0)
+        self.duration = duration or 1
+        # Same division as the builders' ``start / video_duration``, so
+        # position comparisons match theirs exactly
+        self.positions: List[float] = [s / self.duration for s in self._starts]
+
+        self._slot_of: Dict[int, int] = {id(item): i for i, item in enumerate(self._items)}
+        self._slots: Dict[Any, List[int]] = {}
+        for i, sid in enumerate(self.ids):
+            self._slots.setdefault(sid, []).append(i)
+
+        self._used = bytearray(len(self._items))
+        self._used_ids: set = set()
+
+    @property
+    def scenes(self) -> List[T]:
+        """Scenes in start-time order."""
+        return self._items
+
+    def score_of(self, scene: T) -> float:
+        """Score column value of an indexed scene."""
+        return self.scores[self._slot_of[id(scene)]]
+
+    def category_of(self, scene: T) -> Any:
+        """Category column value of an indexed scene."""
+        return self.categories[self._slot_of[id(scene)]]
+
+    # ------------------------------------------------------------------
+    # Used mask
+    # ------------------------------------------------------------------
+
+    def mark_used(self, scene_id: Any) -> None:
+        """Mark every scene with this id as used."""
+        self._used_ids.add(scene_id)
+        for i in self._slots.get(scene_id, ()):
+            self._used[i] = 1
+
+    def is_used(self, scene_id: Any) -> bool:
+        """Whether a scene id has been marked used."""
+        return scene_id in self._used_ids
+
+    def clear_used(self) -> None:
+        """Reset the used mask (e.g. between trailer variants)."""
+        self._used = bytearray(len(self._items))
+        self._used_ids = set()
+
+    def unused(self) -> Iterator[T]:
+        """Unused scenes in start-time order."""
+        return (item for i, item in enumerate(self._items) if not self._used[i])
+
+    # ------------------------------------------------------------------
+    # Time queries
+    # ------------------------------------------------------------------
+
+    def covering(self, timestamp: float, skip_used: bool = True) -> Optional[T]:
+        """Get the earliest-starting scene with ``start <= timestamp <= end``.
+
+        Args:
+            timestamp: Time in seconds
+            skip_used: Ignore scenes marked used
+
+        Returns:
+            Matching scene or None
+        """
+        hi = bisect.bisect_right(self._starts, timestamp)
+        lo = bisect.bisect_left(self._max_ends, timestamp, 0, hi)
+        for i in range(lo, hi):
+            if self._ends[i] >= timestamp and not (skip_used and self._used[i]):
+                return self._items[i]
+        return None
+
+    def nearest(self, timestamp: float, skip_used: bool = True) -> Optional[T]:
+        """Get the scene whose start is closest to a timestamp.
+
+        Ties go to the earlier scene.
+
+        Args:
+            timestamp: Time in seconds
+            skip_used: Ignore scenes marked used
+
+        Returns:
+            Closest scene or None if there is none
+        """
+        right = bisect.bisect_left(self._starts, timestamp)
+        left = right - 1
+        n = len(self._items)
+
+        while skip_used and left >= 0 and self._used[left]:
+            left -= 1
+        while skip_used and right < n and self._used[right]:
+            right += 1
+
+        if right < n and (left < 0 or self._starts[right] - timestamp < timestamp - self._starts[left]):
+            return self._items[right]
+        if left < 0:
+            return None
+
+        # Scenes sharing that start: the first unused one in scene order
+        first = bisect.bisect_left(self._starts, self._starts[left], 0, left)
+        for i in range(first, left + 1):
+            if not (skip_used and self._used[i]):
+                return self._items[i]
+        return self._items[left]
+
+    # ------------------------------------------------------------------
+    # Position queries (0-1 through the film)
+    # ------------------------------------------------------------------
+
+    def in_position_range(
+        self,
+        min_pos: float,
+        max_pos: float,
+        skip_used: bool = True
+    ) -> Iterator[T]:
+        """Scenes whose start position is in [min_pos, max_pos], in time order."""
+        lo = bisect.bisect_left(self.positions, min_pos)
+        hi = bisect.bisect_right(self.positions, max_pos)
+        return (
+            self._items[i] for i in range(lo, hi)
+            if not (skip_used and self._used[i])
+        )
@@ -2,12 +2,15 @@
 
 import os
 import shutil
+import threading
 from pathlib import Path
 from typing import Optional, Union, Callable
 from loguru import logger
 
 try:
     import boto3
+    from boto3.s3.transfer import TransferConfig
+    from botocore.config import Config as BotoConfig
     from botocore.exceptions import ClientError
     HAS_BOTO3 = True
 except ImportError:
@@ -32,20 +35,24 @@ class S3ProgressCallback:
         self.operation = operation
         self.transferred = 0
         self.last_percent = -1
+        self._lock = threading.Lock()
 
     def __call__(self, bytes_transferred: int):
-        """Called by boto3 with bytes transferred."""
-        self.transferred += bytes_transferred
-        if self.total_size > 0:
+        """Called by boto3 with bytes transferred (from several threads in multipart transfers)."""
+        with self._lock:
+            self.transferred += bytes_transferred
+            if self.total_size <= 0:
+                return
             progress = self.transferred / self.total_size
             percent = int(progress * 100)
             # Only call callback when percentage changes (avoid too many updates)
-            if percent != self.last_percent:
-                self.last_percent = percent
-                # Log every 10% for visibility
-                if percent % 10 == 0:
-                    logger.debug(f"{self.operation}: {percent}% ({self.transferred / (1024*1024):.1f} MB)")
-                self.callback(progress)
+            if percent <= self.last_percent:
+                return
+            self.last_percent = percent
+            # Log every 10% for visibility
+            if percent % 10 == 0:
+                logger.debug(f"{self.operation}: {percent}% ({self.transferred / (1024*1024):.1f} MB)")
+            self.callback(progress)
 
 
 class StorageHandler:
@@ -76,10 +83,22 @@ class StorageHandler:
                 's3',
                 region_name=self.region,
                 aws_access_key_id=config.s3.access_key,
-                aws_secret_access_key=config.s3.secret_key
+                aws_secret_access_key=config.s3.secret_key,
+                # One pooled connection per parallel part
+                config=BotoConfig(max_pool_connections=max(10, config.s3.download_concurrency))
             )
         return self._s3_client
 
+    def _transfer_config(self) -> "TransferConfig":
+        """Multipart transfer settings: ranged parts fetched over parallel connections."""
+        config = get_config().s3
+        return TransferConfig(
+            multipart_threshold=config.multipart_threshold,
+            multipart_chunksize=config.download_part_size,
+            max_concurrency=config.download_concurrency,
+            use_threads=True
+        )
+
     def download_from_s3(
         self,
         s3_key: str,
@@ -126,7 +145,8 @@ class StorageHandler:
 
             self.s3_client.download_file(
                 bucket, s3_key, str(local_path),
-                Callback=callback
+                Callback=callback,
+                Config=self._transfer_config()
             )
             logger.info(f"Downloaded successfully: {local_path}")
             return local_path
@@ -44,6 +44,7 @@ class TrailerLLM:
     """LLM for intelligent trailer narrative generation."""
 
     def __init__(self):
+        self.model_name = "google/flan-t5-base"  # ~900MB, already cached
         self.model = None
         self.tokenizer = None
         self.device = None
@@ -55,26 +56,15 @@ class TrailerLLM:
             return True
 
         try:
-            import torch
-            from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
-
-            model_name = "google/flan-t5-base"  # ~900MB, already cached
-            logger.info(f"Loading LLM: {model_name}")
-
-            self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-            self.model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
-
-            # Device selection
-            if torch.cuda.is_available():
-                self.device = "cuda"
-                self.model = self.model.to("cuda")
-            elif hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
-                self.device = "mps"
-                self.model = self.model.to("mps")
-            else:
-                self.device = "cpu"
-
-            self.model.eval()
+            from core.model_registry import acquire_seq2seq, resolve_device
+
+            logger.info(f"Loading LLM: {self.model_name}")
+
+            # Shared via the model registry; released with this instance
+            self.device = resolve_device("auto")
+            handle = acquire_seq2seq(self.model_name, self.device, half_on_gpu=False).bind(self)
+            self.tokenizer, self.model = handle.model
+
             self._initialized = True
             logger.info(f"LLM ready on {self.device}")
             return True
@@ -84,27 +74,46 @@ class TrailerLLM:
             return False
 
     def generate(self, prompt: str, max_length: int = 150) -> str:
-        """Generate text from prompt."""
+        """Generate text from prompt (sampled, cached on disk)."""
         if not self._initialized:
             return ""
 
-        try:
-            inputs = self.tokenizer(prompt, return_tensors="pt", truncation=True, max_length=512)
-            inputs = {k: v.to(self.device) for k, v in inputs.items()}
-
-            with __import__('torch').no_grad():
-                outputs = self.model.generate(
-                    **inputs,
-                    max_new_tokens=max_length,
-                    temperature=0.7,
-                    do_sample=True,
-                    pad_token_id=self.tokenizer.eos_token_id
-                )
-
-            return self.tokenizer.decode(outputs[0], skip_special_tokens=True)
-        except Exception as e:
-            logger.warning(f"LLM generation error: {e}")
-            return ""
+        from analysis.llm_helper import generate_seq2seq_batch
+        from core.llm_cache import get_llm_cache, sampling_params
+
+        params = sampling_params(temperature=0.7, max_tokens=max_length)
+
+        def run() -> str:
+            try:
+                return generate_seq2seq_batch(self.tokenizer, self.model, [prompt], params, 1)[0]
+            except Exception as e:
+                logger.warning(f"LLM generation error: {e}")
+                return ""
+
+        return get_llm_cache().generate("transformers", self.model_name, prompt, params, run)
+
+    def generate_batch(self, prompts: List[str], max_length: int = 150) -> List[str]:
+        """Generate text for many prompts in padded batches (greedy, cached on disk)."""
+        if not self._initialized or not prompts:
+            return [""] * len(prompts)
+
+        from analysis.llm_helper import generate_seq2seq_batch
+        from config import get_config
+        from core.llm_cache import get_llm_cache, sampling_params
+
+        config = get_config().llm
+        batch_size = config.batch_size if config.enable_batching else 1
+        # Greedy: sampled batch outputs depend on batch composition
+        params = sampling_params(temperature=0, max_tokens=max_length)
+
+        def run(pending: List[str]) -> List[str]:
+            try:
+                return generate_seq2seq_batch(self.tokenizer, self.model, pending, params, batch_size)
+            except Exception as e:
+                logger.warning(f"LLM generation error: {e}")
+                return [""] * len(pending)
+
+        return get_llm_cache().generate_many("transformers", self.model_name, prompts, params, run)
 
     def rank_scenes_for_trailer(self, scenes: List[Dict], top_n: int = 20) -> List[int]:
         """Use LLM to rank best scenes for trailer."""
@@ -153,15 +162,19 @@ List the TOP 6 best numbers for trailer (comma-separated):"""
 
     def select_best_quote(self, dialogue: str) -> str:
         """Use LLM to pick the best trailer quote from dialogue."""
-        if not self._initialized or not dialogue or len(dialogue) < 20:
-            return dialogue
+        return self.select_best_quotes([dialogue])[0]
 
-        if len(dialogue) < 80:
-            return dialogue
+    def select_best_quotes(self, dialogues: List[str]) -> List[str]:
+        """Pick the best trailer quote for many dialogues in one batched pass."""
+        quotes = list(dialogues)
+        if not self._initialized:
+            return quotes
 
-        prompt = f"""Pick the SINGLE best line for a movie trailer from this dialogue:
+        # Short dialogues are already quote-sized
+        pending = [i for i, d in enumerate(dialogues) if d and len(d) >= 80]
+        prompts = [f"""Pick the SINGLE best line for a movie trailer from this dialogue:
 
-"{dialogue[:300]}"
+"{dialogues[i][:300]}"
 
 Best trailer lines:
 - Create curiosity (questions are gold)
@@ -169,19 +182,20 @@ Best trailer lines:
 - Do NOT reveal story/ending
 - Keep original language/dialect
 
-Best line:"""
+Best line:""" for i in pending]
 
-        result = self.generate(prompt, max_length=60)
+        for i, result in zip(pending, self.generate_batch(prompts, max_length=60)):
+            quotes[i] = dialogues[i][:100]
 
-        # Validate response
-        if result and 5 < len(result) < 120:
-            result = result.strip().strip('"').strip("'")
-            # Check it's not meta-response
-            meta_words = ['the best', 'i would', 'this line', 'the line', 'here is']
-            if not any(x in result.lower() for x in meta_words):
-                return result
+            # Validate response
+            if result and 5 < len(result) < 120:
+                result = result.strip().strip('"').strip("'")
+                # Check it's not meta-response
+                meta_words = ['the best', 'i would', 'this line', 'the line', 'here is']
+                if not any(x in result.lower() for x in meta_words):
+                    quotes[i] = result
 
-        return dialogue[:100]
+        return quotes
 
     def generate_trailer_tagline(self, style: str, genre: str, title: str) -> str:
         """Generate a tagline for the trailer."""
@@ -351,6 +365,8 @@ def build_scene_data(scene_result, dialogue_segments: List[Dict], use_llm: bool
                 dialogue_map[t] = []
             dialogue_map[t].append(seg["text"])
 
+    quote_scenes = []  # indices of scenes whose quote the LLM should pick
+
     for i, scene in enumerate(scene_result.scenes):
         start = scene.start_time
         end = scene.end_time
@@ -411,10 +427,10 @@ def build_scene_data(scene_result, dialogue_segments: List[Dict], use_llm: bool
         if 5 <= word_count <= 20:
             trailer_potential += 10
 
-        # Use LLM to pick best quote
+        # LLM picks the best quote below, batched across all scenes
         key_quote = dialogue_text
         if llm and llm._initialized and dialogue_text and len(dialogue_text) > 50:
-            key_quote = llm.select_best_quote(dialogue_text)
+            quote_scenes.append(len(scenes))
 
         # Determine scene type
         if position < 0.08 and not dialogue_text:
@@ -449,6 +465,12 @@ def build_scene_data(scene_result, dialogue_segments: List[Dict], use_llm: bool
             "dialect_confidence": dialect_conf
         })
 
+    # Use LLM to pick best quotes (one batched pass over all scenes)
+    if quote_scenes:
+        quotes = llm.select_best_quotes([scenes[idx]["dialogue"] for idx in quote_scenes])
+        for idx, quote in zip(quote_scenes, quotes):
+            scenes[idx]["key_quote"] = quote[:150] if quote else None
+
     # Use LLM to rank scenes
     if llm and llm._initialized:
         ranked_indices = llm.rank_scenes_for_trailer(scenes, top_n=30)
@@ -1,11 +1,13 @@
 """Subtitle file parsing (SRT, VTT, ASS)."""
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional, Union, Dict, Any
 from loguru import logger
 
+from core.interval_index import IntervalIndex
+
 try:
     import pysrt
     HAS_PYSRT = True
@@ -77,6 +79,7 @@ class ParsedSubtitles:
     format: str
     language: Optional[str]
     total_duration: float
+    _segment_index: Optional[IntervalIndex] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def word_count(self) -> int:
@@ -108,10 +111,8 @@ class ParsedSubtitles:
         Returns:
             Subtitle text or None
         """
-        for segment in self.segments:
-            if segment.start_time - tolerance <= timestamp <= segment.end_time + tolerance:
-                return segment.text
-        return None
+        segment = self._index().at(timestamp, tolerance)
+        return segment.text if segment else None
 
     def get_segments_in_range(
         self,
@@ -127,10 +128,13 @@ class ParsedSubtitles:
         Returns:
             List of segments in range
         """
-        return [
-            s for s in self.segments
-            if s.start_time < end and s.end_time > start
-        ]
+        return self._index().overlapping(start, end)
+
+    def _index(self) -> IntervalIndex:
+        """Segment index, built once (rebuilt only if the segment list is replaced)."""
+        if self._segment_index is None or not self._segment_index.is_built_from(self.segments):
+            self._segment_index = IntervalIndex(self.segments)
+        return self._segment_index
 
 
 class SubtitleParser:
@@ -85,10 +85,12 @@ from pathlib import Path
 
 from config.constants import (
     WHISPER_MODEL, USE_LLM, OLLAMA_MODEL,
+    ASR_CHUNKED, ASR_CHUNK_DURATION, ASR_PARALLEL,
     PROGRESS_DOWNLOAD, PROGRESS_LOAD_INPUTS, PROGRESS_SCENE_DETECTION,
     PROGRESS_AUDIO_ANALYSIS, PROGRESS_VISUAL_ANALYSIS, PROGRESS_CONTENT_UNDERSTANDING,
     PROGRESS_NARRATIVE_GENERATION, PROGRESS_TRAILER_ASSEMBLY, PROGRESS_UPLOAD,
-    PROGRESS_OUTPUT_GENERATION
+    PROGRESS_OUTPUT_GENERATION,
+    get_temp_dir
 )
 from typing import Dict, Any, Optional, List, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -110,12 +112,16 @@ from config import get_config
 from core.storage import StorageHandler
 from core.progress import ProgressReporter, ProcessingStatus, StepProgress, APIProgressReporter
 from core.parallel_processor import ParallelPipeline
+from core.artifact_cache import AnalysisCache, fingerprint_file
 from input.video_loader import VideoLoader
 from input.script_parser import ScriptParser
 from input.subtitle_parser import SubtitleParser
 from analysis.scene_detector import SceneDetector
 from analysis.indian_asr import IndianDialectASR, ASRResult
 from analysis.visual_analyzer import VisualAnalyzer
+from analysis.frame_stream import run_shared_analysis, use_shared_decode
+from analysis.pcm_audio import release_pcm
+from analysis.vad import vad_params
 from analysis.content_understanding import ContentAnalyzer
 from narrative.generator import NarrativeGenerator
 from narrative.professional_builder import ProfessionalNarrativeBuilder, build_professional_narratives
@@ -190,6 +196,9 @@ class ProductionTrailerProcessor:
         )
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Job-scoped scratch space (decoded PCM audio); released after analysis
+        self.work_dir = get_temp_dir() / self.project_id
+
         # Track input sources
         self.input_sources = {}
 
@@ -732,7 +741,8 @@ class ProductionTrailerProcessor:
                 asr = IndianDialectASR(
                     model_name="auto",
                     device=None,
-                    enable_dialect_detection=True
+                    enable_dialect_detection=True,
+                    work_dir=self.work_dir
                 )
                 result = asr.transcribe(video_path, subtitle_path=subtitle_path)
                 report_progress("audio", f"Complete - {len(result.segments)} segments from subtitles", 100)
@@ -748,7 +758,8 @@ class ProductionTrailerProcessor:
                     asr = IndianDialectASR(
                         model_name=f"whisper_{whisper_size}",
                         device=None,
-                        enable_dialect_detection=True
+                        enable_dialect_detection=True,
+                        work_dir=self.work_dir
                     )
                     report_progress("audio", f"Transcribing with Whisper {whisper_size} (this takes time)...", 10)
                     result = asr.transcribe(video_path, subtitle_path=None)
@@ -797,7 +808,9 @@ class ProductionTrailerProcessor:
             report_progress("visual", "Starting visual analysis...", 0)
             analyzer = VisualAnalyzer(
                 device=self.config.visual.device,
-                frames_per_scene=self.config.visual.frames_per_scene
+                frames_per_scene=self.config.visual.frames_per_scene,
+                parallel_frames=self.config.visual.parallel_frames,
+                batch_size=self.config.visual.batch_size
             )
 
             scenes = []
@@ -809,17 +822,86 @@ class ProductionTrailerProcessor:
             report_progress("visual", f"Complete - {len(result.scenes) if result else 0} scenes analyzed", 100)
             return result
 
+        # Scene + visual analysis from one shared decode pass
+        def run_shared_scene_visual_analysis():
+            logger.info("Running shared-decode scene + visual analysis...")
+            report_progress("scene", "Starting single-pass decode...", 0)
+            report_progress("visual", "Waiting for decoded frames...", 0)
+            detector = SceneDetector()
+            analyzer = VisualAnalyzer(
+                device=self.config.visual.device,
+                frames_per_scene=self.config.visual.frames_per_scene,
+                parallel_frames=self.config.visual.parallel_frames,
+                batch_size=self.config.visual.batch_size
+            )
+
+            def decode_progress(progress: float):
+                pct = progress * 100
+                report_progress("scene", f"Decoding... {pct:.0f}%", pct)
+                report_progress("visual", f"Analyzing frames... {pct:.0f}%", pct)
+
+            scene_res, visual_res = run_shared_analysis(
+                video_path, detector, analyzer,
+                analysis_width=self.config.visual.analysis_width,
+                max_buffered_frames=self.config.visual.max_buffered_frames,
+                progress_callback=decode_progress
+            )
+            report_progress("scene", f"Complete - {scene_res.scene_count} scenes", 100)
+            report_progress("visual", f"Complete - {len(visual_res.scenes)} scenes analyzed", 100)
+            return scene_res, visual_res
+
+        # Shared single-pass decode unless the scene detector's own mode wins
+        # (see SHARED_DECODE_PRECEDENCE)
+        shared_decode = use_shared_decode(video_path, SceneDetector())
+
+        # Persistent artifact cache - lets the approved-narrative phase and
+        # re-generations with other styles skip straight to narrative generation
+        cache = AnalysisCache()
+        cache_keys = self._analysis_cache_keys(cache, video_path, subtitle_path, shared_decode)
+
+        def cached(artifact: str, tasks: Tuple[str, ...], compute, should_store=None):
+            """Wrap a stage so it is served from / stored in the analysis cache."""
+            if artifact not in cache_keys:
+                return compute
+
+            def loaded():
+                for task in tasks:
+                    report_progress(task, "Loaded from analysis cache", 100)
+
+            def run(*args, **kwargs):
+                return cache.get_or_compute(
+                    cache_keys[artifact],
+                    lambda: compute(*args, **kwargs),
+                    should_store=should_store,
+                    on_hit=loaded
+                )
+
+            return run
+
         # Add stages to pipeline
-        pipeline.add_stage("scene_detection", run_scene_detection)
-        pipeline.add_stage("audio_analysis", run_audio_analysis)
-        pipeline.add_stage(
-            "visual_analysis",
-            run_visual_analysis,
-            depends_on=["scene_detection"]
-        )
+        pipeline.add_stage("audio_analysis", cached(
+            "asr", ("audio",), run_audio_analysis,
+            should_store=lambda r: r.model_used != "failed"
+        ))
+        if shared_decode:
+            pipeline.add_stage("scene_visual_analysis", cached(
+                "scene_visual", ("scene", "visual"), run_shared_scene_visual_analysis
+            ))
+        else:
+            pipeline.add_stage("scene_detection", cached(
+                "scenes", ("scene",), run_scene_detection
+            ))
+            pipeline.add_stage(
+                "visual_analysis",
+                cached("visual", ("visual",), run_visual_analysis),
+                depends_on=["scene_detection"]
+            )
 
-        # Execute pipeline
-        result = pipeline.execute()
+        # Execute pipeline; the decoded PCM is only needed during analysis
+        try:
+            result = pipeline.execute()
+        finally:
+            release_pcm(self.work_dir)
 
         parallel_time = time.time() - parallel_start
         logger.info(
@@ -828,12 +910,72 @@ class ProductionTrailerProcessor:
         )
 
         # Extract results
-        scene_result = result.stages.get("scene_detection", {}).get("result")
         audio_result = result.stages.get("audio_analysis", {}).get("result")
-        visual_result = result.stages.get("visual_analysis", {}).get("result")
+        if shared_decode:
+            shared_result = result.stages.get("scene_visual_analysis", {}).get("result")
+            scene_result, visual_result = shared_result if shared_result else (None, None)
+        else:
+            scene_result = result.stages.get("scene_detection", {}).get("result")
+            visual_result = result.stages.get("visual_analysis", {}).get("result")
 
         return scene_result, audio_result, visual_result
 
+    def _analysis_cache_keys(
+        self,
+        cache: AnalysisCache,
+        video_path: Path,
+        subtitle_path: Optional[Path],
+        shared_decode: bool
+    ) -> Dict[str, str]:
+        """Build analysis cache keys from the video fingerprint and model/parameter versions.
+
+        Args:
+            cache: Analysis cache
+            video_path: Path to video
+            subtitle_path: Optional subtitle file (part of the ASR key)
+            shared_decode: Whether scenes/visuals come from the shared decode pass
+
+        Returns:
+            Dict of artifact name -> cache key (empty when caching is disabled)
+        """
+        if not cache.enabled:
+            return {}
+
+        try:
+            video_fp = fingerprint_file(video_path)
+            subtitle_fp = fingerprint_file(subtitle_path) if subtitle_path and subtitle_path.exists() else None
+        except OSError as e:
+            logger.warning(f"Analysis cache disabled for this run: {e}")
+            return {}
+
+        visual = self.config.visual
+        scene_params = {
+            "detector": SceneDetector().params,
+            "shared_decode": shared_decode,
+            "analysis_width": visual.analysis_width if shared_decode else None,
+            "max_buffered_frames": visual.max_buffered_frames if shared_decode else None,
+        }
+        visual_params = {
+            **scene_params,
+            "model": VisualAnalyzer.DEFAULT_MODEL,
+            "frames_per_scene": visual.frames_per_scene,
+        }
+        asr_params = {
+            "whisper_model": WHISPER_MODEL,
+            "subtitles": subtitle_fp,
+            "chunked": ASR_CHUNKED,
+            "parallel": ASR_PARALLEL,
+            "chunk_duration": ASR_CHUNK_DURATION if ASR_CHUNKED or ASR_PARALLEL else None,
+            "vad": vad_params() if ASR_CHUNKED or ASR_PARALLEL else None,
+        }
+
+        return {
+            "scenes": cache.make_key(video_fp, "scenes", scene_params),
+            "visual": cache.make_key(video_fp, "visual", visual_params),
+            "scene_visual": cache.make_key(video_fp, "scene_visual", visual_params),
+            "asr": cache.make_key(video_fp, "asr", asr_params),
+        }
+
     def _analyze_content(
         self,
         scene_result,
@@ -17,19 +17,19 @@ Trailer Variants:
 """
 
 import json
+import importlib.util
 import re
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple
 from enum import Enum
 from loguru import logger
 
-# Import LLM backend
-try:
-    from transformers import pipeline
-    import torch
-    HF_AVAILABLE = True
-except ImportError:
-    HF_AVAILABLE = False
+from core.llm_cache import get_llm_cache, hf_generate_kwargs, ollama_options, sampling_params
+from core.model_registry import acquire_text_generation
+from core.ollama_client import ollama_generate
+
+# LLM backend (models are loaded through the model registry)
+HF_AVAILABLE = importlib.util.find_spec("transformers") is not None
 
 try:
     import ollama
@@ -151,29 +151,15 @@ class CharacterTrailerBuilder:
         logger.info(f"LLM available: {self.llm_available}")
 
     def _init_hf_model(self) -> bool:
-        """Initialize HuggingFace model."""
+        """Initialize HuggingFace model (shared via the model registry)."""
         if not HF_AVAILABLE:
             return False
         try:
             logger.info(f"Loading HuggingFace model: {self.hf_model_name}")
 
-            # Determine device
-            if torch.cuda.is_available():
-                device = "cuda"
-            elif torch.backends.mps.is_available():
-                device = "mps"
-            else:
-                device = "cpu"
-
-            logger.info(f"Using device: {device}")
-
-            self.hf_pipeline = pipeline(
-                "text-generation",
-                model=self.hf_model_name,
-                device_map="auto" if device != "cpu" else None,
-                torch_dtype=torch.float16 if device != "cpu" else torch.float32,
-                trust_remote_code=True,
-            )
+            # Released when this builder is garbage collected
+            handle = acquire_text_generation(self.hf_model_name).bind(self)
+            self.hf_pipeline = handle.model
             logger.info("HuggingFace model loaded!")
             return True
         except Exception as e:
@@ -182,49 +168,60 @@ class CharacterTrailerBuilder:
             try:
                 logger.info("Trying TinyLlama fallback...")
                 self.hf_model_name = self.HF_MODELS["tinyllama"]
-                self.hf_pipeline = pipeline(
-                    "text-generation",
-                    model=self.hf_model_name,
-                    torch_dtype=torch.float32,
-                    trust_remote_code=True,
-                )
+                handle = acquire_text_generation(self.hf_model_name, device="cpu").bind(self)
+                self.hf_pipeline = handle.model
                 return True
             except:
                 return False
 
     def _generate(self, prompt: str, max_tokens: int = 2000) -> str:
-        """Generate text using available LLM."""
+        """Generate text using available LLM (responses cached on disk)."""
+        cache = get_llm_cache()
+
         if self.use_ollama:
-            try:
-                response = ollama.generate(
-                    model="qwen2.5:7b",
-                    prompt=prompt,
-                    options={"temperature": 0.3, "num_predict": max_tokens}
-                )
-                return response.get('response', '')
-            except Exception as e:
-                logger.error(f"Ollama generation failed: {e}")
+            params = sampling_params(0.3, max_tokens)
+            response = cache.generate(
+                "ollama", "qwen2.5:7b", prompt, params,
+                lambda: self._generate_ollama(prompt, params)
+            )
+            if response:
+                return response
 
         if self.use_hf and self.hf_pipeline:
-            try:
-                messages = [{"role": "user", "content": prompt}]
-                result = self.hf_pipeline(
-                    messages,
-                    max_new_tokens=min(max_tokens, 2048),
-                    do_sample=True,
-                    temperature=0.3,
-                    top_p=0.9,
-                    pad_token_id=self.hf_pipeline.tokenizer.eos_token_id,
-                )
-                generated = result[0]["generated_text"]
-                if isinstance(generated, list):
-                    return generated[-1]["content"] if generated else ""
-                return generated
-            except Exception as e:
-                logger.error(f"HuggingFace generation failed: {e}")
+            params = sampling_params(0.3, min(max_tokens, 2048), top_p=0.9)
+            return cache.generate(
+                "transformers", self.hf_model_name, prompt, params,
+                lambda: self._generate_hf(prompt, params)
+            )
 
         return ""
 
+    def _generate_ollama(self, prompt: str, params: Dict) -> str:
+        """Generate using Ollama (pooled client with retries)."""
+        try:
+            return ollama_generate(prompt, "qwen2.5:7b", ollama_options(params))
+        except Exception as e:
+            logger.error(f"Ollama generation failed: {e}")
+            return ""
+
+    def _generate_hf(self, prompt: str, params: Dict) -> str:
+        """Generate using HuggingFace pipeline."""
+        try:
+            messages = [{"role": "user", "content": prompt}]
+            result = self.hf_pipeline(
+                messages,
+                max_new_tokens=params["max_tokens"],
+                pad_token_id=self.hf_pipeline.tokenizer.eos_token_id,
+                **hf_generate_kwargs(params)
+            )
+            generated = result[0]["generated_text"]
+            if isinstance(generated, list):
+                return generated[-1]["content"] if generated else ""
+            return generated
+        except Exception as e:
+            logger.error(f"HuggingFace generation failed: {e}")
+            return ""
+
     def build_trailers(
         self,
         dialogues: List[Dict],
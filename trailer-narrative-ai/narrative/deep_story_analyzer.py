@@ -28,6 +28,7 @@ LLM Options (in order of preference):
 2. HuggingFace Transformers - Auto-downloads, no external server needed
 """
 
+import importlib.util
 import json
 import re
 import time
@@ -37,6 +38,10 @@ from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 from loguru import logger
 
+from core.llm_cache import get_llm_cache, hf_generate_kwargs, ollama_options, sampling_params
+from core.model_registry import acquire_text_generation
+from core.ollama_client import ollama_generate
+
 # Try Ollama first
 OLLAMA_AVAILABLE = False
 try:
@@ -52,14 +57,12 @@ except ImportError:
     logger.info("Ollama not installed, will use HuggingFace")
 
 # HuggingFace Transformers (fallback - always available via pip)
-HF_AVAILABLE = False
+# Models are loaded through the model registry; only check availability here
 HF_PIPELINE = None
-try:
-    from transformers import pipeline, AutoTokenizer, AutoModelForCausalLM
-    import torch
-    HF_AVAILABLE = True
+HF_AVAILABLE = importlib.util.find_spec("transformers") is not None
+if HF_AVAILABLE:
     logger.info("HuggingFace Transformers available")
-except ImportError:
+else:
     logger.warning("HuggingFace Transformers not installed. Run: pip install transformers torch")
 
 
@@ -230,7 +233,7 @@ class DeepStoryAnalyzer:
             return False
 
     def _init_hf_model(self) -> bool:
-        """Initialize HuggingFace model (auto-downloads)."""
+        """Initialize HuggingFace model (auto-downloads, shared via the model registry)."""
         if not HF_AVAILABLE:
             return False
 
@@ -238,25 +241,9 @@ class DeepStoryAnalyzer:
             logger.info(f"Loading HuggingFace model: {self.hf_model_name}")
             logger.info("This will auto-download on first run (~2-7GB depending on model)...")
 
-            # Determine device
-            if torch.cuda.is_available():
-                device = "cuda"
-                logger.info("Using CUDA GPU")
-            elif torch.backends.mps.is_available():
-                device = "mps"
-                logger.info("Using Apple Silicon GPU")
-            else:
-                device = "cpu"
-                logger.info("Using CPU (slower)")
-
-            # Load model with appropriate settings
-            self.hf_pipeline = pipeline(
-                "text-generation",
-                model=self.hf_model_name,
-                device_map="auto" if device != "cpu" else None,
-                torch_dtype=torch.float16 if device != "cpu" else torch.float32,
-                trust_remote_code=True,
-            )
+            # Released when this analyzer is garbage collected
+            handle = acquire_text_generation(self.hf_model_name).bind(self)
+            self.hf_pipeline = handle.model
 
             logger.info(f"HuggingFace model loaded successfully!")
             return True
@@ -269,12 +256,8 @@ class DeepStoryAnalyzer:
                 logger.info("Trying smaller fallback model: TinyLlama...")
                 try:
                     self.hf_model_name = self.HF_MODELS["tinyllama"]
-                    self.hf_pipeline = pipeline(
-                        "text-generation",
-                        model=self.hf_model_name,
-                        torch_dtype=torch.float32,
-                        trust_remote_code=True,
-                    )
+                    handle = acquire_text_generation(self.hf_model_name, device="cpu").bind(self)
+                    self.hf_pipeline = handle.model
                     logger.info("TinyLlama loaded as fallback")
                     return True
                 except Exception as e2:
@@ -283,28 +266,33 @@ class DeepStoryAnalyzer:
             return False
 
     def _generate(self, prompt: str, max_tokens: int = 2000) -> str:
-        """Generate text using available LLM backend."""
+        """Generate text using available LLM backend (responses cached on disk)."""
         if self.use_ollama and OLLAMA_AVAILABLE:
-            return self._generate_ollama(prompt, max_tokens)
+            params = sampling_params(self.model_config.get("temperature", 0.4), max_tokens)
+            return get_llm_cache().generate(
+                "ollama", self.model, prompt, params,
+                lambda: self._generate_ollama(prompt, params)
+            )
         elif self.use_hf and self.hf_pipeline:
-            return self._generate_hf(prompt, max_tokens)
+            params = sampling_params(0.3, min(max_tokens, 2048), top_p=0.9)
+            return get_llm_cache().generate(
+                "transformers", self.hf_model_name, prompt, params,
+                lambda: self._generate_hf(prompt, params)
+            )
         else:
             return ""
 
-    def _generate_ollama(self, prompt: str, max_tokens: int) -> str:
-        """Generate using Ollama."""
+    def _generate_ollama(self, prompt: str, params: Dict[str, Any]) -> str:
+        """Generate using Ollama (pooled client with retries)."""
         try:
-            response = ollama.generate(
-                model=self.model,
-                prompt=prompt,
-                options={**self.model_config, "num_predict": max_tokens}
+            return ollama_generate(
+                prompt, self.model, {**self.model_config, **ollama_options(params)}
             )
-            return response.get('response', '')
         except Exception as e:
             logger.error(f"Ollama generation failed: {e}")
             return ""
 
-    def _generate_hf(self, prompt: str, max_tokens: int) -> str:
+    def _generate_hf(self, prompt: str, params: Dict[str, Any]) -> str:
         """Generate using HuggingFace pipeline."""
         try:
             # Format prompt for chat model
@@ -312,11 +300,9 @@ class DeepStoryAnalyzer:
 
             result = self.hf_pipeline(
                 messages,
-                max_new_tokens=min(max_tokens, 2048),
-                do_sample=True,
-                temperature=0.3,
-                top_p=0.9,
+                max_new_tokens=params["max_tokens"],
                 pad_token_id=self.hf_pipeline.tokenizer.eos_token_id,
+                **hf_generate_kwargs(params)
             )
 
             # Extract generated text
@@ -24,6 +24,9 @@ from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 from loguru import logger
 
+from core.llm_cache import get_llm_cache, ollama_options, sampling_params
+from core.ollama_client import JsonObjectStop, ollama_generate
+
 try:
     import ollama
     OLLAMA_AVAILABLE = True
@@ -178,6 +181,24 @@ class DialogueNarrativeEngine:
             logger.warning(f"Ollama not available: {e}")
             return False
 
+    def _generate(self, prompt: str, temperature: float, max_tokens: int) -> str:
+        """Generate a JSON answer with Ollama (responses cached on disk).
+
+        Streaming stops as soon as the first JSON object is complete, so the
+        model does not spend tokens on trailing commentary.
+
+        Raises:
+            OllamaError: If generation failed; failures are not cached
+        """
+        params = {**sampling_params(temperature, max_tokens), "early_stop": "json"}
+
+        def run():
+            return ollama_generate(
+                prompt, self.model, ollama_options(params), stop_when=JsonObjectStop
+            )
+
+        return get_llm_cache().generate("ollama", self.model, prompt, params, run)
+
     def build_narrative(
         self,
         dialogues: List[Dict[str, Any]],
@@ -454,14 +475,8 @@ Identify 2-4 main characters. Focus on:
 OUTPUT JSON ONLY:"""
 
         try:
-            response = ollama.generate(
-                model=self.model,
-                prompt=prompt,
-                options={"temperature": 0.3, "num_predict": 1024}
-            )
-
             # Parse JSON from response
-            response_text = response.get('response', '{}')
+            response_text = self._generate(prompt, temperature=0.3, max_tokens=1024) or '{}'
 
             # Extract JSON from response (handle markdown code blocks)
             json_match = re.search(r'\{[\s\S]*\}', response_text)
@@ -622,13 +637,7 @@ OUTPUT FORMAT (JSON):
 OUTPUT JSON ONLY:"""
 
         try:
-            response = ollama.generate(
-                model=self.model,
-                prompt=prompt,
-                options={"temperature": 0.4, "num_predict": 2048}
-            )
-
-            response_text = response.get('response', '{}')
+            response_text = self._generate(prompt, temperature=0.4, max_tokens=2048) or '{}'
 
             # Extract JSON from response
             json_match = re.search(r'\{[\s\S]*\}', response_text)
@@ -26,6 +26,7 @@ Generates multiple variants based on content analysis:
 - Emotional: Relationship and drama focus
 """
 
+import itertools
 import re
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Tuple
@@ -33,6 +34,7 @@ from enum import Enum
 from loguru import logger
 
 from analysis.llm_story_analyzer import StoryAnalysis, PlotBeat, CharacterRole
+from core.scene_index import SceneIndex
 
 
 class NarrativePhase(Enum):
@@ -264,6 +266,9 @@ class ProfessionalNarrativeBuilder:
         # Log input stats
         logger.info(f"Building variants: {len(scenes)} scenes, {len(segments)} dialogue segments, {video_duration:.0f}s duration")
 
+        # One index for every variant (each variant resets its used mask)
+        scene_index = self._build_scene_index(scenes)
+
         # Get styles to build
         styles_to_build = story_analysis.recommended_variants if story_analysis.recommended_variants else ["dramatic"]
 
@@ -276,7 +281,8 @@ class ProfessionalNarrativeBuilder:
                     story_analysis,
                     scenes,
                     segments,
-                    video_duration
+                    video_duration,
+                    scene_index=scene_index
                 )
                 if variant:
                     variants.append(variant)
@@ -294,7 +300,8 @@ class ProfessionalNarrativeBuilder:
                     story_analysis,
                     scenes,
                     segments,
-                    video_duration
+                    video_duration,
+                    scene_index=scene_index
                 )
                 if variant:
                     variants.append(variant)
@@ -362,9 +369,13 @@ class ProfessionalNarrativeBuilder:
         story: StoryAnalysis,
         scenes: List[Dict],
         segments: List[Dict],
-        video_duration: float
+        video_duration: float,
+        scene_index: Optional[SceneIndex] = None
     ) -> Optional[TrailerVariant]:
         """Build a single trailer variant with proper dialogue-scene alignment."""
+        if scene_index is None:
+            scene_index = self._build_scene_index(scenes)
+        scene_index.clear_used()
 
         # Get timing configuration for this style
         timings = PHASE_TIMINGS.get(style, PHASE_TIMINGS["dramatic"])
@@ -374,7 +385,6 @@ class ProfessionalNarrativeBuilder:
 
         # Track used dialogues and scenes to avoid repetition
         used_dialogues = set()
-        used_scenes = set()
 
         beats = []
 
@@ -387,17 +397,16 @@ class ProfessionalNarrativeBuilder:
                 config=phase_config,
                 style=style,
                 story=story,
-                scenes=scenes,
+                scene_index=scene_index,
                 segments=segments,
                 dialogue_by_time=dialogue_by_time,
                 used_dialogues=used_dialogues,
-                used_scenes=used_scenes,
                 video_duration=video_duration
             )
 
             if beat:
                 beats.append(beat)
-                used_scenes.add(beat.scene_id)
+                scene_index.mark_used(beat.scene_id)
                 if beat.dialogue:
                     used_dialogues.add(beat.dialogue[:50])
 
@@ -448,11 +457,10 @@ class ProfessionalNarrativeBuilder:
         config: Dict,
         style: str,
         story: StoryAnalysis,
-        scenes: List[Dict],
+        scene_index: SceneIndex,
         segments: List[Dict],
         dialogue_by_time: Dict,
         used_dialogues: set,
-        used_scenes: set,
         video_duration: float
     ) -> Optional[TrailerBeat]:
         """Build a single beat for a narrative phase.
@@ -481,12 +489,12 @@ class ProfessionalNarrativeBuilder:
                 )
 
             if dialogue_time:
-                scene = self._find_scene_at_time(scenes, dialogue_time, used_scenes)
+                scene = self._find_scene_at_time(scene_index, dialogue_time)
 
             if not scene:
                 # Fallback: early establishing scene
                 scene = self._find_scene_by_position(
-                    scenes, 0, 0.15, used_scenes, prefer_type="establishing"
+                    scene_index, 0, 0.15, prefer_type="establishing"
                 )
 
         elif phase == NarrativePhase.CHARACTER_INTRO:
@@ -507,17 +515,17 @@ class ProfessionalNarrativeBuilder:
                 )
 
             if dialogue_time:
-                scene = self._find_scene_at_time(scenes, dialogue_time, used_scenes)
+                scene = self._find_scene_at_time(scene_index, dialogue_time)
 
             if not scene:
                 scene = self._find_scene_by_position(
-                    scenes, 0.05, 0.25, used_scenes, prefer_type="dialogue"
+                    scene_index, 0.05, 0.25, prefer_type="dialogue"
                 )
 
         elif phase == NarrativePhase.WORLD_SETUP:
             # World Setup: Establishing shots, minimal dialogue
             scene = self._find_scene_by_position(
-                scenes, 0, 0.2, used_scenes, prefer_type="establishing"
+                scene_index, 0, 0.2, prefer_type="establishing"
             )
 
         elif phase == NarrativePhase.STORY_HOOK:
@@ -528,11 +536,11 @@ class ProfessionalNarrativeBuilder:
             )
 
             if dialogue_time:
-                scene = self._find_scene_at_time(scenes, dialogue_time, used_scenes)
+                scene = self._find_scene_at_time(scene_index, dialogue_time)
 
             if not scene:
                 scene = self._find_scene_by_position(
-                    scenes, 0.15, 0.4, used_scenes, prefer_type="dialogue"
+                    scene_index, 0.15, 0.4, prefer_type="dialogue"
                 )
 
         elif phase == NarrativePhase.SUSPENSE_BUILD:
@@ -551,11 +559,11 @@ class ProfessionalNarrativeBuilder:
                 )
 
             if dialogue_time:
-                scene = self._find_scene_at_time(scenes, dialogue_time, used_scenes)
+                scene = self._find_scene_at_time(scene_index, dialogue_time)
 
             if not scene:
                 scene = self._find_scene_by_position(
-                    scenes, 0.3, 0.6, used_scenes,
+                    scene_index, 0.3, 0.6,
                     prefer_type="action" if style == "action" else "emotional"
                 )
 
@@ -576,17 +584,17 @@ class ProfessionalNarrativeBuilder:
                 )
 
             if dialogue_time:
-                scene = self._find_scene_at_time(scenes, dialogue_time, used_scenes)
+                scene = self._find_scene_at_time(scene_index, dialogue_time)
 
             if not scene:
                 scene = self._find_scene_by_position(
-                    scenes, 0.4, 0.7, used_scenes, prefer_type="action"
+                    scene_index, 0.4, 0.7, prefer_type="action"
                 )
 
         elif phase == NarrativePhase.CLIMAX_TEASE:
             # Climax Tease: High intensity, quick cuts
             scene = self._find_scene_by_position(
-                scenes, 0.5, 0.8, used_scenes,
+                scene_index, 0.5, 0.8,
                 prefer_type="action" if style in ["action", "thriller"] else "emotional"
             )
 
@@ -639,28 +647,24 @@ class ProfessionalNarrativeBuilder:
                 logger.warning("No cliffhanger dialogue found, using generic question")
 
             if dialogue_time:
-                scene = self._find_scene_at_time(scenes, dialogue_time, used_scenes)
+                scene = self._find_scene_at_time(scene_index, dialogue_time)
 
             if not scene:
                 scene = self._find_scene_by_position(
-                    scenes, 0.5, 0.8, used_scenes, prefer_type="dialogue"
+                    scene_index, 0.5, 0.8, prefer_type="dialogue"
                 )
 
         elif phase == NarrativePhase.TITLE_CARD:
             # Title Card: Use any establishing scene
             scene = self._find_scene_by_position(
-                scenes, 0, 0.3, used_scenes, prefer_type="establishing"
+                scene_index, 0, 0.3, prefer_type="establishing"
             )
 
         # === BUILD THE BEAT ===
 
         if not scene:
             # Last resort: find any unused scene
-            for s in scenes:
-                scene_id = s.get("scene_id", s.get("id", ""))
-                if scene_id not in used_scenes:
-                    scene = s
-                    break
+            scene = next(scene_index.unused(), None)
 
         if not scene:
             return None
@@ -749,69 +753,48 @@ class ProfessionalNarrativeBuilder:
 
         return None
 
+    def _build_scene_index(self, scenes: List[Dict]) -> SceneIndex:
+        """Index scenes for the beat lookups (built once per run)."""
+        return SceneIndex(
+            scenes,
+            duration=max((s.get("end_time", 0) for s in scenes), default=0),
+            end=lambda s: s.get("end_time", s.get("start_time", 0) + 5)
+        )
+
     def _find_scene_at_time(
         self,
-        scenes: List[Dict],
-        target_time: float,
-        used: set
+        scene_index: SceneIndex,
+        target_time: float
     ) -> Optional[Dict]:
-        """Find the scene that contains the target timestamp."""
+        """Find the unused scene that contains the target timestamp."""
         if target_time is None:
             return None
 
-        # First try to find exact match (dialogue is within scene)
-        for scene in scenes:
-            scene_id = scene.get("scene_id", scene.get("id", ""))
-            if scene_id in used:
-                continue
-
-            start = scene.get("start_time", 0)
-            end = scene.get("end_time", start + 5)
-
-            if start <= target_time <= end:
-                return scene
-
-        # If no exact match, find closest unused scene
-        best_scene = None
-        best_diff = float('inf')
-
-        for scene in scenes:
-            scene_id = scene.get("scene_id", scene.get("id", ""))
-            if scene_id in used:
-                continue
-
-            start = scene.get("start_time", 0)
-            diff = abs(start - target_time)
-
-            if diff < best_diff:
-                best_diff = diff
-                best_scene = scene
-
-        return best_scene
+        # First try to find exact match (dialogue is within scene), else the
+        # closest unused scene
+        return scene_index.covering(target_time) or scene_index.nearest(target_time)
 
     def _find_scene_by_position(
         self,
-        scenes: List[Dict],
+        scene_index: SceneIndex,
         min_pos: float,
         max_pos: float,
-        used: set,
         prefer_type: str = None,
         allow_reuse: bool = False
     ) -> Optional[Dict]:
         """Find scene by position in video.
 
         Args:
-            scenes: List of scene dictionaries
+            scene_index: Indexed scenes (used mask marks scenes already in the variant)
             min_pos: Minimum position (0-1)
             max_pos: Maximum position (0-1)
-            used: Set of already used scene IDs
             prefer_type: Preferred scene type
             allow_reuse: If True, allow reusing scenes when none available
 
         Returns:
             Scene dictionary or None
         """
-        if not scenes:
+        if not len(scene_index):
             # No scenes at all - create a dummy scene
             logger.warning("No scenes available, creating placeholder")
             return {
@@ -822,50 +805,32 @@ class ProfessionalNarrativeBuilder:
                 "duration": 10
             }
 
-        video_duration = max(s.get("end_time", 0) for s in scenes)
-        if video_duration == 0:
-            video_duration = 1
-
-        candidates = []
-
-        # First pass: find unused scenes in position range
-        for scene in scenes:
-            scene_id = scene.get("scene_id", scene.get("id", ""))
-            if scene_id in used:
-                continue
-
-            start = scene.get("start_time", 0)
-            pos = start / video_duration
-
-            if min_pos <= pos <= max_pos:
-                candidates.append(scene)
+        # First pass: unused scenes in position range
+        candidates = scene_index.in_position_range(min_pos, max_pos)
+        first = next(candidates, None)
 
         # Second pass: expand to any unused scene
-        if not candidates:
-            for scene in scenes:
-                scene_id = scene.get("scene_id", scene.get("id", ""))
-                if scene_id not in used:
-                    candidates.append(scene)
+        if first is None:
+            candidates = scene_index.unused()
+            first = next(candidates, None)
 
         # Third pass: if very few scenes, allow reuse (for short videos)
-        if not candidates and (allow_reuse or len(scenes) < 15):
+        if first is None and (allow_reuse or len(scene_index) < 15):
             logger.warning("Few scenes available, allowing scene reuse")
-            for scene in scenes:
-                start = scene.get("start_time", 0)
-                pos = start / video_duration
-                if min_pos <= pos <= max_pos:
-                    candidates.append(scene)
+            candidates = scene_index.in_position_range(min_pos, max_pos, skip_used=False)
+            first = next(candidates, None)
 
             # If still none, use all scenes
-            if not candidates:
-                candidates = scenes.copy()
+            if first is None:
+                candidates = iter(scene_index.scenes)
+                first = next(candidates, None)
 
-        if not candidates:
+        if first is None:
             return None
 
         # Try to find preferred type
         if prefer_type:
-            for scene in candidates:
+            for scene in itertools.chain([first], candidates):
                 scene_type = scene.get("scene_type", "")
                 if prefer_type in str(scene_type):
                     return scene
@@ -879,7 +844,7 @@ class ProfessionalNarrativeBuilder:
                     return scene
 
         # Return first available
-        return candidates[0] if candidates else None
+        return first
 
     def _get_visual_type(self, phase: NarrativePhase, style: str, has_dialogue: bool) -> str:
         """Get visual type for phase."""
@@ -675,9 +675,11 @@ class StoryEngine:
 
             # Also include all scenes if we don't have enough candidates
             if len(candidates) < beat_config.max_scenes:
+                listed = {id(c) for c in candidates}
                 for cat, scenes in categorized.items():
                     for scene in scenes:
-                        if scene not in candidates:
+                        if id(scene) not in listed:
+                            listed.add(id(scene))
                             candidates.append(scene)
 
             # Remove already used scenes
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Benchmark: exhaustive vs coarse-to-fine scene detection.
+
+Runs SceneDetector on the same video in both modes and reports:
+1. Wall time and speedup
+2. Cut recall / precision of coarse-to-fine against the exhaustive cuts
+   (within a frame tolerance), plus the number of exact matches
+3. The fraction of frames decoded at native resolution by the refine pass
+
+Usage:
+    python scene_detection_benchmark.py movie.mp4
+    python scene_detection_benchmark.py movie.mp4 --threshold 27 --tolerance 2
+    python scene_detection_benchmark.py movie.mp4 --output bench.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Any, List
+
+from loguru import logger
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from analysis.scene_detector import SceneDetector
+
+
+def run_mode(detector: SceneDetector, video: Path, mode: str) -> Dict[str, Any]:
+    """Detect scenes in one mode and time it."""
+    start = time.perf_counter()
+    result = detector.detect(video, method="content", show_progress=False, mode=mode)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "mode": result.stats.get("mode", mode),
+        "seconds": elapsed,
+        "cuts": [scene.start_frame for scene in result.scenes[1:]],
+        "total_frames": result.total_frames,
+        "stats": result.stats
+    }
+
+
+def match_cuts(reference: List[int], candidate: List[int], tolerance: int) -> Dict[str, Any]:
+    """Greedily match candidate cuts to reference cuts within a tolerance."""
+    unmatched = list(reference)
+    matched = 0
+    exact = 0
+    for cut in candidate:
+        best = min(unmatched, key=lambda ref: abs(ref - cut), default=None)
+        if best is not None and abs(best - cut) <= tolerance:
+            unmatched.remove(best)
+            matched += 1
+            exact += best == cut
+
+    return {
+        "matched": matched,
+        "exact": exact,
+        "recall": matched / len(reference) if reference else 1.0,
+        "precision": matched / len(candidate) if candidate else 1.0,
+        "missed": unmatched
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Scene Detection Benchmark",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python scene_detection_benchmark.py movie.mp4
+  python scene_detection_benchmark.py movie.mp4 --threshold 27 --tolerance 2
+
+Coarse-to-fine is expected to reproduce the exhaustive cuts exactly; a
+non-zero tolerance shows how close any misses were.
+"""
+    )
+
+    parser.add_argument("video", type=Path, help="Path to video file")
+    parser.add_argument(
+        "--threshold", type=float, default=27.0,
+        help="ContentDetector threshold (default: 27)"
+    )
+    parser.add_argument(
+        "--min-scene-length", type=float, default=0.5,
+        dest="min_scene_length",
+        help="Minimum scene length in seconds (default: 0.5)"
+    )
+    parser.add_argument(
+        "--tolerance", type=int, default=1,
+        help="Frames a cut may be off and still count as found (default: 1)"
+    )
+    parser.add_argument(
+        "--output", type=Path,
+        help="Save results to JSON file"
+    )
+
+    args = parser.parse_args()
+
+    if not args.video.exists():
+        logger.error(f"Video not found: {args.video}")
+        sys.exit(1)
+
+    detector = SceneDetector(
+        content_threshold=args.threshold,
+        min_scene_length=args.min_scene_length
+    )
+
+    exhaustive = run_mode(detector, args.video, "exhaustive")
+    coarse = run_mode(detector, args.video, "coarse_to_fine")
+    accuracy = match_cuts(exhaustive["cuts"], coarse["cuts"], args.tolerance)
+
+    total_frames = max(1, coarse["total_frames"])
+    refined = coarse["stats"].get("decoded_frames", total_frames)
+
+    print("=" * 70)
+    print(f"SCENE DETECTION BENCHMARK: {args.video.name}")
+    print("=" * 70)
+    print(f"Exhaustive:      {exhaustive['seconds']:8.2f}s  {len(exhaustive['cuts'])} cuts")
+    print(f"Coarse-to-fine:  {coarse['seconds']:8.2f}s  {len(coarse['cuts'])} cuts  (ran as: {coarse['mode']})")
+    print(f"Speedup:         {exhaustive['seconds'] / max(coarse['seconds'], 1e-9):8.2f}x")
+    print(f"Refined frames:  {refined}/{total_frames} ({refined / total_frames:.1%})")
+    print(f"Recall:          {accuracy['recall']:8.1%}  (tolerance {args.tolerance} frames)")
+    print(f"Precision:       {accuracy['precision']:8.1%}")
+    print(f"Exact matches:   {accuracy['exact']}/{len(exhaustive['cuts'])}")
+    if accuracy["missed"]:
+        print(f"Missed cuts:     {accuracy['missed'][:20]}")
+    print("=" * 70)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "video": str(args.video),
+                "exhaustive": exhaustive,
+                "coarse_to_fine": coarse,
+                "accuracy": accuracy
+            }, f, indent=2)
+        print(f"Results saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
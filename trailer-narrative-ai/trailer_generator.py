@@ -26,6 +26,8 @@ from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from loguru import logger
 
+from core.interval_index import IntervalIndex
+
 # Configure logging
 logger.remove()
 logger.add(sys.stderr, format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{message}</cyan>", level="INFO")
@@ -224,6 +226,7 @@ class AudioTranscriber:
 
         from transformers import pipeline
         import torch
+        from core.model_registry import get_model_registry
 
         model_name = f"openai/whisper-{self.model_size}"
         logger.info(f"Loading {model_name}...")
@@ -240,12 +243,19 @@ class AudioTranscriber:
 
         logger.info(f"Using device: {device}")
 
-        self.pipeline = pipeline(
-            "automatic-speech-recognition",
-            model=model_name,
-            torch_dtype=dtype,
-            device=device if device != "cpu" else -1,
-        )
+        # Shared via the model registry; released with this transcriber
+        handle = get_model_registry().acquire(
+            "automatic-speech-recognition", model_name,
+            lambda: pipeline(
+                "automatic-speech-recognition",
+                model=model_name,
+                torch_dtype=dtype,
+                device=device if device != "cpu" else -1,
+            ),
+            device=device,
+            dtype=str(dtype).replace("torch.", "")
+        ).bind(self)
+        self.pipeline = handle.model
 
         logger.info("Whisper model ready")
 
@@ -398,11 +408,9 @@ class ContentAnalyzer:
         logger.info("Analyzing scene content...")
 
         # Map dialogues to scenes
+        dialogue_index = IntervalIndex(dialogues)
         for scene in scenes:
-            scene_dialogues = [
-                d for d in dialogues
-                if d.start_time >= scene.start_time and d.start_time < scene.end_time
-            ]
+            scene_dialogues = dialogue_index.starting_in(scene.start_time, scene.end_time)
 
             if scene_dialogues:
                 # Combine dialogue text